@@ -0,0 +1,340 @@
+"""
+파서/포맷터 마이크로 벤치마크
+
+fixtures/의 목록 페이지로 파서 백엔드별 처리량(페이지/초, 기사/초)을,
+기사 10/100/1,000개로 메시지 포맷팅 시간을, 제목 1만/10만 개로 같은 기사
+묶음(MinHash/LSH) 시간을 측정합니다. 항목마다
+tracemalloc으로 메모리 블록 할당 수와 최대 사용량도 기록합니다.
+
+결과는 baseline.json과 비교하여 시간 또는 할당이 임계값 이상 늘어난
+항목이 있으면 종료 코드 1로 끝납니다. 시간은 측정 사이사이에 실행한
+기준 작업 시간에 대한 비율로 비교하므로 기계 속도나 부하 변화의 영향을
+덜 받습니다. 수십 µs짜리 항목은 비율만으로는 잡음이 크므로, 늘어난 시간이
+최소 증가량(기본 50µs)보다 작으면 회귀로 보지 않습니다.
+
+사용법:
+    python benchmarks/bench.py                  # 기준 결과와 비교
+    python benchmarks/bench.py --save           # 기준 결과 갱신
+    python benchmarks/bench.py --threshold 0.5  # 허용 증가율 (기본 30%)
+    python benchmarks/bench.py --min-delta 100  # 시간 회귀로 볼 최소 증가량 (µs, 기본 50)
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BENCH_DIR = Path(__file__).parent
+FIXTURE_DIR = BENCH_DIR / 'fixtures'
+BASELINE_PATH = BENCH_DIR / 'baseline.json'
+
+sys.path.insert(0, str(BENCH_DIR.parent / 'src'))
+
+from clustering import StoryClusterer  # noqa: E402
+from crawler import NaverNewsCrawler  # noqa: E402
+from list_parser import PARSER_BACKENDS, parse_news_list  # noqa: E402
+from message_renderer import MessageRenderer  # noqa: E402
+
+FORMAT_SIZES = (10, 100, 1000)
+CLUSTER_SIZES = (10000, 100000)
+
+# 시간 측정 묶음 반복 횟수 (최솟값을 쓰므로 많을수록 일시적인 부하에 덜 흔들림)
+TIME_REPEAT = 15
+
+# 비교할 지표와 방향 (True: 클수록 나쁨)
+GATED_METRICS = {
+    'relative_time': True,
+    'alloc_blocks': True,
+}
+
+
+def _calibration_work():
+    # 기계 속도 보정용 기준 작업 (순수 Python 문자열/딕셔너리 처리)
+    table = {}
+    for idx in range(2000):
+        table[str(idx)] = f"{idx}-{idx * 2}"
+    return '\n'.join(table.values())
+
+
+def _batch_size(func: Callable[[], object], min_time: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= min_time:
+            return number
+        number *= 2
+
+
+def _time_batch(func: Callable[[], object], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number
+
+
+def measure_time(func: Callable[[], object], min_time: float = 0.1, repeat: int = TIME_REPEAT) -> Dict[str, float]:
+    """
+    함수 한 번 실행 시간 측정
+    
+    측정 묶음과 기준 작업 묶음을 번갈아 실행하여, 실행 중 부하 변화나 기계
+    속도 차이와 무관하게 비교할 수 있는 상대 시간도 함께 구합니다.
+    
+    Args:
+        func: 측정할 함수
+        min_time: 묶음 하나의 최소 실행 시간 (초)
+        repeat: 묶음 반복 횟수
+    
+    Returns:
+        {'seconds_per_op': 1회 실행 시간 (초, 묶음 평균 중 최솟값),
+         'relative_time': 기준 작업 대비 실행 시간}
+    """
+    number = _batch_size(func, min_time)
+    calibration_number = _batch_size(_calibration_work, min_time)
+    
+    best = calibration = float('inf')
+    for _ in range(repeat):
+        best = min(best, _time_batch(func, number))
+        calibration = min(calibration, _time_batch(_calibration_work, calibration_number))
+    
+    return {'seconds_per_op': best, 'relative_time': round(best / calibration, 4)}
+
+
+def measure_allocations(func: Callable[[], object]) -> Dict[str, float]:
+    """
+    함수 한 번 실행 중 할당된 메모리 블록 수와 최대 사용량 측정
+    
+    Returns:
+        {'alloc_blocks': 할당 블록 수, 'peak_kib': 최대 추가 사용량 (KiB)}
+    """
+    func()  # 지연 import, 정규식 컴파일 등 최초 실행 비용 제외
+    
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    
+    # 결과를 유지한 채 비교하므로 반환값을 만드는 데 남은 블록 수
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'lineno') if stat.count_diff > 0)
+    del result
+    return {'alloc_blocks': blocks, 'peak_kib': round((peak - base) / 1024, 1)}
+
+
+def load_fixtures() -> Dict[str, dict]:
+    """픽스처 목록과 본문 로드"""
+    manifest = json.loads((FIXTURE_DIR / 'manifest.json').read_text(encoding='utf-8'))
+    for entry in manifest.values():
+        entry['content'] = (FIXTURE_DIR / entry['file']).read_bytes()
+    return manifest
+
+
+def make_news(count: int) -> List[Dict[str, str]]:
+    """포맷팅용 기사 리스트 생성"""
+    return [
+        {
+            'title': f"[속보] 테스트 기사 제목 {idx} - 경제 금리 반도체 수출 전망",
+            'url': f"https://n.news.naver.com/mnews/article/001/{idx:010d}",
+        }
+        for idx in range(count)
+    ]
+
+
+def make_headlines(count: int, seed: int = 42) -> List[str]:
+    """
+    묶음 벤치마크용 제목 생성
+    
+    기사마다 1~5개 언론사가 머리말/꼬리말을 붙이거나 단어 하나를 바꿔 보도한
+    것처럼 변형한 제목을 만듭니다.
+    """
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 2000, 7)]
+    words = [''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(3000)]
+    headlines = []
+    
+    while len(headlines) < count:
+        story = [rng.choice(words) for _ in range(rng.randint(5, 8))]
+        for _ in range(rng.choice((1, 1, 1, 2, 3, 5))):
+            variant = list(story)
+            if rng.random() < 0.5:
+                variant[rng.randrange(len(variant))] = rng.choice(words)
+            prefix = rng.choice(('', '[속보] ', '[단독] ', '(종합) '))
+            headlines.append(prefix + ' '.join(variant) + rng.choice(('', '…', '(종합)')))
+    
+    return headlines[:count]
+
+
+def bench_parsers(fixtures: Dict[str, dict]) -> Dict[str, dict]:
+    results = {}
+    
+    for name, entry in fixtures.items():
+        for backend in PARSER_BACKENDS:
+            def parse():
+                return parse_news_list(entry['content'], entry['content_type'], backend=backend)
+            
+            articles = len(parse())
+            if articles != entry['articles']:
+                raise AssertionError(f"{name}/{backend}: 기사 {articles}개 (기대값 {entry['articles']}개)")
+            
+            timing = measure_time(parse)
+            seconds = timing['seconds_per_op']
+            results[f"parse/{backend}/{name}"] = {
+                **timing,
+                'pages_per_sec': round(1 / seconds, 1),
+                'articles_per_sec': round(articles / seconds, 1),
+                'bytes': len(entry['content']),
+                **measure_allocations(parse),
+            }
+    
+    return results
+
+
+def bench_formatters() -> Dict[str, dict]:
+    crawler = NaverNewsCrawler()
+    results = {}
+    
+    for size in FORMAT_SIZES:
+        news_list = make_news(size)
+        cases = {
+            'format_news_message': lambda: crawler.format_news_message(news_list),
+            # 렌더러는 기사별 캐시가 있으므로 매번 새로 만들어 캐시 미스 비용 측정
+            'render_text': lambda: MessageRenderer('text').render(news_list),
+            'render_list': lambda: MessageRenderer('list').render(news_list),
+        }
+        
+        for case, func in cases.items():
+            timing = measure_time(func)
+            results[f"{case}/{size}"] = {
+                **timing,
+                'articles_per_sec': round(size / timing['seconds_per_op'], 1),
+                **measure_allocations(func),
+            }
+    
+    return results
+
+
+def bench_clustering() -> Dict[str, dict]:
+    clusterer = StoryClusterer()
+    results = {}
+    
+    for size in CLUSTER_SIZES:
+        titles = make_headlines(size)
+        
+        def cluster():
+            return clusterer.cluster(titles)
+        
+        timing = measure_time(cluster, repeat=3)
+        results[f"cluster/{size}"] = {
+            **timing,
+            'articles_per_sec': round(size / timing['seconds_per_op'], 1),
+            'clusters': len(set(cluster().tolist())),
+            **measure_allocations(cluster),
+        }
+    
+    return results
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_delta: float = 50e-6) -> List[str]:
+    """
+    기준 결과 대비 회귀 항목 찾기
+    
+    Args:
+        report: 이번 결과 ({'results': {항목: 지표}})
+        baseline: 기준 결과 (같은 형식)
+        threshold: 허용 증가율
+        min_delta: 시간 회귀로 볼 최소 증가량 (초, 이번 실행 기준으로 환산)
+    
+    Returns:
+        임계값을 넘게 나빠진 항목 설명 리스트
+    """
+    regressions = []
+    
+    for key, current in report['results'].items():
+        previous = baseline['results'].get(key)
+        if previous is None:
+            continue
+        
+        for metric, worse_if_higher in GATED_METRICS.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old if worse_if_higher else (old - new) / old
+            if change <= threshold:
+                continue
+            if metric == 'relative_time':
+                # 기준 결과의 상대 시간을 이번 실행의 시간으로 환산하여 늘어난 시간 계산
+                delta = current['seconds_per_op'] * (1 - old / new)
+                if delta < min_delta:
+                    continue
+            regressions.append(f"{key} {metric}: {old:.6g} → {new:.6g} (+{change:.0%})")
+    
+    return regressions
+
+
+def print_results(results: Dict[str, dict]):
+    for key, result in results.items():
+        throughput = (f"{result['pages_per_sec']:>9.1f} 페이지/초 " if 'pages_per_sec' in result else ' ' * 20)
+        print(f"{key:<48} {result['seconds_per_op'] * 1e6:>10.1f}µs {throughput}"
+              f"{result['articles_per_sec']:>11.1f} 기사/초  "
+              f"블록 {result['alloc_blocks']:>6}  최대 {result['peak_kib']:>8.1f}KiB")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="파서/포맷터 마이크로 벤치마크")
+    arg_parser.add_argument('--save', action='store_true', help="결과를 기준 결과(baseline.json)로 저장")
+    arg_parser.add_argument('--threshold', type=float, default=0.3, help="허용 증가율 (기본값: 0.3)")
+    arg_parser.add_argument('--min-delta', type=float, default=50.0,
+                            help="시간 회귀로 볼 최소 증가량 (µs, 기본값: 50)")
+    arg_parser.add_argument('--baseline', default=str(BASELINE_PATH), help="기준 결과 파일 경로")
+    arg_parser.add_argument('--output', help="이번 결과를 저장할 JSON 파일 경로")
+    args = arg_parser.parse_args()
+    
+    results = bench_parsers(load_fixtures())
+    results.update(bench_formatters())
+    results.update(bench_clustering())
+    print_results(results)
+    
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    
+    if args.save:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f"\n💾 기준 결과 저장: {args.baseline}")
+        return
+    
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print(f"\n⚠️ 기준 결과가 없습니다. --save로 먼저 저장하세요: {baseline_path}")
+        return
+    
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    regressions = compare(report, baseline, args.threshold, args.min_delta * 1e-6)
+    
+    if regressions:
+        print(f"\n❌ 기준 대비 {args.threshold:.0%} 넘게 느려지거나 할당이 늘어난 항목:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    
+    print(f"\n✅ 기준 대비 회귀 없음 (허용 {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+벤치마크용 목록 페이지 픽스처 생성 스크립트
+
+실제 list.naver 페이지와 같은 크기/구조(머리말, 메뉴, 스크립트, 사진 목록,
+페이지 이동 영역)의 HTML을 인코딩/레이아웃별로 만들어 fixtures/에 저장합니다.
+같은 시드로 항상 같은 파일이 만들어지므로 기준 결과(baseline.json)와
+비교할 수 있습니다.
+
+--record 옵션을 주면 실제 목록 페이지를 받아 그대로 저장합니다.
+(네트워크가 되는 환경에서 픽스처를 실제 페이지로 교체할 때 사용)
+
+사용법:
+    python benchmarks/make_fixtures.py
+    python benchmarks/make_fixtures.py --record
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Tuple
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+MANIFEST_PATH = FIXTURE_DIR / 'manifest.json'
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+WORDS = [
+    '정부', '국회', '대통령', '경제', '금리', '환율', '증시', '코스피', '반도체', '수출',
+    '부동산', '아파트', '전세', '물가', '소비자', '기업', '실적', '발표', '협상', '합의',
+    '여당', '야당', '선거', '후보', '지지율', '외교', '정상회담', '북한', '미사일', '안보',
+    '날씨', '폭염', '태풍', '지진', '사고', '화재', '경찰', '검찰', '수사', '재판',
+    '인공지능', '스마트폰', '배터리', '전기차', '우주', '게임', '플랫폼', '보안', '통신', '반도체',
+    '야구', '축구', '올림픽', '감독', '선수', '우승', '신기록', '영화', '드라마', '공연',
+]
+PRESSES = ['연합뉴스', '뉴시스', '뉴스1', '한국경제', '매일경제', '조선일보', '중앙일보', '동아일보',
+           '한겨레', '경향신문', 'KBS', 'MBC', 'SBS', 'YTN', 'JTBC', '머니투데이', '서울신문']
+
+# 이름: (문자셋, 헤더 문자셋 표기, URL 형식, 사진 비율, 헤드라인 목록 여부, 목록별 기사 수)
+LAYOUTS = {
+    'breaking_utf8': ('utf-8', True, 'path', 0.6, True, (10, 10)),
+    'breaking_euckr_meta': ('euc-kr', False, 'query', 0.6, True, (10, 10)),
+    'subsection_utf8_nophoto': ('utf-8', True, 'path', 0.0, False, (10, 10)),
+    'last_page_euckr': ('euc-kr', True, 'query', 0.3, False, (7,)),
+}
+
+# 실제 페이지 수집 대상 (이름, 요청 파라미터)
+RECORD_TARGETS = [
+    ('recorded_breaking', {'mode': 'LSD', 'mid': 'sec', 'sid1': '001'}),
+    ('recorded_section_100', {'mode': 'LSD', 'mid': 'sec', 'sid1': '100'}),
+    ('recorded_subsection_259', {'mode': 'LS2D', 'mid': 'shm', 'sid1': '101', 'sid2': '259'}),
+]
+
+
+def _title(rng: random.Random) -> str:
+    words = rng.sample(WORDS, rng.randint(5, 9))
+    title = ' '.join(words)
+    # 실제 제목처럼 따옴표/특수문자/엔티티 섞기
+    if rng.random() < 0.3:
+        title = f"[속보] {title}"
+    if rng.random() < 0.2:
+        title = title.replace(' ', ' &quot;', 1) + '&quot;'
+    if rng.random() < 0.1:
+        title += ' &amp; ' + rng.choice(WORDS)
+    return title
+
+
+def _article_url(rng: random.Random, style: str) -> str:
+    oid = rng.randint(1, 660)
+    aid = rng.randint(10 ** 9, 10 ** 10 - 1)
+    if style == 'path':
+        return f"https://n.news.naver.com/mnews/article/{oid:03d}/{aid:010d}?sid=100"
+    return f"https://news.naver.com/main/read.naver?mode=LSD&amp;mid=sec&amp;sid1=001&amp;oid={oid:03d}&amp;aid={aid:010d}"
+
+
+def _item(rng: random.Random, style: str, photo_ratio: float) -> str:
+    url = _article_url(rng, style)
+    title = _title(rng)
+    lede = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(15, 25)))
+    press = rng.choice(PRESSES)
+    
+    photo = ''
+    if rng.random() < photo_ratio:
+        photo = (
+            f'\n\t\t\t\t\t\t\t<dt class="photo">\n\t\t\t\t\t\t\t\t<a href="{url}">\n'
+            f'\t\t\t\t\t\t\t\t\t<img src="https://imgnews.pstatic.net/image/origin/{rng.randint(1, 660):03d}/'
+            f'2024/01/01/{rng.randint(1, 10 ** 7)}.jpg?type=nf106_72" width="106" height="72" alt="{title}"\n'
+            f'\t\t\t\t\t\t\t\t\tonerror="javascript:this.src=\'https://ssl.pstatic.net/static.news/image/news/'
+            f'2009/noimage_106x72.gif\';">\n\t\t\t\t\t\t\t\t</a>\n\t\t\t\t\t\t\t</dt>'
+        )
+    
+    return (
+        f'\n\t\t\t\t\t<li>\n\t\t\t\t\t\t<dl>{photo}\n'
+        f'\t\t\t\t\t\t\t<dt>\n\t\t\t\t\t\t\t<a href="{url}">\n\t\t\t\t\t\t\t{title}\n\t\t\t\t\t\t\t</a>\n'
+        f'\t\t\t\t\t\t\t</dt>\n\t\t\t\t\t\t\t<dd>\n'
+        f'\t\t\t\t\t\t\t<span class="lede">{lede} …</span>\n'
+        f'\t\t\t\t\t\t\t<span class="writing">{press}</span>\n'
+        f'\t\t\t\t\t\t\t<span class="date is_new">{rng.randint(1, 59)}분전</span>\n'
+        f'\t\t\t\t\t\t\t</dd>\n\t\t\t\t\t\t</dl>\n\t\t\t\t\t</li>'
+    )
+
+
+def _boilerplate(rng: random.Random, kind: str) -> str:
+    # 실제 페이지 앞뒤의 메뉴/스크립트/광고 영역 (목록 파싱과 무관한 부분)
+    if kind == 'head':
+        scripts = '\n'.join(
+            f'<script type="text/javascript">var nsc_{i} = {{"area": "{rng.choice(WORDS)}", '
+            f'"index": {i}, "data": "{"".join(rng.choice("abcdef0123456789") for _ in range(400))}"}};</script>'
+            for i in range(120)
+        )
+        menu = '\n'.join(
+            f'<li class="lnb_item"><a href="/main/main.naver?mode=LSD&amp;mid=shm&amp;sid1={100 + i}" '
+            f'class="Nitem_link"><span class="Nitem_link_menu">{rng.choice(WORDS)}</span></a></li>'
+            for i in range(60)
+        )
+        return f'{scripts}\n<div id="lnb"><ul class="Nlist">\n{menu}\n</ul></div>'
+    
+    ranking = '\n'.join(
+        f'<li><em class="num">{i}</em><a href="/main/ranking/read.naver?rankingType=popular_day&amp;oid=0{i:02d}'
+        f'&amp;aid=00{rng.randint(10 ** 7, 10 ** 8 - 1)}" class="nclicks(rig.ranking)">{_title(rng)}</a></li>'
+        for i in range(1, 31)
+    )
+    footer = '\n'.join(
+        f'<script>document.write(\'<div class="ad_{i}" data-id="{rng.randint(1, 10 ** 6)}"></div>\');</script>'
+        for i in range(80)
+    )
+    return f'<div class="section_rank"><ol class="ranking_list">\n{ranking}\n</ol></div>\n{footer}'
+
+
+def build_page(name: str, seed: int) -> Tuple[bytes, str, int]:
+    """
+    레이아웃별 목록 페이지 생성
+    
+    Returns:
+        (본문 바이트, Content-Type 헤더, 기사 수)
+    """
+    charset, header_charset, style, photo_ratio, headline, counts = LAYOUTS[name]
+    rng = random.Random(seed)
+    
+    lists = []
+    for index, count in enumerate(counts):
+        css = 'type06_headline' if headline and index == 0 else 'type06'
+        items = ''.join(_item(rng, style, photo_ratio) for _ in range(count))
+        lists.append(f'\t\t\t\t<ul class="{css}">{items}\n\t\t\t\t</ul>')
+    
+    paging = ''.join(
+        f'<a href="?mode=LSD&amp;mid=sec&amp;sid1=001&amp;date=20240101&amp;page={page}">{page}</a>'
+        for page in range(2, 11)
+    )
+    
+    html = (
+        f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="{charset}">\n'
+        f'<title>속보 : 네이버 뉴스</title>\n{_boilerplate(rng, "head")}\n</head>\n<body>\n'
+        f'<div id="main_content" class="content">\n<div class="list_body newsflash_body">\n'
+        + '\n'.join(lists)
+        + f'\n</div>\n<div class="paging"><strong>1</strong>{paging}</div>\n</div>\n'
+        f'{_boilerplate(rng, "tail")}\n</body>\n</html>\n'
+    )
+    
+    content_type = f'text/html; charset={charset}' if header_charset else 'text/html'
+    return html.encode(charset), content_type, sum(counts)
+
+
+def record_pages() -> dict:
+    """실제 목록 페이지 수집 (Content-Type 포함)"""
+    from crawler import NaverNewsCrawler
+    from list_parser import parse_news_list
+    
+    crawler = NaverNewsCrawler()
+    manifest = {}
+    
+    for name, params in RECORD_TARGETS:
+        response = crawler.transport.get(crawler.base_url, params=params, headers=crawler.headers)
+        response.raise_for_status()
+        
+        content_type = response.headers.get('Content-Type', 'text/html')
+        path = FIXTURE_DIR / f"{name}.html"
+        path.write_bytes(response.content)
+        manifest[name] = {
+            'file': path.name,
+            'content_type': content_type,
+            'articles': len(parse_news_list(response.content, content_type)),
+        }
+        print(f"💾 {path.name}: {len(response.content) // 1024}KB, 기사 {manifest[name]['articles']}개")
+    
+    return manifest
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="벤치마크 픽스처 생성")
+    arg_parser.add_argument('--record', action='store_true', help="실제 목록 페이지를 받아 저장")
+    args = arg_parser.parse_args()
+    
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    
+    if args.record:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding='utf-8')) if MANIFEST_PATH.exists() else {}
+        manifest.update(record_pages())
+    else:
+        manifest = {}
+        for seed, name in enumerate(LAYOUTS):
+            content, content_type, articles = build_page(name, seed)
+            path = FIXTURE_DIR / f"{name}.html"
+            path.write_bytes(content)
+            manifest[name] = {'file': path.name, 'content_type': content_type, 'articles': articles}
+            print(f"💾 {path.name}: {len(content) // 1024}KB, 기사 {articles}개")
+    
+    MANIFEST_PATH.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
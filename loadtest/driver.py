@@ -0,0 +1,275 @@
+"""
+부하 테스트 드라이버
+
+대역 서버(stubs.py)를 띄우고 main.run_cycle과 같은 단계(크롤링 → 중복 제거 →
+렌더링 → 전송)를 여러 파이프라인에서 반복 실행한 뒤, 전체 처리량과
+단계별 p50/p99 지연 시간을 보고합니다.
+
+사용법:
+    python loadtest/driver.py --cycles 20 --pipelines 4 --subscribers 50 \\
+        --latency 0.05 --error-rate 0.02 --unauthorized-rate 0.01 --rotate-every 3
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from crawler import NaverNewsCrawler, Section, parse_sections  # noqa: E402
+from fanout import FanoutDispatcher, Subscriber, SubscriberRegistry  # noqa: E402
+from http_client import HttpTransport  # noqa: E402
+from message_renderer import MessageRenderer  # noqa: E402
+from seen_index import SeenArticleIndex  # noqa: E402
+from stubs import Recorder, StubConfig, StubServer, StubState, add_config_arguments, config_from_args  # noqa: E402
+from watermark import HighWaterMarkStore  # noqa: E402
+
+STAGES = ('crawl', 'dedup', 'render', 'token', 'send', 'cycle')
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값에서 q(0~1) 분위수 (최근접 순위)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(q * len(ordered) + 0.5), len(ordered)) - 1
+    return ordered[max(index, 0)]
+
+
+class StageTimer:
+    """단계별 소요 시간 수집 클래스 (스레드 안전)"""
+    
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+    
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+    
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            self.samples[name].append(seconds)
+    
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """함수 호출 시간을 name 단계로 기록하는 래퍼"""
+        def timed(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return timed
+    
+    def summary(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                name: {
+                    'count': len(values),
+                    'p50_ms': round(percentile(values, 0.5) * 1000, 2),
+                    'p99_ms': round(percentile(values, 0.99) * 1000, 2),
+                    'max_ms': round(max(values) * 1000, 2),
+                }
+                for name, values in self.samples.items() if values
+            }
+
+
+class Pipeline:
+    """대역 서버에 연결한 크롤러/발송 이력/렌더러/발송기 한 벌"""
+    
+    def __init__(self, index: int, naver_url: str, kakao_url: str, state: StubState,
+                 workdir: Path, subscribers: int, transport: HttpTransport,
+                 timer: StageTimer, template: str):
+        self.timer = timer
+        self.crawler = NaverNewsCrawler(
+            transport=transport,
+            watermarks=HighWaterMarkStore(str(workdir / f"watermarks_{index}.json"))
+        )
+        self.crawler.base_url = f"{naver_url}/main/list.naver"
+        self.seen_index = SeenArticleIndex(str(workdir / f"seen_{index}.db"))
+        self.renderer = MessageRenderer(template)
+        
+        registry = SubscriberRegistry(str(workdir / f"subscribers_{index}.json"))
+        for number in range(subscribers):
+            subscriber = Subscriber(f"p{index}-s{number}", f"client-{index}-{number}",
+                                    f"refresh-{index}-{number}")
+            registry.add(subscriber)
+            state.register_client(subscriber.client_id, subscriber.refresh_token)
+        
+        self.dispatcher = FanoutDispatcher.from_registry(
+            registry, str(workdir / f"tokens_{index}"), transport=transport,
+            rate_per_token=1000.0, burst=10
+        )
+        for sender in self.dispatcher.senders.values():
+            sender.token_url = f"{kakao_url}/oauth/token"
+            sender.message_url = f"{kakao_url}/v2/api/talk/memo/default/send"
+            sender.get_access_token = timer.wrap('token', sender.get_access_token)
+        
+        self.articles = 0
+        self.messages = 0
+        self.failed_cycles = 0
+    
+    def run_cycle(self, sections: List[Section], max_pages: int) -> bool:
+        """main.run_cycle과 같은 순서로 한 사이클 실행"""
+        with self.timer.stage('cycle'):
+            with self.timer.stage('crawl'):
+                news_list = self.crawler.crawl_incremental(sections, max_pages=max_pages)
+            
+            with self.timer.stage('dedup'):
+                news_list = self.seen_index.filter_new(news_list)
+            
+            if not news_list:
+                self.crawler.commit_watermarks()
+                return True
+            
+            with self.timer.stage('render'):
+                template_objects = self.renderer.render(news_list)
+            
+            with self.timer.stage('send'):
+                results = self.dispatcher.dispatch(template_objects)
+            
+            self.messages += sum(result.messages_sent for result in results)
+            if not any(result.success for result in results):
+                self.failed_cycles += 1
+                return False
+            
+            self.seen_index.add_many(news_list)
+            self.crawler.commit_watermarks()
+            self.articles += len(news_list)
+            return True
+    
+    def close(self):
+        self.seen_index.close()
+
+
+def run_load(config: StubConfig, cycles: int = 10, pipelines: int = 1, subscribers: int = 10,
+             sections: str = '001', interval: float = 0.0, max_pages: int = 5,
+             template: str = 'list', naver_mode: str = 'synthetic',
+             recording: Optional[str] = None, verbose: bool = False) -> dict:
+    """
+    대역 서버를 띄우고 부하 실행
+    
+    Args:
+        config: 대역 서버 설정
+        cycles: 파이프라인별 사이클 수
+        pipelines: 동시에 실행할 파이프라인 수
+        subscribers: 파이프라인별 구독자 수
+        sections: 수집할 섹션 (CRAWL_SECTIONS 형식)
+        interval: 사이클 사이 대기 시간 (초)
+        max_pages: 섹션별 최대 요청 페이지 수
+        template: 메시지 템플릿
+        naver_mode: 네이버 대역 모드 ('synthetic', 'record', 'replay')
+        recording: record/replay 모드의 기록 파일 경로
+        verbose: 파이프라인 출력 표시 여부
+    
+    Returns:
+        처리량/단계별 지연 시간/대역 서버 통계 보고서
+    """
+    state = StubState(config)
+    timer = StageTimer()
+    section_list = parse_sections(sections)
+    transport = HttpTransport(pool_connections=4, pool_maxsize=max(16, pipelines * 16))
+    
+    recorder = Recorder(recording) if naver_mode != 'synthetic' else None
+    naver_stub = StubServer(state, mode=naver_mode, recorder=recorder)
+    
+    with tempfile.TemporaryDirectory() as tmp, naver_stub as naver, StubServer(state) as kakao:
+        workers = [
+            Pipeline(index, naver.url, kakao.url, state, Path(tmp), subscribers, transport, timer, template)
+            for index in range(pipelines)
+        ]
+        
+        def run(pipeline: Pipeline):
+            for cycle in range(cycles):
+                if cycle and interval:
+                    time.sleep(interval)
+                pipeline.run_cycle(section_list, max_pages)
+        
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with output:
+            threads = [threading.Thread(target=run, args=(pipeline,)) for pipeline in workers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - started
+        
+        for pipeline in workers:
+            pipeline.close()
+        transport.close()
+    
+    articles = sum(pipeline.articles for pipeline in workers)
+    messages = sum(pipeline.messages for pipeline in workers)
+    
+    return {
+        'elapsed_sec': round(elapsed, 3),
+        'cycles': cycles * pipelines,
+        'failed_cycles': sum(pipeline.failed_cycles for pipeline in workers),
+        'articles': articles,
+        'messages': messages,
+        'cycles_per_sec': round(cycles * pipelines / elapsed, 2),
+        'articles_per_sec': round(articles / elapsed, 2),
+        'messages_per_sec': round(messages / elapsed, 2),
+        'stages': timer.summary(),
+        'stub': dict(state.stats),
+    }
+
+
+def print_report(report: dict):
+    print(f"⏱️ {report['elapsed_sec']:.2f}초 동안 사이클 {report['cycles']}회 "
+          f"(실패 {report['failed_cycles']}회)")
+    print(f"📊 처리량: 사이클 {report['cycles_per_sec']}/초, 기사 {report['articles_per_sec']}/초, "
+          f"메시지 {report['messages_per_sec']}/초")
+    print(f"\n{'단계':<8} {'횟수':>6} {'p50(ms)':>10} {'p99(ms)':>10} {'최대(ms)':>10}")
+    for stage in STAGES:
+        summary = report['stages'].get(stage)
+        if summary:
+            print(f"{stage:<8} {summary['count']:>6} {summary['p50_ms']:>10.2f} "
+                  f"{summary['p99_ms']:>10.2f} {summary['max_ms']:>10.2f}")
+    print("\n🧪 대역 서버 응답:")
+    for name, count in sorted(report['stub'].items()):
+        print(f"   {name}: {count}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="네이버/카카오 대역 서버 대상 부하 테스트")
+    arg_parser.add_argument('--cycles', type=int, default=10, help="파이프라인별 사이클 수")
+    arg_parser.add_argument('--pipelines', type=int, default=1, help="동시에 실행할 파이프라인 수")
+    arg_parser.add_argument('--subscribers', type=int, default=10, help="파이프라인별 구독자 수")
+    arg_parser.add_argument('--sections', default='001', help="수집할 섹션 (CRAWL_SECTIONS 형식)")
+    arg_parser.add_argument('--interval', type=float, default=1.0, help="사이클 사이 대기 시간 (초)")
+    arg_parser.add_argument('--max-pages', type=int, default=5, help="섹션별 최대 요청 페이지 수")
+    arg_parser.add_argument('--template', default='list', help="메시지 템플릿")
+    arg_parser.add_argument('--naver-mode', choices=('synthetic', 'record', 'replay'), default='synthetic',
+                            help="네이버 대역 모드 (record: 응답 기록, replay: 기록 재생)")
+    arg_parser.add_argument('--recording', default='loadtest/recording.jsonl', help="기록 파일 경로")
+    arg_parser.add_argument('--output', help="보고서를 저장할 JSON 파일 경로")
+    arg_parser.add_argument('--verbose', action='store_true', help="파이프라인 출력 표시")
+    add_config_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    report = run_load(
+        config_from_args(args), cycles=args.cycles, pipelines=args.pipelines,
+        subscribers=args.subscribers, sections=args.sections, interval=args.interval,
+        max_pages=args.max_pages, template=args.template, naver_mode=args.naver_mode,
+        recording=args.recording, verbose=args.verbose
+    )
+    print_report(report)
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+부하 테스트용 네이버/카카오 대역 서버
+
+실제 news.naver.com, kauth.kakao.com, kapi.kakao.com 대신 로컬에서
+같은 경로와 응답 형식을 흉내 냅니다.
+
+- GET  /main/list.naver                      : 뉴스 목록 페이지 (시간이 지나면 새 기사 발행)
+- POST /oauth/token                          : refresh_token 그랜트 (Refresh Token 회전)
+- POST /v2/api/talk/memo/default/send        : 나에게 보내기 (401/429/5xx 주입)
+
+지연 시간, 오류 비율, 401/429 주입 비율, 토큰 회전 주기를 설정할 수 있고,
+응답을 파일에 기록했다가 그대로 다시 재생(replay)할 수도 있습니다.
+record 모드에서 upstream을 지정하면 실제 서버 응답을 받아 기록합니다.
+
+사용법:
+    python loadtest/stubs.py --naver-port 8081 --kakao-port 8082 --error-rate 0.05
+"""
+
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+
+@dataclass
+class StubConfig:
+    """대역 서버 동작 설정"""
+    latency: float = 0.0              # 응답 지연 (초)
+    latency_jitter: float = 0.0       # 응답 지연에 더할 최대 무작위 지연 (초)
+    error_rate: float = 0.0           # 503 응답 비율
+    unauthorized_rate: float = 0.0    # 메시지 전송 시 Access Token 만료(401) 비율
+    rate_limit_rate: float = 0.0      # 메시지 전송 시 429 비율
+    retry_after: float = 0.0          # 429 응답의 Retry-After (초)
+    rotate_every: int = 0             # 토큰 갱신 N번마다 Refresh Token 회전 (0: 회전 안 함)
+    access_token_ttl: int = 21599     # Access Token 유효 시간 (초)
+    publish_rate: float = 1.0         # 섹션별 초당 새 기사 수
+    seed: Optional[int] = None
+
+
+class Recorder:
+    """응답 기록/재생 클래스 (JSON Lines 파일)"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 기록 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._responses: Dict[Tuple[str, str], List[dict]] = {}
+        self._cursors: Counter = Counter()
+    
+    @staticmethod
+    def request_key(method: str, path: str) -> Tuple[str, str]:
+        # 쿼리 순서가 달라도 같은 요청으로 취급
+        parts = urlsplit(path)
+        query = '&'.join(f"{key}={value}" for key, value in sorted(parse_qsl(parts.query)))
+        return method, f"{parts.path}?{query}" if query else parts.path
+    
+    def record(self, method: str, path: str, status: int, headers: Dict[str, str], body: bytes):
+        """응답 한 건 기록"""
+        entry = {
+            'method': method,
+            'path': path,
+            'status': status,
+            'headers': headers,
+            'body': body.decode('latin-1'),
+        }
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    
+    def load(self):
+        """기록 파일 읽기"""
+        self._responses = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                key = self.request_key(entry['method'], entry['path'])
+                self._responses.setdefault(key, []).append(entry)
+    
+    def replay(self, method: str, path: str) -> Optional[Tuple[int, bytes, Dict[str, str]]]:
+        """
+        기록된 응답 꺼내기 (같은 요청이 여러 번 기록되었으면 순서대로 돌아가며)
+        
+        Returns:
+            (상태 코드, 본문, 헤더) 또는 기록이 없으면 None
+        """
+        key = self.request_key(method, path)
+        with self._lock:
+            entries = self._responses.get(key)
+            if not entries:
+                return None
+            entry = entries[self._cursors[key] % len(entries)]
+            self._cursors[key] += 1
+        return entry['status'], entry['body'].encode('latin-1'), entry['headers']
+
+
+class StubState:
+    """대역 서버 공통 상태 (토큰, 기사 발행, 통계)"""
+    
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.started_at = time.monotonic()
+        self.stats: Counter = Counter()
+        self.refresh_tokens: Dict[str, str] = {}   # refresh_token → client_id
+        self.access_tokens: Dict[str, str] = {}    # access_token → client_id
+        self.grants: Counter = Counter()            # client_id → 토큰 갱신 횟수
+        self._lock = threading.Lock()
+    
+    def register_client(self, client_id: str, refresh_token: str):
+        """유효한 Refresh Token 등록"""
+        with self._lock:
+            self.refresh_tokens[refresh_token] = client_id
+    
+    def chance(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self.random.random() < rate
+    
+    def count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+    
+    def sleep(self):
+        delay = self.config.latency
+        if self.config.latency_jitter:
+            with self._lock:
+                delay += self.random.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+    
+    def latest_article_id(self) -> int:
+        """지금까지 발행된 마지막 기사 번호"""
+        return 1000 + int((time.monotonic() - self.started_at) * self.config.publish_rate)
+    
+    def grant(self, client_id: str, refresh_token: str) -> Optional[dict]:
+        """refresh_token 그랜트 처리 (잘못된 토큰이면 None)"""
+        with self._lock:
+            if self.refresh_tokens.get(refresh_token) != client_id:
+                return None
+            
+            access_token = secrets.token_urlsafe(24)
+            self.access_tokens[access_token] = client_id
+            self.grants[client_id] += 1
+            
+            tokens = {
+                'token_type': 'bearer',
+                'access_token': access_token,
+                'expires_in': self.config.access_token_ttl,
+            }
+            
+            rotate_every = self.config.rotate_every
+            if rotate_every and self.grants[client_id] % rotate_every == 0:
+                # 회전된 이전 Refresh Token은 더 이상 사용할 수 없음
+                new_refresh_token = secrets.token_urlsafe(24)
+                del self.refresh_tokens[refresh_token]
+                self.refresh_tokens[new_refresh_token] = client_id
+                tokens['refresh_token'] = new_refresh_token
+                tokens['refresh_token_expires_in'] = 5183999
+                self.stats['token_rotations'] += 1
+            
+            return tokens
+    
+    def revoke(self, access_token: str):
+        with self._lock:
+            self.access_tokens.pop(access_token, None)
+    
+    def is_valid(self, access_token: str) -> bool:
+        with self._lock:
+            return access_token in self.access_tokens
+
+
+def render_list_page(sid: str, latest: int, page: int, per_page: int = 20) -> bytes:
+    """목록 페이지 HTML 생성 (최신 기사부터 페이지당 per_page개)"""
+    first = latest - (page - 1) * per_page
+    items = []
+    for offset in range(per_page):
+        aid = first - offset
+        if aid <= 0:
+            break
+        items.append(
+            f'<li><dl><dt><a href="https://n.news.naver.com/mnews/article/{sid}/{aid:010d}">'
+            f'섹션 {sid} 기사 {aid}</a></dt><dd><span class="writing">대역 언론사</span></dd></dl></li>'
+        )
+    
+    headline, normal = items[:10], items[10:]
+    html = (
+        '<html><head><meta charset="utf-8"><title>대역 목록</title></head><body>'
+        f'<ul class="type06_headline">{"".join(headline)}</ul>'
+        f'<ul class="type06">{"".join(normal)}</ul>'
+        '</body></html>'
+    )
+    return html.encode('utf-8')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """네이버/카카오 대역 요청 처리 클래스"""
+    
+    protocol_version = 'HTTP/1.1'
+    state: StubState = None
+    recorder: Optional[Recorder] = None
+    mode: str = 'synthetic'       # synthetic | record | replay
+    upstream: Optional[str] = None
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _read_form(self) -> Dict[str, str]:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        return dict(parse_qsl(body))
+    
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', 'application/json;charset=UTF-8')
+        headers['Content-Length'] = str(len(body))
+        
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in ('transfer-encoding', 'connection', 'content-encoding'):
+                self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        
+        self.state.count(f"{self.command} {urlsplit(self.path).path} {status}")
+        if self.mode == 'record' and self.recorder is not None:
+            self.recorder.record(self.command, self.path, status, headers, body)
+    
+    def _send_json(self, status: int, data: dict, headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(data).encode('utf-8'), headers)
+    
+    def _proxy(self, form: Optional[Dict[str, str]] = None):
+        # record 모드: 실제 서버로 보내고 응답을 그대로 전달
+        headers = {name: value for name, value in self.headers.items()
+                   if name.lower() in ('authorization', 'user-agent', 'content-type')}
+        response = requests.request(self.command, self.upstream + self.path, headers=headers,
+                                    data=form, timeout=(3.05, 10))
+        self._send(response.status_code, response.content,
+                   {'Content-Type': response.headers.get('Content-Type', 'text/html')})
+    
+    def _handle(self, form: Optional[Dict[str, str]] = None):
+        self.state.sleep()
+        
+        if self.mode == 'replay':
+            replayed = self.recorder.replay(self.command, self.path)
+            if replayed is None:
+                self._send_json(404, {'msg': 'not recorded'})
+            else:
+                self._send(*replayed)
+            return
+        
+        if self.mode == 'record' and self.upstream:
+            self._proxy(form)
+            return
+        
+        if self.state.chance(self.state.config.error_rate):
+            self._send_json(503, {'msg': 'service unavailable'})
+            return
+        
+        path = urlsplit(self.path).path
+        if self.command == 'GET' and path == '/main/list.naver':
+            self._list_page()
+        elif self.command == 'POST' and path == '/oauth/token':
+            self._token(form)
+        elif self.command == 'POST' and path == '/v2/api/talk/memo/default/send':
+            self._memo_send(form)
+        else:
+            self._send_json(404, {'msg': 'not found'})
+    
+    def _list_page(self):
+        query = dict(parse_qsl(urlsplit(self.path).query))
+        sid = (query.get('sid2') or query.get('sid1') or '001')[-3:].zfill(3)
+        page = int(query.get('page', 1))
+        self._send(200, render_list_page(sid, self.state.latest_article_id(), page),
+                   {'Content-Type': 'text/html; charset=utf-8'})
+    
+    def _token(self, form: Dict[str, str]):
+        if form.get('grant_type') != 'refresh_token':
+            self._send_json(400, {'error': 'unsupported_grant_type'})
+            return
+        
+        tokens = self.state.grant(form.get('client_id', ''), form.get('refresh_token', ''))
+        if tokens is None:
+            self._send_json(401, {'error': 'invalid_grant', 'error_description': 'invalid refresh token'})
+            return
+        self._send_json(200, tokens)
+    
+    def _memo_send(self, form: Dict[str, str]):
+        access_token = (self.headers.get('Authorization') or '').replace('Bearer ', '', 1)
+        
+        if not self.state.is_valid(access_token):
+            self._send_json(401, {'msg': 'this access token does not exist', 'code': -401})
+            return
+        if self.state.chance(self.state.config.unauthorized_rate):
+            # 만료된 것처럼 토큰을 폐기하여 재발급을 유도
+            self.state.revoke(access_token)
+            self._send_json(401, {'msg': 'this access token is already expired', 'code': -401})
+            return
+        if self.state.chance(self.state.config.rate_limit_rate):
+            self._send_json(429, {'msg': 'API limit has been exceeded.', 'code': -10},
+                            {'Retry-After': f"{self.state.config.retry_after:g}"})
+            return
+        
+        try:
+            json.loads(form.get('template_object', ''))
+        except ValueError:
+            self._send_json(400, {'msg': 'invalid template_object', 'code': -2})
+            return
+        
+        self._send_json(200, {'result_code': 0})
+    
+    def do_GET(self):
+        self._handle()
+    
+    def do_POST(self):
+        self._handle(self._read_form())
+
+
+class StubServer:
+    """대역 서버 실행 클래스 (별도 스레드에서 실행)"""
+    
+    def __init__(self, state: StubState, port: int = 0, mode: str = 'synthetic',
+                 recorder: Optional[Recorder] = None, upstream: Optional[str] = None):
+        """
+        Args:
+            state: 공통 상태 (여러 서버가 공유 가능)
+            port: 포트 (0이면 빈 포트 자동 선택)
+            mode: 'synthetic'(직접 생성), 'record'(기록), 'replay'(재생)
+            recorder: 기록/재생 객체 (record/replay 모드)
+            upstream: record 모드에서 요청을 보낼 실제 서버 (예: https://news.naver.com)
+        """
+        if mode not in ('synthetic', 'record', 'replay'):
+            raise ValueError(f"지원하지 않는 모드: {mode}")
+        if mode != 'synthetic' and recorder is None:
+            raise ValueError(f"{mode} 모드에는 recorder가 필요합니다.")
+        if mode == 'replay':
+            recorder.load()
+        
+        handler = type('BoundStubHandler', (StubHandler,), {
+            'state': state, 'recorder': recorder, 'mode': mode, 'upstream': upstream,
+        })
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+    
+    def start(self) -> 'StubServer':
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def add_config_arguments(arg_parser: argparse.ArgumentParser):
+    """StubConfig 설정용 명령행 인자 추가"""
+    arg_parser.add_argument('--latency', type=float, default=0.0, help="응답 지연 (초)")
+    arg_parser.add_argument('--latency-jitter', type=float, default=0.0, help="최대 무작위 추가 지연 (초)")
+    arg_parser.add_argument('--error-rate', type=float, default=0.0, help="503 응답 비율")
+    arg_parser.add_argument('--unauthorized-rate', type=float, default=0.0, help="메시지 전송 401 비율")
+    arg_parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="메시지 전송 429 비율")
+    arg_parser.add_argument('--retry-after', type=float, default=0.0, help="429 응답의 Retry-After (초)")
+    arg_parser.add_argument('--rotate-every', type=int, default=0, help="토큰 갱신 N번마다 Refresh Token 회전")
+    arg_parser.add_argument('--publish-rate', type=float, default=1.0, help="섹션별 초당 새 기사 수")
+    arg_parser.add_argument('--seed', type=int, help="무작위 시드")
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        unauthorized_rate=args.unauthorized_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        rotate_every=args.rotate_every,
+        publish_rate=args.publish_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="네이버/카카오 대역 서버")
+    arg_parser.add_argument('--naver-port', type=int, default=8081)
+    arg_parser.add_argument('--kakao-port', type=int, default=8082)
+    arg_parser.add_argument('--mode', choices=('synthetic', 'record', 'replay'), default='synthetic')
+    arg_parser.add_argument('--recording', default='loadtest/recording.jsonl', help="기록 파일 경로")
+    arg_parser.add_argument('--naver-upstream', help="record 모드에서 목록 페이지를 받을 실제 서버")
+    arg_parser.add_argument('--client', action='append', default=[],
+                            help="유효한 client_id:refresh_token (여러 번 지정 가능)")
+    add_config_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    state = StubState(config_from_args(args))
+    for client in args.client:
+        client_id, refresh_token = client.split(':', 1)
+        state.register_client(client_id, refresh_token)
+    
+    recorder = Recorder(args.recording) if args.mode != 'synthetic' else None
+    naver = StubServer(state, args.naver_port, args.mode, recorder, args.naver_upstream).start()
+    # 카카오 대역은 기록 재생 대상이 아니므로 항상 직접 생성 (토큰 상태 유지)
+    kakao = StubServer(state, args.kakao_port).start()
+    
+    print(f"🧪 네이버 대역: {naver.url}/main/list.naver ({args.mode})")
+    print(f"🧪 카카오 대역: {kakao.url}/oauth/token, {kakao.url}/v2/api/talk/memo/default/send")
+    
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        naver.stop()
+        kakao.stop()
+        print(json.dumps(dict(state.stats), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+적응형 수집 일정 모듈
+섹션별 기사 발행 속도를 지수 가중 이동 평균(EWMA)으로 추적하여,
+바쁜 섹션은 자주, 조용한 섹션은 드물게 목록 페이지를 요청합니다.
+
+최근 기사가 나온 섹션은 발행 속도와 관계없이 목표 지연 시간(기사 발행 → 전송)
+안에 다시 요청하고, 전체 섹션의 분당 요청 수가 예산을 넘으면 최근 기사가 없는
+섹션의 간격만 늘립니다. 요청이 실패한 섹션은 지수 백오프로 간격을 늘립니다.
+"""
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from crawler import Section
+from watermark import HighWaterMarkStore
+
+
+# 목록 페이지 한 장의 기사 수 (type06_headline + type06)
+ARTICLES_PER_PAGE = 20
+
+
+@dataclass
+class SectionState:
+    """섹션별 수집 상태"""
+    section: Section
+    rate: float = 0.0
+    interval: float = 0.0
+    next_poll: float = 0.0
+    last_poll: Optional[float] = None
+    last_article: Optional[float] = None
+    errors: int = 0
+    polls: int = 0
+    articles: int = 0
+
+
+class AdaptiveScheduler:
+    """섹션별 발행 속도 기반 적응형 수집 일정 클래스"""
+    
+    def __init__(self, sections: Iterable[Section], latency_target: float = 300.0,
+                 min_interval: float = 60.0, max_interval: float = 1800.0,
+                 budget_per_minute: float = 30.0, half_life: float = 1800.0,
+                 error_backoff: float = 60.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            sections: 수집할 (sid1, sid2) 리스트
+            latency_target: 기사 발행 후 수집까지 목표 지연 시간 (초)
+            min_interval: 섹션별 최소 요청 간격 (초)
+            max_interval: 섹션별 최대 요청 간격 (초, 오류 백오프 포함)
+            budget_per_minute: 전체 섹션의 분당 목록 페이지 요청 수 상한
+            half_life: 발행 속도 EWMA 반감기 (초)
+            error_backoff: 첫 오류 후 재시도 간격 (초, 연속 오류마다 2배)
+            clock: 현재 시각 함수 (epoch 초, 테스트용)
+        """
+        self.latency_target = latency_target
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget_per_minute = budget_per_minute
+        self.tau = half_life / math.log(2)
+        self.error_backoff = error_backoff
+        self.clock = clock
+        self._lock = threading.Lock()
+        
+        now = clock()
+        # 시작하면 모든 섹션을 한 번씩 수집
+        self.states: Dict[Section, SectionState] = {
+            section: SectionState(section, interval=latency_target, next_poll=now)
+            for section in sections
+        }
+    
+    @classmethod
+    def from_env(cls, sections: Iterable[Section]) -> 'AdaptiveScheduler':
+        """환경 변수(ADAPTIVE_*) 설정으로 생성"""
+        return cls(
+            sections,
+            latency_target=float(os.getenv('ADAPTIVE_LATENCY_TARGET', 300)),
+            min_interval=float(os.getenv('ADAPTIVE_MIN_INTERVAL', 60)),
+            max_interval=float(os.getenv('ADAPTIVE_MAX_INTERVAL', 1800)),
+            budget_per_minute=float(os.getenv('ADAPTIVE_BUDGET_PER_MINUTE', 30))
+        )
+    
+    def _is_active(self, state: SectionState) -> bool:
+        # 최대 간격 안에 기사가 나온 섹션 (EWMA는 0으로 돌아오지 않으므로 마지막 기사 시각으로 판단)
+        return (state.rate > 0 and state.last_article is not None
+                and state.last_poll - state.last_article <= self.max_interval)
+    
+    def _desired_interval(self, state: SectionState) -> float:
+        # 최근 기사가 나온 섹션은 발행이 드물어도 목표 지연마다 요청
+        # (발행 간격만큼 기다리면 그 사이에 나온 기사의 지연이 목표를 넘음)
+        if self._is_active(state):
+            interval = self.latency_target
+        else:
+            interval = self.max_interval if state.polls > 1 else self.latency_target
+        return min(max(interval, self.min_interval), self.max_interval)
+    
+    @staticmethod
+    def _pages_per_poll(state: SectionState, interval: float) -> float:
+        return max(1.0, state.rate * interval / ARTICLES_PER_PAGE)
+    
+    def _demand(self, states: List[SectionState], intervals: Dict[Section, float]) -> float:
+        return sum(60 * self._pages_per_poll(state, intervals[state.section]) / intervals[state.section]
+                   for state in states)
+    
+    def _rebalance(self):
+        """
+        발행 속도로 간격을 다시 계산하고 분당 요청 예산에 맞게 조정
+        
+        최근 기사가 나온 섹션은 목표 지연을 지키도록 늘리지 않고, 남은 예산에
+        맞게 최근 기사가 없는 섹션의 간격만 최대 간격까지 늘립니다. 최근 기사가
+        나온 섹션만으로 예산을 넘으면 그 섹션들도 예산에 맞게 늘립니다.
+        """
+        healthy = [state for state in self.states.values() if state.errors == 0]
+        intervals = {state.section: self._desired_interval(state) for state in healthy}
+        active = [state for state in healthy if self._is_active(state)]
+        quiet = [state for state in healthy if not self._is_active(state)]
+        quiet_sections = {state.section for state in quiet}
+        
+        # 한 번에 여러 페이지를 넘기는 섹션은 간격을 늘려도 요청 수가
+        # 크게 줄지 않으므로, 예산은 간격 비율로 근사하여 맞춤
+        active_demand = self._demand(active, intervals)
+        spare = self.budget_per_minute - active_demand
+        quiet_demand = self._demand(quiet, intervals)
+        active_scale = 1.0
+        if quiet_demand <= spare:
+            scale = 1.0
+        elif spare > 0:
+            scale = quiet_demand / spare
+        else:
+            scale = math.inf
+            if spare < 0:
+                active_scale = active_demand / self.budget_per_minute if self.budget_per_minute > 0 else math.inf
+        
+        for state in healthy:
+            interval = intervals[state.section]
+            if state.section in quiet_sections:
+                interval = min(interval * scale, self.max_interval)
+            elif active_scale > 1.0:
+                interval = min(interval * active_scale, self.max_interval)
+            state.interval = interval
+            if state.last_poll is not None:
+                state.next_poll = state.last_poll + state.interval
+    
+    def due(self, now: Optional[float] = None) -> List[Section]:
+        """
+        지금 수집할 섹션 목록
+        
+        Returns:
+            예정 시각이 지난 섹션 리스트 (오래 기다린 순)
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            states = sorted(self.states.values(), key=lambda state: state.next_poll)
+            return [state.section for state in states if state.next_poll <= now]
+    
+    def record(self, section: Section, articles: int, now: Optional[float] = None):
+        """
+        섹션 수집 성공 기록 (새 기사 수로 발행 속도 갱신)
+        
+        Args:
+            section: (sid1, sid2)
+            articles: 이번에 수집한 새 기사 수
+            now: 수집 시각 (기본값: 현재 시각)
+        """
+        now = self.clock() if now is None else now
+        
+        with self._lock:
+            state = self.states[section]
+            
+            # 첫 수집은 간격을 알 수 없으므로 속도 계산에서 제외
+            if state.last_poll is not None and now > state.last_poll:
+                elapsed = now - state.last_poll
+                observed = articles / elapsed
+                alpha = 1 - math.exp(-elapsed / self.tau)
+                state.rate += alpha * (observed - state.rate)
+            
+            state.last_poll = now
+            if articles:
+                state.last_article = now
+            state.errors = 0
+            state.polls += 1
+            state.articles += articles
+            self._rebalance()
+    
+    def record_error(self, section: Section, now: Optional[float] = None):
+        """섹션 수집 실패 기록 (연속 실패마다 재시도 간격 2배)"""
+        now = self.clock() if now is None else now
+        
+        with self._lock:
+            state = self.states[section]
+            state.errors += 1
+            state.polls += 1
+            state.interval = min(self.error_backoff * 2 ** (state.errors - 1), self.max_interval)
+            state.next_poll = now + state.interval
+    
+    def defer(self, section: Section, now: Optional[float] = None):
+        """
+        수집하지 않은 섹션을 최소 간격 뒤로 미루기 (발행 속도는 그대로 유지)
+        
+        다른 복제본이 담당하는 섹션에 쓰며, 담당이 바뀌면 최소 간격 안에 이어 받습니다.
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            self.states[section].next_poll = now + self.min_interval
+    
+    def record_crawl(self, sections: Iterable[Section], crawl_stats: Dict[Section, dict],
+                     now: Optional[float] = None):
+        """
+        NaverNewsCrawler.last_crawl_stats로 섹션별 결과 일괄 기록
+        
+        결과가 없는 섹션(사이클이 수집 전에 중단된 경우)은 실패로 기록하여
+        같은 섹션을 곧바로 다시 요청하지 않도록 합니다.
+        
+        Args:
+            sections: 이번 사이클에 수집하려던 섹션
+            crawl_stats: (sid1, sid2) → {'articles', 'pages', 'ok'}
+            now: 수집 시각 (기본값: 현재 시각)
+        """
+        for section in sections:
+            stats = crawl_stats.get(section)
+            if stats is not None and stats['ok']:
+                self.record(section, stats['articles'], now)
+            else:
+                self.record_error(section, now)
+    
+    def next_after(self, moment: datetime) -> datetime:
+        """가장 빠른 섹션 예정 시각 (Daemon 일정 인터페이스)"""
+        with self._lock:
+            next_poll = min((state.next_poll for state in self.states.values()), default=moment.timestamp())
+        return max(datetime.fromtimestamp(next_poll), moment)
+    
+    def snapshot(self, now: Optional[float] = None) -> List[Dict[str, object]]:
+        """
+        섹션별 일정 현황
+        
+        Returns:
+            섹션별 {'section', 'rate_per_hour', 'interval', 'next_poll_in',
+            'errors', 'polls', 'articles'} 리스트 (예정 시각 순)
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            states = sorted(self.states.values(), key=lambda state: state.next_poll)
+            return [
+                {
+                    'section': HighWaterMarkStore.section_key(*state.section),
+                    'rate_per_hour': state.rate * 3600,
+                    'interval': state.interval,
+                    'next_poll_in': max(state.next_poll - now, 0.0),
+                    'errors': state.errors,
+                    'polls': state.polls,
+                    'articles': state.articles,
+                }
+                for state in states
+            ]
+    
+    def requests_per_minute(self) -> float:
+        """현재 일정 기준 예상 분당 목록 페이지 요청 수"""
+        with self._lock:
+            return sum(
+                60 * self._pages_per_poll(state, state.interval) / state.interval
+                for state in self.states.values() if state.interval > 0
+            )
+    
+    def print_snapshot(self):
+        """섹션별 일정 현황 출력"""
+        print(f"📈 적응형 일정: 예상 분당 요청 {self.requests_per_minute():.1f}회 "
+              f"(예산 {self.budget_per_minute:g}회)")
+        for entry in self.snapshot():
+            print(f"   {entry['section']:>8}: 시간당 {entry['rate_per_hour']:.1f}건, "
+                  f"간격 {entry['interval']:.0f}초, {entry['next_poll_in']:.0f}초 후"
+                  + (f", 오류 {entry['errors']}회" if entry['errors'] else ""))
+    
+    def __str__(self) -> str:
+        return f"적응형 일정 ({len(self.states)}개 섹션, 목표 지연 {self.latency_target:g}초)"
@@ -0,0 +1,410 @@
+"""
+기사 보관소 모듈
+크롤링한 기사를 날짜별 세그먼트 파일에 압축 블록으로 추가만 하며 보관하고,
+섹션/시간 범위나 기사 ID로 필요한 블록만 풀어 조회합니다.
+
+디렉토리 구조 (날짜는 수집 시각 기준 로컬 날짜):
+
+    {root}/{YYYYMMDD}.seg  zlib 압축 블록 (블록 하나 = 같은 섹션 기사 JSON 배열)
+    {root}/{YYYYMMDD}.blk  블록 색인 (섹션, 최소/최대 수집 시각, 위치, 길이)
+    {root}/{YYYYMMDD}.ids  기사 ID → 블록 번호 (블록마다 ID 순 정렬 구간을 이어 붙임)
+
+색인 파일은 고정 길이 레코드이며 mmap으로 읽으므로 조회 시 색인 전체를
+파싱하지 않습니다. 모든 파일은 추가만 하므로 블록 하나를 기록하는 비용은
+그날 보관한 기사 수와 관계없고, ID 조회는 블록별 구간을 각각 이진 탐색합니다.
+(구간 길이는 블록 색인의 기사 수) 쓰기는 한 프로세스만 합니다.
+
+    python src/archive.py query --sid1 101 --since 7d
+    python src/archive.py get 001/0012345678
+    python src/archive.py stats
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from article import Article, ArticleKey, article_key
+
+
+# 블록 색인 레코드: 섹션(sid1), 기사 수, 최소/최대 수집 시각, 세그먼트 내 위치, 압축 길이
+_BLOCK_ENTRY = struct.Struct('<IIddQI')
+
+# 기사 ID 색인 레코드: (oid << 40 | aid), 블록 번호
+_ID_ENTRY = struct.Struct('<qI')
+
+# 날짜 파일 이름 형식
+_DAY_FORMAT = '%Y%m%d'
+
+ArchivedArticle = Tuple[float, Article]
+
+
+def _id_value(key: ArticleKey) -> int:
+    return (key[0] << 40) | key[1]
+
+
+def _day_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime(_DAY_FORMAT)
+
+
+def _read_mapped(path: Path) -> Optional[mmap.mmap]:
+    # 빈 파일은 mmap할 수 없으므로 None
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class HeadlineArchive:
+    """날짜별 압축 세그먼트 기사 보관소 클래스"""
+    
+    def __init__(self, root: str, block_size: int = 512, dedup_days: int = 7, level: int = 6):
+        """
+        Args:
+            root: 보관 디렉토리
+            block_size: 블록 하나에 모을 기사 수 (찰 때마다 압축하여 기록)
+            dedup_days: 중복 확인용으로 ID를 메모리에 올릴 최근 날짜 수
+            level: zlib 압축 수준
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.block_size = block_size
+        self.dedup_days = dedup_days
+        self.level = level
+        self._lock = threading.Lock()
+        # (날짜, sid1) → 아직 기록하지 않은 (수집 시각, 레코드) 리스트
+        self._buffers: Dict[Tuple[str, str], List[Tuple[float, dict]]] = {}
+        
+        # 날짜 → 그날 보관한 기사 ID (같은 목록 페이지를 다시 받아도 한 번만 보관,
+        # 새 날짜가 시작되면 최근 dedup_days일만 남기고 버림)
+        self._recent_ids: Dict[str, Set[int]] = {}
+        for day in self.days()[-dedup_days:]:
+            ids = _read_mapped(self._path(day, 'ids'))
+            self._recent_ids[day] = set()
+            if ids is not None:
+                with ids:
+                    self._recent_ids[day].update(value for value, _ in _ID_ENTRY.iter_unpack(ids))
+    
+    @classmethod
+    def from_env(cls, root: str) -> 'HeadlineArchive':
+        """ARCHIVE_BLOCK_SIZE 환경 변수로 생성"""
+        return cls(root, block_size=int(os.getenv('ARCHIVE_BLOCK_SIZE', 512)))
+    
+    def _path(self, day: str, kind: str) -> Path:
+        return self.root / f"{day}.{kind}"
+    
+    def days(self) -> List[str]:
+        """보관된 날짜 목록 (오름차순, YYYYMMDD)"""
+        return sorted(path.stem for path in self.root.glob('*.blk'))
+    
+    def add_many(self, news_list: Iterable[Mapping], sid1: Optional[str] = None,
+                 sid2: Optional[str] = None, crawled_at: Optional[float] = None) -> int:
+        """
+        기사 추가 (기사 ID가 있는 처음 보는 기사만)
+        
+        Args:
+            news_list: 뉴스 리스트 (dict 또는 Article)
+            sid1: 섹션 코드 (기사에 sid1이 없을 때 사용)
+            sid2: 세부 섹션 코드 (기사에 sid2가 없을 때 사용)
+            crawled_at: 수집 시각 (기본값: 현재 시각)
+        
+        Returns:
+            새로 추가한 기사 수
+        """
+        crawled_at = time.time() if crawled_at is None else crawled_at
+        day = _day_of(crawled_at)
+        added = 0
+        
+        with self._lock:
+            seen = self._recent_ids_for(day)
+            for news in news_list:
+                key = article_key(news)
+                if key is None or any(_id_value(key) in ids for ids in self._recent_ids.values()):
+                    continue
+                seen.add(_id_value(key))
+                
+                section = news.get('sid1') or sid1 or '000'
+                record = {'title': news['title'], 'oid': key[0], 'aid': key[1],
+                          'sid1': section, 'sid2': news.get('sid2') or sid2}
+                for field in ('press', 'thumbnail'):
+                    if news.get(field):
+                        record[field] = news[field]
+                
+                buffer = self._buffers.setdefault((day, section), [])
+                buffer.append((crawled_at, record))
+                added += 1
+                if len(buffer) >= self.block_size:
+                    self._write_block(day, section, self._buffers.pop((day, section)))
+        
+        return added
+    
+    def _recent_ids_for(self, day: str) -> Set[int]:
+        seen = self._recent_ids.get(day)
+        if seen is None:
+            seen = self._recent_ids[day] = set()
+            for old_day in sorted(self._recent_ids)[:-self.dedup_days]:
+                del self._recent_ids[old_day]
+        return seen
+    
+    def flush(self):
+        """모으고 있는 기사를 모두 블록으로 기록"""
+        with self._lock:
+            buffers, self._buffers = self._buffers, {}
+            for (day, section), buffer in sorted(buffers.items()):
+                self._write_block(day, section, buffer)
+    
+    def _write_block(self, day: str, section: str, buffer: List[Tuple[float, dict]]):
+        payload = json.dumps([dict(record, ts=ts) for ts, record in buffer],
+                             ensure_ascii=False, separators=(',', ':'))
+        compressed = zlib.compress(payload.encode('utf-8'), self.level)
+        
+        # 세그먼트 → ID 색인 → 블록 색인 순서로 기록 (블록 색인이 마지막이므로
+        # 중간에 중단되어도 블록 색인이 가리키는 블록과 ID 구간은 항상 완전함)
+        segment_path = self._path(day, 'seg')
+        with open(segment_path, 'ab') as f:
+            offset = f.tell()
+            f.write(compressed)
+        
+        block_path = self._path(day, 'blk')
+        blocks = _read_mapped(block_path)
+        counts = []
+        if blocks is not None:
+            with blocks:
+                counts = [entry[1] for entry in _BLOCK_ENTRY.iter_unpack(blocks)]
+        block_number = len(counts)
+        
+        # 중단된 기록이 남긴 ID 구간(블록 색인에 없는 부분)은 잘라내고 이어 붙임
+        entries = sorted((_id_value((record['oid'], record['aid'])), block_number) for _, record in buffer)
+        with open(self._path(day, 'ids'), 'ab') as f:
+            f.truncate(sum(counts) * _ID_ENTRY.size)
+            f.write(b''.join(_ID_ENTRY.pack(*entry) for entry in entries))
+        
+        timestamps = [ts for ts, _ in buffer]
+        with open(block_path, 'ab') as f:
+            f.write(_BLOCK_ENTRY.pack(int(section), len(buffer), min(timestamps), max(timestamps),
+                                      offset, len(compressed)))
+    
+    def _read_block(self, segment: mmap.mmap, entry: tuple) -> List[dict]:
+        _, _, _, _, offset, length = entry
+        return json.loads(zlib.decompress(segment[offset:offset + length]))
+    
+    @staticmethod
+    def _to_article(record: dict) -> ArchivedArticle:
+        timestamp = record.pop('ts')
+        return timestamp, Article(**record)
+    
+    def query(self, sid1: Optional[str] = None, start: Optional[float] = None,
+              end: Optional[float] = None, sid2: Optional[str] = None) -> Iterator[ArchivedArticle]:
+        """
+        섹션/수집 시각 범위로 기사 조회
+        
+        범위에 걸치는 날짜의 블록 색인만 읽고, 섹션과 시간 범위가 맞는 블록만
+        압축을 풉니다. 아직 기록하지 않은 기사도 포함합니다.
+        
+        Args:
+            sid1: 섹션 코드 (기본값: 전체)
+            start: 시작 시각 (유닉스 시간, 포함)
+            end: 끝 시각 (유닉스 시간, 제외)
+            sid2: 세부 섹션 코드 (기본값: 전체)
+        
+        Yields:
+            (수집 시각, Article) 튜플 (날짜 → 기록 순서)
+        """
+        first_day = _day_of(start) if start is not None else None
+        last_day = _day_of(end) if end is not None else None
+        section = int(sid1) if sid1 is not None else None
+        
+        def matches(timestamp: float, record: dict) -> bool:
+            return ((start is None or timestamp >= start) and (end is None or timestamp < end)
+                    and (sid2 is None or record.get('sid2') == sid2))
+        
+        for day in self.days():
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            
+            blocks = _read_mapped(self._path(day, 'blk'))
+            if blocks is None:
+                continue
+            with blocks:
+                entries = [
+                    entry for entry in _BLOCK_ENTRY.iter_unpack(blocks)
+                    if (section is None or entry[0] == section)
+                    and (start is None or entry[3] >= start) and (end is None or entry[2] < end)
+                ]
+            if not entries:
+                continue
+            
+            segment = _read_mapped(self._path(day, 'seg'))
+            with segment:
+                for entry in entries:
+                    for record in self._read_block(segment, entry):
+                        if matches(record['ts'], record):
+                            yield self._to_article(record)
+        
+        with self._lock:
+            pending = [
+                (timestamp, record)
+                for (_, buffered_sid1), buffer in sorted(self._buffers.items())
+                if sid1 is None or buffered_sid1 == sid1
+                for timestamp, record in buffer
+            ]
+        for timestamp, record in pending:
+            if matches(timestamp, record):
+                yield timestamp, Article(**record)
+    
+    def _find_block(self, day: str, value: int) -> Optional[int]:
+        """ID 색인의 블록별 정렬 구간을 최근 블록부터 이진 탐색 (기사가 든 블록 번호, 없으면 None)"""
+        blocks = _read_mapped(self._path(day, 'blk'))
+        ids = _read_mapped(self._path(day, 'ids'))
+        if blocks is None or ids is None:
+            return None
+        
+        with blocks, ids:
+            runs = []
+            start = 0
+            for entry in _BLOCK_ENTRY.iter_unpack(blocks):
+                runs.append((start, entry[1]))
+                start += entry[1]
+            
+            for block, (start, count) in reversed(list(enumerate(runs))):
+                index = start + bisect_left(range(count), value,
+                                            key=lambda i: _ID_ENTRY.unpack_from(ids, (start + i) * _ID_ENTRY.size)[0])
+                if index < start + count and _ID_ENTRY.unpack_from(ids, index * _ID_ENTRY.size)[0] == value:
+                    return block
+        return None
+    
+    def get(self, oid: int, aid: int) -> Optional[ArchivedArticle]:
+        """
+        기사 ID로 조회 (최근 날짜부터 ID 색인을 이진 탐색하여 블록 하나만 풀기)
+        
+        Returns:
+            (수집 시각, Article) 튜플 (없으면 None)
+        """
+        value = _id_value((oid, aid))
+        
+        with self._lock:
+            for buffer in self._buffers.values():
+                for timestamp, record in buffer:
+                    if (record['oid'], record['aid']) == (oid, aid):
+                        return timestamp, Article(**record)
+        
+        for day in reversed(self.days()):
+            block = self._find_block(day, value)
+            if block is None:
+                continue
+            
+            blocks = _read_mapped(self._path(day, 'blk'))
+            with blocks:
+                entry = _BLOCK_ENTRY.unpack_from(blocks, block * _BLOCK_ENTRY.size)
+            segment = _read_mapped(self._path(day, 'seg'))
+            with segment:
+                for record in self._read_block(segment, entry):
+                    if (record['oid'], record['aid']) == (oid, aid):
+                        return self._to_article(record)
+        
+        return None
+    
+    def stats(self) -> Dict[str, int]:
+        """보관 통계 (날짜 수, 블록 수, 기사 수, 압축 크기, 기록 대기 기사 수)"""
+        stats = {'days': 0, 'blocks': 0, 'articles': 0, 'bytes': 0, 'pending': 0}
+        for day in self.days():
+            stats['days'] += 1
+            with open(self._path(day, 'blk'), 'rb') as f:
+                for entry in _BLOCK_ENTRY.iter_unpack(f.read()):
+                    stats['blocks'] += 1
+                    stats['articles'] += entry[1]
+                    stats['bytes'] += entry[5]
+        with self._lock:
+            stats['pending'] = sum(len(buffer) for buffer in self._buffers.values())
+        return stats
+
+
+def parse_time(text: str, now: Optional[datetime] = None) -> float:
+    """
+    CLI 시각 인자 파싱
+    
+    Args:
+        text: 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM' 또는 현재 시각 기준 상대 시간 ('7d', '12h', '30m')
+    
+    Returns:
+        유닉스 시간
+    """
+    now = now or datetime.now()
+    units = {'d': 'days', 'h': 'hours', 'm': 'minutes'}
+    if text[:-1].isdigit() and text[-1] in units:
+        return (now - timedelta(**{units[text[-1]]: int(text[:-1])})).timestamp()
+    
+    for fmt in ('%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            pass
+    raise ValueError(f"시각 형식을 알 수 없습니다: {text}")
+
+
+def _print_article(timestamp: float, article: Article, as_json: bool):
+    if as_json:
+        print(json.dumps(dict(article.to_dict(), crawled_at=timestamp), ensure_ascii=False))
+    else:
+        crawled = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+        print(f"{crawled} [{article.sid1}] {article.title} {article.url}")
+
+
+def main():
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description="기사 보관소 조회")
+    arg_parser.add_argument('--dir', default=os.getenv('ARCHIVE_DIR'), required=not os.getenv('ARCHIVE_DIR'),
+                            help="보관 디렉토리 (기본값: ARCHIVE_DIR)")
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+    
+    query_parser = subparsers.add_parser('query', help="섹션/수집 시각 범위로 조회")
+    query_parser.add_argument('--sid1')
+    query_parser.add_argument('--sid2')
+    query_parser.add_argument('--since', help="시작 시각 (YYYY-MM-DD[ HH:MM] 또는 7d/12h/30m)")
+    query_parser.add_argument('--until', help="끝 시각 (제외)")
+    query_parser.add_argument('--limit', type=int)
+    query_parser.add_argument('--json', action='store_true', help="JSON 줄 형식으로 출력")
+    
+    get_parser = subparsers.add_parser('get', help="기사 ID(oid/aid)로 조회")
+    get_parser.add_argument('article_id', help="예: 001/0012345678")
+    get_parser.add_argument('--json', action='store_true')
+    
+    subparsers.add_parser('stats', help="보관 통계 출력")
+    args = arg_parser.parse_args()
+    
+    archive = HeadlineArchive(args.dir)
+    
+    if args.command == 'query':
+        results = archive.query(
+            sid1=args.sid1, sid2=args.sid2,
+            start=parse_time(args.since) if args.since else None,
+            end=parse_time(args.until) if args.until else None
+        )
+        for count, (timestamp, article) in enumerate(results):
+            if args.limit is not None and count >= args.limit:
+                break
+            _print_article(timestamp, article, args.json)
+    elif args.command == 'get':
+        oid, aid = (int(part) for part in args.article_id.split('/'))
+        found = archive.get(oid, aid)
+        if found is None:
+            print(f"❌ 보관된 기사가 없습니다: {args.article_id}")
+            sys.exit(1)
+        _print_article(*found, args.json)
+    else:
+        stats = archive.stats()
+        print(f"🗄️ 보관 기사 {stats['articles']}개 ({stats['days']}일, 블록 {stats['blocks']}개, "
+              f"압축 {stats['bytes'] / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    main()
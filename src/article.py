@@ -0,0 +1,213 @@
+"""
+기사 식별 모듈
+네이버 뉴스 기사 URL에서 언론사 ID(oid)와 기사 ID(aid)를 추출하고,
+기사 하나를 적은 메모리로 표현하는 Article 레코드를 제공합니다.
+"""
+
+import re
+import sys
+from collections.abc import Mapping
+from typing import Iterator, Optional, Tuple
+
+
+# /article/{oid}/{aid} 형식 (news.naver.com, n.news.naver.com/mnews 공통)
+_ARTICLE_PATH = re.compile(r'/article/(\d+)/(\d+)')
+
+# 구형 read.naver?oid=...&aid=... 형식
+_ARTICLE_QUERY_OID = re.compile(r'[?&]oid=(\d+)')
+_ARTICLE_QUERY_AID = re.compile(r'[?&]aid=(\d+)')
+
+ArticleKey = Tuple[int, int]
+
+# (oid, aid)로 만드는 기사 URL (리다이렉트 없이 바로 열리는 모바일 기사 페이지)
+ARTICLE_URL_FORMAT = "https://n.news.naver.com/mnews/article/{oid:03d}/{aid:010d}"
+
+
+def parse_article_key(url: str) -> Optional[ArticleKey]:
+    """
+    기사 URL에서 (oid, aid) 추출
+    
+    Args:
+        url: 기사 URL
+    
+    Returns:
+        (언론사 ID, 기사 ID) 튜플 (기사 URL이 아니면 None)
+    """
+    match = _ARTICLE_PATH.search(url)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    
+    oid = _ARTICLE_QUERY_OID.search(url)
+    aid = _ARTICLE_QUERY_AID.search(url)
+    if oid and aid:
+        return int(oid.group(1)), int(aid.group(1))
+    
+    return None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+class Article(Mapping):
+    """
+    기사 레코드 (불변, __slots__)
+    
+    URL 대신 정수 (oid, aid)를 저장하고 URL은 필요할 때 만듭니다. 섹션/언론사
+    문자열은 intern하여 같은 값을 공유합니다. 기사 ID를 알 수 없는 URL은
+    그대로 보관합니다.
+    
+    Mapping이므로 기존 dict 기사처럼 article['title'], article.get('press'),
+    dict(article)로 사용할 수 있습니다. 값이 None인 선택 필드는 키에 포함되지
+    않습니다.
+    """
+    
+    __slots__ = ('title', 'oid', 'aid', 'sid1', 'sid2', 'press', 'thumbnail', 'outlets',
+                 'published', 'lead', '_url')
+    
+    _OPTIONAL_FIELDS = ('sid1', 'sid2', 'press', 'thumbnail', 'outlets', 'published', 'lead')
+    
+    def __init__(self, title: str, oid: Optional[int] = None, aid: Optional[int] = None,
+                 sid1: Optional[str] = None, sid2: Optional[str] = None,
+                 press: Optional[str] = None, thumbnail: Optional[str] = None,
+                 outlets: Optional[int] = None, published: Optional[str] = None,
+                 lead: Optional[str] = None, url: Optional[str] = None):
+        """
+        Args:
+            title: 기사 제목
+            oid: 언론사 ID
+            aid: 기사 ID
+            sid1: 섹션 코드
+            sid2: 세부 섹션 코드
+            press: 언론사 이름
+            thumbnail: 썸네일 이미지 URL
+            outlets: 같은 기사를 보도한 언론사 수 (묶음 대표 기사)
+            published: 기사 입력 시각 ('YYYY-MM-DD HH:MM:SS', 상세 페이지에서 추출)
+            lead: 기사 첫 문단 요약 (상세 페이지에서 추출)
+            url: oid/aid가 없을 때 사용할 URL
+        """
+        if (oid is None or aid is None) and not url:
+            raise ValueError("oid/aid 또는 url이 필요합니다.")
+        
+        setattr_ = object.__setattr__
+        setattr_(self, 'title', title)
+        setattr_(self, 'oid', oid)
+        setattr_(self, 'aid', aid)
+        setattr_(self, 'sid1', _intern(sid1))
+        setattr_(self, 'sid2', _intern(sid2))
+        setattr_(self, 'press', _intern(press))
+        setattr_(self, 'thumbnail', thumbnail)
+        setattr_(self, 'outlets', outlets)
+        setattr_(self, 'published', published)
+        setattr_(self, 'lead', lead)
+        setattr_(self, '_url', None if oid is not None and aid is not None else url)
+    
+    @classmethod
+    def from_url(cls, title: str, url: str, **fields) -> 'Article':
+        """기사 URL로 생성 (oid/aid를 추출할 수 없으면 URL을 그대로 보관)"""
+        key = parse_article_key(url)
+        if key is None:
+            return cls(title, url=url, **fields)
+        return cls(title, key[0], key[1], **fields)
+    
+    @classmethod
+    def from_mapping(cls, news: Mapping, **overrides) -> 'Article':
+        """
+        dict 기사(또는 Article)로 생성
+        
+        Args:
+            news: 'title', 'url'과 선택 필드를 가진 매핑
+            **overrides: 바꿀 선택 필드 (예: sid1='001')
+        """
+        if isinstance(news, Article) and not overrides:
+            return news
+        fields = {name: news.get(name) for name in cls._OPTIONAL_FIELDS}
+        fields.update(overrides)
+        return cls.from_url(news['title'], news['url'], **fields)
+    
+    @property
+    def key(self) -> Optional[ArticleKey]:
+        """(oid, aid) 튜플 (기사 ID를 알 수 없으면 None)"""
+        if self._url is not None:
+            return None
+        return self.oid, self.aid
+    
+    @property
+    def url(self) -> str:
+        """기사 URL"""
+        if self._url is not None:
+            return self._url
+        return ARTICLE_URL_FORMAT.format(oid=self.oid, aid=self.aid)
+    
+    def replace(self, **fields) -> 'Article':
+        """일부 필드를 바꾼 새 Article"""
+        values = {name: getattr(self, name) for name in ('title', 'oid', 'aid') + self._OPTIONAL_FIELDS}
+        values['url'] = self._url
+        values.update(fields)
+        return Article(**values)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Article은 변경할 수 없습니다. replace()를 사용하세요.")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Article은 변경할 수 없습니다.")
+    
+    def __getitem__(self, name: str):
+        if name == 'title':
+            return self.title
+        if name == 'url':
+            return self.url
+        if name in self._OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                return value
+        raise KeyError(name)
+    
+    def __contains__(self, name) -> bool:
+        if name == 'title' or name == 'url':
+            return True
+        return name in self._OPTIONAL_FIELDS and getattr(self, name) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        yield 'title'
+        yield 'url'
+        for name in self._OPTIONAL_FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+    
+    def __len__(self) -> int:
+        return 2 + sum(getattr(self, name) is not None for name in self._OPTIONAL_FIELDS)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Article):
+            return (self.key or self._url) == (other.key or other._url) and \
+                all(getattr(self, name) == getattr(other, name) for name in ('title',) + self._OPTIONAL_FIELDS)
+        return Mapping.__eq__(self, other)
+    
+    def __hash__(self) -> int:
+        return hash(self.key or self._url)
+    
+    def __reduce__(self):
+        return (Article, (self.title, self.oid, self.aid, self.sid1, self.sid2,
+                          self.press, self.thumbnail, self.outlets, self.published, self.lead,
+                          self._url))
+    
+    def __repr__(self) -> str:
+        return f"Article({self.title!r}, {self.url!r})"
+    
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 dict"""
+        return dict(self)
+
+
+def article_key(news: Mapping) -> Optional[ArticleKey]:
+    """기사(dict 또는 Article)의 (oid, aid) (Article은 URL을 다시 파싱하지 않음)"""
+    if isinstance(news, Article):
+        return news.key
+    return parse_article_key(news['url'])
+
+
+def outlets_suffix(news: Mapping) -> str:
+    """묶음 대표 기사 제목 뒤에 붙일 언론사 수 (예: ' (3개 언론사)')"""
+    outlets = news.get('outlets')
+    return f" ({outlets}개 언론사)" if outlets and outlets > 1 else ''
@@ -0,0 +1,221 @@
+"""
+기사 묶음 모듈
+여러 섹션/언론사에 올라온 같은 기사(비슷한 제목)를 하나로 묶습니다.
+
+제목을 정규화한 뒤 글자 n-gram으로 MinHash 서명을 만들고, LSH 밴딩으로
+같은 버킷에 들어간 기사끼리만 비교하므로 모든 쌍을 비교하지 않고
+기사 수에 거의 비례하는 시간에 묶을 수 있습니다. 계산은 NumPy 배열로
+한 번에 처리합니다.
+"""
+
+import os
+import re
+from collections.abc import Mapping
+from typing import List, Sequence
+
+import numpy as np
+
+from article import Article, article_key
+
+
+# n-gram 해시를 줄이는 메르센 소수
+_PRIME = np.uint64((1 << 31) - 1)
+
+# MinHash 해시 함수 ((a * x + b) mod 2^64) >> 32 의 출력 비트 수와 최댓값
+_SHIFT = np.uint64(32)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# n-gram 해시 누적에 사용하는 진법 (유니코드 코드 포인트 범위 이상)
+_BASE = np.uint64(1 << 21)
+
+# 서명 계산 시 한 번에 처리할 n-gram 수 (메모리 상한)
+_CHUNK = 32768
+
+# [속보], (종합), <사진> 같은 머리말/꼬리말
+_BRACKETS = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>|【[^】]*】|\{[^}]*\}')
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_title(title: str) -> str:
+    """괄호 머리말, 공백, 문장 부호를 제거한 비교용 제목"""
+    return _NON_WORD.sub('', _BRACKETS.sub(' ', title).lower())
+
+
+class StoryClusterer:
+    """MinHash + LSH 기반 비슷한 제목 묶음 클래스"""
+    
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16,
+                 ngram: int = 2, seed: int = 1):
+        """
+        Args:
+            threshold: 같은 기사로 볼 추정 Jaccard 유사도 하한
+            num_perm: MinHash 해시 함수 수 (bands로 나누어 떨어져야 함)
+            bands: LSH 밴드 수 (많을수록 유사도가 낮은 쌍도 후보가 됨)
+            ngram: 글자 n-gram 길이 (한글은 음절 2개가 적당)
+            seed: 해시 함수 난수 시드
+        
+        Raises:
+            ValueError: num_perm이 bands로 나누어 떨어지지 않는 경우
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands로 나누어 떨어져야 합니다.")
+        
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = ngram
+        
+        # multiply-shift 해시 함수 (a는 홀수), 나머지 연산 없이 uint64 곱셈 오버플로 사용
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+        # 밴드 안의 행들을 버킷 키 하나로 합칠 때 쓰는 계수
+        self._band_mix = rng.integers(0, 1 << 63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+    
+    @classmethod
+    def from_env(cls) -> 'StoryClusterer':
+        """CLUSTER_THRESHOLD 환경 변수로 생성"""
+        return cls(threshold=float(os.getenv('CLUSTER_THRESHOLD', 0.5)))
+    
+    def _shingles(self, titles: Sequence[str]):
+        # 모든 제목의 n-gram 해시를 한 배열로 계산 (owners: 해시가 속한 제목 번호)
+        normalized = [normalize_title(title) for title in titles]
+        lengths = np.fromiter((len(text) for text in normalized), dtype=np.int64, count=len(normalized))
+        codes = np.frombuffer(''.join(normalized).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        
+        # n보다 짧은 제목은 제목 전체를 n-gram 하나로 취급
+        counts = np.maximum(lengths - self.ngram + 1, (lengths > 0).astype(np.int64))
+        owners = np.repeat(np.arange(len(normalized)), counts)
+        if not len(owners):
+            return np.zeros(0, dtype=np.uint64), owners, counts > 0
+        
+        title_starts = np.cumsum(lengths) - lengths
+        first_shingle = np.cumsum(counts) - counts
+        positions = title_starts[owners] + np.arange(len(owners)) - first_shingle[owners]
+        widths = np.minimum(self.ngram, lengths[owners])
+        
+        hashes = np.zeros(len(owners), dtype=np.uint64)
+        last = len(codes) - 1
+        for offset in range(self.ngram):
+            valid = offset < widths
+            chars = codes[np.minimum(positions + offset, last)]
+            hashes = np.where(valid, (hashes * _BASE + chars) % _PRIME, hashes)
+        
+        return hashes, owners, counts > 0
+    
+    def signatures(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        제목별 MinHash 서명
+        
+        Returns:
+            (제목 수, num_perm) uint32 배열 (비교할 글자가 없는 제목은 모두 최댓값)
+        """
+        hashes, owners, _ = self._shingles(titles)
+        return self._signatures(hashes, owners, len(titles))
+    
+    def _signatures(self, hashes: np.ndarray, owners: np.ndarray, count: int) -> np.ndarray:
+        signatures = np.full((self.num_perm, count), _MAX_HASH, dtype=np.uint64)
+        
+        # owners는 정렬되어 있으므로 구간별 최솟값(reduceat)으로 제목별 최솟값 계산
+        with np.errstate(over='ignore'):
+            for start in range(0, len(hashes), _CHUNK):
+                chunk_owners = owners[start:start + _CHUNK]
+                values = (self._a * hashes[start:start + _CHUNK] + self._b) >> _SHIFT
+                boundaries = np.flatnonzero(np.r_[True, chunk_owners[1:] != chunk_owners[:-1]])
+                columns = chunk_owners[boundaries]
+                # 청크 경계에 걸친 제목은 이전 청크의 최솟값과 다시 비교
+                signatures[:, columns] = np.minimum(signatures[:, columns],
+                                                    np.minimum.reduceat(values, boundaries, axis=1))
+        
+        return np.ascontiguousarray(signatures.T, dtype=np.uint32)
+    
+    def _candidate_pairs(self, signatures: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        # 밴드별로 같은 버킷에 들어간 기사를 버킷의 첫 기사와 짝지음
+        count = len(signatures)
+        pairs = []
+        
+        for band in range(self.bands):
+            block = signatures[:, band * self.rows:(band + 1) * self.rows].astype(np.uint64)
+            # 밴드의 행들을 64비트 키 하나로 합침 (충돌은 아래 유사도 검증에서 걸러짐)
+            with np.errstate(over='ignore'):
+                keys = block @ self._band_mix
+            
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            is_first = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+            leaders = order[np.maximum.accumulate(np.where(is_first, np.arange(count), 0))]
+            
+            mask = ~is_first & valid[order] & valid[leaders]
+            pairs.append(np.stack((leaders[mask], order[mask]), axis=1))
+        
+        pairs = np.concatenate(pairs) if pairs else np.zeros((0, 2), dtype=np.int64)
+        return np.unique(pairs, axis=0)
+    
+    def cluster(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        제목 묶음 번호 계산
+        
+        Args:
+            titles: 제목 리스트
+        
+        Returns:
+            제목별 묶음 번호 배열 (묶음에서 가장 앞에 있는 제목의 위치)
+        """
+        count = len(titles)
+        labels = np.arange(count)
+        if count < 2:
+            return labels
+        
+        hashes, owners, valid = self._shingles(titles)
+        signatures = self._signatures(hashes, owners, count)
+        pairs = self._candidate_pairs(signatures, valid)
+        
+        # 후보 쌍 중 서명 일치 비율(추정 Jaccard 유사도)이 임계값 이상인 쌍만 연결
+        if len(pairs):
+            similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+            pairs = pairs[similarity >= self.threshold]
+        
+        # 연결 요소: 양 끝의 작은 번호를 반복 전파 (포인터 점프로 빠르게 수렴)
+        left, right = pairs[:, 0], pairs[:, 1]
+        while len(pairs):
+            previous = labels.copy()
+            np.minimum.at(labels, right, labels[left])
+            np.minimum.at(labels, left, labels[right])
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                break
+        
+        return labels
+    
+    def collapse(self, news_list: Sequence[Mapping]) -> List[Mapping]:
+        """
+        같은 기사를 하나로 묶은 뉴스 리스트
+        
+        묶음마다 가장 앞에 있는 기사를 남기고, 둘 이상의 언론사가 보도했으면
+        언론사 수를 'outlets'에 기록합니다.
+        
+        Args:
+            news_list: 뉴스 리스트 (dict 또는 Article)
+        
+        Returns:
+            입력 순서를 유지한 대표 기사 리스트
+        """
+        labels = self.cluster([news['title'] for news in news_list])
+        outlets = {}
+        
+        for news, label in zip(news_list, labels.tolist()):
+            key = article_key(news)
+            outlet = news.get('press') or (key[0] if key else news['url'])
+            outlets.setdefault(label, set()).add(outlet)
+        
+        collapsed = []
+        for index, (news, label) in enumerate(zip(news_list, labels.tolist())):
+            if label != index:
+                continue
+            count = len(outlets[label])
+            if count > 1:
+                news = news.replace(outlets=count) if isinstance(news, Article) else {**news, 'outlets': count}
+            collapsed.append(news)
+        
+        return collapsed
@@ -0,0 +1,309 @@
+"""
+복제본 조정 모듈
+여러 컨테이너(복제본)가 같은 SQLite 파일(공유 볼륨)을 통해 섹션 수집을
+나누고, 같은 메시지를 같은 수신자에게 한 번만 보내도록 조정합니다.
+
+- 각 복제본은 주기적으로 하트비트를 기록하고, heartbeat_ttl 안에 하트비트가
+  있는 복제본만 살아 있는 것으로 봅니다.
+- 섹션은 살아 있는 복제본 사이에 rendezvous 해싱으로 나눕니다. 복제본이
+  죽으면 그 섹션만 남은 복제본들에게 다시 나뉩니다.
+- 메시지를 보내기 전에 (메시지 다이제스트, 수신자) 임대를 잡고, 보내는
+  동안 임대를 갱신하며, 보내면 완료로 기록합니다. 다른 복제본은 완료된 메시지는 건너뛰고, 임대 중인
+  메시지는 보내지 않은 것으로 보고 나중에 다시 시도합니다.
+"""
+
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+from crawler import Section
+from metrics import get_metrics
+
+
+def default_replica_id() -> str:
+    """호스트 이름과 프로세스 ID로 만든 복제본 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _score(replica_id: str, section: Section) -> int:
+    sid1, sid2 = section
+    digest = hashlib.blake2b(f"{replica_id}|{sid1}/{sid2 or ''}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def lease_key(payload: str, recipient_id: str) -> str:
+    """(메시지 다이제스트, 수신자) 임대 키"""
+    return f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}:{recipient_id}"
+
+
+class Coordinator:
+    """SQLite 기반 복제본 조정 클래스"""
+    
+    def __init__(self, path: str, replica_id: Optional[str] = None, heartbeat_ttl: float = 60.0,
+                 lease_ttl: float = 120.0):
+        """
+        Args:
+            path: 모든 복제본이 공유하는 SQLite 파일 경로
+            replica_id: 이 복제본의 ID (기본값: 호스트 이름-프로세스 ID)
+            heartbeat_ttl: 이 시간 동안 하트비트가 없으면 죽은 복제본으로 간주 (초)
+            lease_ttl: 전송 임대 유효 시간 (초, 보내는 동안 1/3마다 갱신하며 보내는 중에 죽으면
+                이후 다른 복제본이 보냄)
+        """
+        self.path = path
+        self.replica_id = replica_id or default_replica_id()
+        self.heartbeat_ttl = heartbeat_ttl
+        self.lease_ttl = lease_ttl
+        self._lock = threading.Lock()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS replicas ("
+            " id TEXT PRIMARY KEY,"
+            " started_at REAL NOT NULL,"
+            " heartbeat_at REAL NOT NULL"
+            ")"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            " key TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " done INTEGER NOT NULL DEFAULT 0,"
+            " updated_at REAL NOT NULL"
+            ")"
+        )
+    
+    @classmethod
+    def from_env(cls, path: str) -> 'Coordinator':
+        """REPLICA_ID, COORDINATION_HEARTBEAT_TTL, COORDINATION_LEASE_TTL 환경 변수로 생성"""
+        return cls(
+            path,
+            replica_id=os.getenv('REPLICA_ID') or None,
+            heartbeat_ttl=float(os.getenv('COORDINATION_HEARTBEAT_TTL', 60)),
+            lease_ttl=float(os.getenv('COORDINATION_LEASE_TTL', 120))
+        )
+    
+    def heartbeat(self):
+        """하트비트 기록 (처음이면 복제본 등록)"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO replicas (id, started_at, heartbeat_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+                (self.replica_id, now, now)
+            )
+    
+    def start_heartbeat(self, interval: Optional[float] = None) -> 'Coordinator':
+        """
+        백그라운드 스레드에서 주기적으로 하트비트 기록
+        
+        Args:
+            interval: 기록 간격 (초, 기본값: heartbeat_ttl의 1/3)
+        """
+        interval = interval or self.heartbeat_ttl / 3
+        self.heartbeat()
+        
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.heartbeat()
+                except sqlite3.Error as e:
+                    print(f"⚠️ 하트비트 기록 실패: {e}")
+        
+        self._stop.clear()
+        self._heartbeat_thread = threading.Thread(target=run, daemon=True)
+        self._heartbeat_thread.start()
+        return self
+    
+    def leave(self):
+        """하트비트를 멈추고 복제본 등록 해제 (남은 복제본이 바로 섹션을 나눠 가짐)"""
+        self._stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        with self._lock:
+            self.conn.execute("DELETE FROM replicas WHERE id = ?", (self.replica_id,))
+    
+    def live_replicas(self) -> List[str]:
+        """살아 있는 복제본 ID 목록 (정렬)"""
+        cutoff = time.time() - self.heartbeat_ttl
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id FROM replicas WHERE heartbeat_at >= ? ORDER BY id", (cutoff,)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def owner(self, section: Section, replicas: Optional[List[str]] = None) -> str:
+        """섹션을 담당하는 복제본 ID (rendezvous 해싱: 점수가 가장 높은 복제본)"""
+        replicas = replicas if replicas is not None else self.live_replicas()
+        if not replicas:
+            return self.replica_id
+        return max(replicas, key=lambda replica_id: _score(replica_id, section))
+    
+    def shard(self, sections: Iterable[Section]) -> List[Section]:
+        """
+        이 복제본이 수집할 섹션만 골라내기 (하트비트도 함께 기록)
+        
+        Args:
+            sections: 전체 수집 대상 섹션
+        
+        Returns:
+            이 복제본이 담당하는 섹션 리스트 (입력 순서 유지)
+        """
+        self.heartbeat()
+        replicas = self.live_replicas()
+        if self.replica_id not in replicas:
+            replicas.append(self.replica_id)
+        return [section for section in sections if self.owner(section, replicas) == self.replica_id]
+    
+    def acquire(self, key: str) -> bool:
+        """
+        전송 임대 획득
+        
+        처음 보는 키이거나, 완료되지 않은 채 임대가 만료된 키만 획득합니다.
+        
+        Returns:
+            획득 여부 (완료되었거나 다른 복제본이 임대 중이면 False)
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                updated = self.conn.execute(
+                    "INSERT INTO leases (key, owner, expires_at, updated_at) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at,"
+                    " updated_at = excluded.updated_at"
+                    " WHERE leases.done = 0 AND (leases.expires_at < ? OR leases.owner = excluded.owner)",
+                    (key, self.replica_id, now + self.lease_ttl, now, now)
+                ).rowcount
+            finally:
+                self.conn.execute("COMMIT")
+        return updated > 0
+    
+    def renew(self, key: str) -> bool:
+        """
+        보내는 중인 임대 연장 (재시도로 전송이 lease_ttl보다 길어져도 넘겨주지 않음)
+        
+        Returns:
+            연장 여부 (임대를 이미 잃었으면 False)
+        """
+        with self._lock:
+            updated = self.conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE key = ? AND owner = ? AND done = 0",
+                (time.time() + self.lease_ttl, key, self.replica_id)
+            ).rowcount
+        return updated > 0
+    
+    def complete(self, key: str) -> bool:
+        """
+        전송 완료 기록 (이후 어떤 복제본도 같은 키로 보내지 않음)
+        
+        Returns:
+            기록 여부 (보내는 사이 임대를 잃어 기록하지 못했으면 False,
+            다른 복제본이 같은 메시지를 보냈을 수 있음)
+        """
+        with self._lock:
+            updated = self.conn.execute(
+                "UPDATE leases SET done = 1, updated_at = ? WHERE key = ? AND owner = ?",
+                (time.time(), key, self.replica_id)
+            ).rowcount
+        if not updated:
+            print(f"⚠️ 전송 임대를 잃어 완료를 기록하지 못했습니다: {key} (복제본 {self.replica_id})")
+            get_metrics().inc('send_lease_total', result='lost')
+        return updated > 0
+    
+    def _renew_while(self, key: str, done: threading.Event):
+        interval = max(self.lease_ttl / 3, 0.01)
+        while not done.wait(interval):
+            try:
+                if not self.renew(key):
+                    return
+            except sqlite3.Error as e:
+                print(f"⚠️ 전송 임대 갱신 실패: {e}")
+    
+    def release(self, key: str):
+        """보내지 못한 임대 반환 (다른 복제본이나 다음 사이클이 바로 보낼 수 있음)"""
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM leases WHERE key = ? AND owner = ? AND done = 0", (key, self.replica_id)
+            )
+    
+    def is_done(self, key: str) -> bool:
+        """전송 완료로 기록된 키인지 여부"""
+        with self._lock:
+            row = self.conn.execute("SELECT done FROM leases WHERE key = ?", (key,)).fetchone()
+        return bool(row and row[0])
+    
+    def send_once(self, payload: str, recipient_id: str, send: Callable[[], bool]) -> Optional[bool]:
+        """
+        (메시지, 수신자)마다 복제본 전체에서 한 번만 전송
+        
+        보내는 동안에는 임대를 계속 갱신하므로 재시도가 lease_ttl보다 길어져도
+        다른 복제본이 넘겨받지 않습니다. 다른 복제본이 임대 중인 메시지는 그 복제본이 보내다 죽었을 수도 있으므로
+        보낸 것으로 치지 않습니다. 호출자는 보내지 않은 것으로 보고 나중에 다시
+        시도하며, 그때 완료되어 있으면 건너뛰고 임대가 만료되었으면 넘겨받아 보냅니다.
+        
+        Args:
+            payload: 인코딩된 메시지
+            recipient_id: 수신자 ID
+            send: 실제 전송 함수
+        
+        Returns:
+            True: 보냈거나 이미 완료된 메시지, False: 전송 실패,
+            None: 다른 복제본이 보내는 중 (아직 보내지 않은 것으로 취급)
+        """
+        key = lease_key(payload, recipient_id)
+        if not self.acquire(key):
+            if self.is_done(key):
+                get_metrics().inc('send_lease_total', result='skipped')
+                return True
+            get_metrics().inc('send_lease_total', result='in_progress')
+            return None
+        
+        done = threading.Event()
+        renewer = threading.Thread(target=self._renew_while, args=(key, done), daemon=True)
+        renewer.start()
+        try:
+            sent = send()
+        except BaseException:
+            self.release(key)
+            raise
+        finally:
+            done.set()
+            renewer.join()
+        
+        if sent:
+            self.complete(key)
+        else:
+            self.release(key)
+        get_metrics().inc('send_lease_total', result='sent' if sent else 'released')
+        return sent
+    
+    def purge(self, ttl_seconds: float) -> int:
+        """
+        오래된 임대 기록과 죽은 복제본 삭제
+        
+        Args:
+            ttl_seconds: 완료 기록 보관 기간 (초, 이 기간 동안 같은 메시지는 다시 보내지 않음)
+        
+        Returns:
+            삭제된 임대 기록 수
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute("DELETE FROM replicas WHERE heartbeat_at < ?", (now - self.heartbeat_ttl * 10,))
+            return self.conn.execute(
+                "DELETE FROM leases WHERE updated_at < ? AND (done = 1 OR expires_at < ?)",
+                (now - ttl_seconds, now)
+            ).rowcount
+    
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
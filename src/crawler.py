@@ -3,81 +3,592 @@
 네이버 뉴스 속보 페이지에서 상위 10개 기사를 추출합니다.
 """
 
+import hashlib
+import os
+import threading
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, List, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+from http_client import HttpTransport, get_transport
+from disk_cache import DiskLRUCache
+from article import Article, outlets_suffix, parse_article_key
+from watermark import HighWaterMarkStore
+from archive import HeadlineArchive
+from metrics import get_metrics
+
+
+# 섹션(sid1) 코드
+SECTIONS = {
+    '100': '정치',
+    '101': '경제',
+    '102': '사회',
+    '103': '생활/문화',
+    '104': '세계',
+    '105': 'IT/과학',
+}
+
+# 세부 섹션(sid2) 코드
+SUBSECTIONS = {
+    '100': ['264', '265', '268', '266', '267', '269'],
+    '101': ['259', '258', '261', '771', '260', '262', '310', '263'],
+    '102': ['249', '250', '251', '254', '252', '59b', '255', '256', '276', '257'],
+    '103': ['241', '239', '240', '237', '238', '376', '242', '243', '244', '248', '245'],
+    '104': ['231', '232', '233', '234', '322'],
+    '105': ['731', '226', '227', '230', '732', '729', '283', '228'],
+}
+
+Section = Tuple[str, Optional[str]]
+
+
+def all_sections(include_subsections: bool = True) -> List[Section]:
+    """
+    크롤링 대상 섹션 목록 생성
+
+    Args:
+        include_subsections: 세부 섹션(sid2) 포함 여부
+
+    Returns:
+        (sid1, sid2) 튜플 리스트 (sid2가 None이면 섹션 전체 목록)
+    """
+    sections = []
+    for sid1 in SECTIONS:
+        sections.append((sid1, None))
+        if include_subsections:
+            sections.extend((sid1, sid2) for sid2 in SUBSECTIONS[sid1])
+    return sections
+
+
+def parse_sections(text: str) -> List[Section]:
+    """
+    섹션 목록 문자열 파싱
+    
+    Args:
+        text: 쉼표로 구분한 섹션 (예: '001,100,101/259', 'all'은 전체 섹션)
+    
+    Returns:
+        (sid1, sid2) 튜플 리스트
+    """
+    if text.strip() == 'all':
+        return all_sections()
+    
+    sections = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        sid1, _, sid2 = part.partition('/')
+        sections.append((sid1, sid2 or None))
+    return sections
 
 
 class NaverNewsCrawler:
     """네이버 뉴스 크롤러 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8, per_host_limit: int = 4,
+                 transport: Optional[HttpTransport] = None,
+                 cache: Optional[DiskLRUCache] = None,
+                 parser: Optional[str] = None,
+                 watermarks: Optional[HighWaterMarkStore] = None,
+                 archive: Optional[HeadlineArchive] = None):
+        """
+        Args:
+            max_concurrency: 동시에 진행할 전체 요청 수 상한
+            per_host_limit: 호스트별 동시 요청 수 상한
+            transport: HTTP 전송 객체 (기본값: 프로세스 공용 transport)
+            cache: 목록 페이지 조건부 요청 캐시 (선택)
+            parser: 파서 백엔드 ('fast' 또는 'bs4', 기본값: NEWS_PARSER 환경 변수 또는 'fast')
+            watermarks: 증분 크롤링용 섹션별 기준점 저장소 (선택)
+            archive: 받은 목록 페이지의 기사를 모두 보관할 보관소 (선택)
+        """
         self.base_url = "https://news.naver.com/main/list.naver"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.transport = transport or get_transport()
+        self.cache = cache
+        self.parser = parser or os.getenv('NEWS_PARSER', 'fast')
+        self.watermarks = watermarks
+        self.archive = archive
+        self._pending_marks: Dict[str, dict] = {}
+        # 마지막 crawl_incremental의 섹션별 결과 ({'articles', 'pages', 'ok'})
+        self.last_crawl_stats: Dict[Section, dict] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()
     
-    def get_breaking_news(self, limit: int = 10) -> List[Dict[str, str]]:
+    def _build_params(self, sid1: str, sid2: Optional[str] = None,
+                      page: int = 1, date: Optional[str] = None) -> Dict[str, str]:
+        """목록 페이지 요청 파라미터 생성"""
+        if sid2:
+            params = {'mode': 'LS2D', 'mid': 'shm', 'sid1': sid1, 'sid2': sid2}
+        else:
+            params = {'mode': 'LSD', 'mid': 'sec', 'sid1': sid1}
+        
+        if page > 1:
+            params['page'] = str(page)
+        if date:
+            params['date'] = date
+        
+        return params
+    
+    def _parse_news_list(self, response) -> List[Dict[str, str]]:
         """
-        네이버 속보 뉴스 가져오기
+        목록 페이지 응답에서 뉴스 추출
         
         Args:
-            limit: 가져올 뉴스 개수 (기본값: 10)
+            response: 목록 페이지 응답
         
         Returns:
             뉴스 리스트 (제목, URL 포함)
         """
-        params = {
-            'mode': 'LSD',
-            'mid': 'sec',
-            'sid1': '001'  # 정치
-        }
+        # 파서는 캐시에 없는 목록 페이지를 처음 받았을 때만 로드
+        from list_parser import parse_news_list
         
-        try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=self.headers,
-                timeout=10
+        metrics = get_metrics()
+        with metrics.span('parse'):
+            articles = parse_news_list(
+                response.content,
+                response.headers.get('Content-Type'),
+                backend=self.parser
             )
+        metrics.inc('articles_parsed_total', len(articles))
+        return articles
+    
+    def _fetch_page(self, sid1: str, sid2: Optional[str] = None,
+                    page: int = 1, date: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        목록 페이지 한 장을 가져와 파싱 (동기)
+        
+        Raises:
+            requests.RequestException: 요청 실패 시
+        """
+        params = self._build_params(sid1, sid2, page, date)
+        
+        if self.cache is None:
+            response = self.transport.get(self.base_url, params=params, headers=self.headers)
             response.raise_for_status()
+            return self._archived(self._parse_news_list(response), sid1, sid2)
+        
+        # (섹션, 페이지, 날짜) 별 URL을 캐시 키로 사용
+        cache_key = requests.Request('GET', self.base_url, params=params).prepare().url
+        cached = self.cache.get(cache_key)
+        headers = dict(self.headers)
+        
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.transport.get(self.base_url, params=params, headers=headers)
+        
+        if cached and response.status_code == 304:
+            self._record_cache(hit=True)
+            return self._archived([dict(news) for news in cached['articles']], sid1, sid2)
+        
+        response.raise_for_status()
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        
+        if cached and cached['content_hash'] == content_hash:
+            # 내용이 같으면 파싱을 건너뛰고 검증자만 갱신
+            articles = cached['articles']
+            self._record_cache(hit=True)
+        else:
+            articles = self._parse_news_list(response)
+            self._record_cache(hit=False)
+        
+        self.cache.set(cache_key, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'articles': articles
+        })
+        
+        return self._archived([dict(news) for news in articles], sid1, sid2)
+    
+    def _archived(self, articles: List[Dict[str, str]], sid1: str,
+                  sid2: Optional[str]) -> List[Dict[str, str]]:
+        # 보관소는 기사 ID로 중복을 거르므로 캐시 적중 페이지도 그대로 넘김
+        if self.archive is not None:
+            self.archive.add_many(articles, sid1=sid1, sid2=sid2)
+        return articles
+    
+    def _record_cache(self, hit: bool):
+        get_metrics().inc('list_cache_total', result='hit' if hit else 'miss')
+        with self._stats_lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        목록 페이지 캐시 적중 통계
+        
+        Returns:
+            {'hits': 적중 수, 'misses': 미스 수}
+        """
+        with self._stats_lock:
+            return {'hits': self.cache_hits, 'misses': self.cache_misses}
+    
+    async def crawl_async(self, sections: Optional[Iterable[Section]] = None,
+                          pages: int = 1, date: Optional[str] = None) -> List[Article]:
+        """
+        여러 섹션/페이지를 동시에 크롤링
+        
+        전체 동시 요청 수는 max_concurrency, 호스트별 동시 요청 수는
+        per_host_limit로 제한됩니다. 실패한 페이지는 건너뜁니다.
+        
+        Args:
+            sections: (sid1, sid2) 리스트 (기본값: 전체 섹션 + 세부 섹션)
+            pages: 섹션별로 가져올 페이지 수
+            date: 조회 날짜 (YYYYMMDD, 기본값: 오늘)
+        
+        Returns:
+            섹션 순서 → 페이지 순서 → 페이지 내 순서로 정렬되고
+            URL 기준으로 중복이 제거된 Article 리스트
+        """
+        if sections is None:
+            sections = all_sections()
+        
+        jobs = [
+            (sid1, sid2, page)
+            for sid1, sid2 in sections
+            for page in range(1, pages + 1)
+        ]
+        
+        results = await self._gather_limited(
+            (self._fetch_page, (sid1, sid2, page, date))
+            for sid1, sid2, page in jobs
+        )
+        
+        merged = []
+        seen_urls = set()
+        errors = []
+        
+        # gather는 입력 순서를 유지하므로 결과도 섹션/페이지 순서를 따름
+        for (sid1, sid2, page), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, requests.RequestException):
+                    raise result
+                errors.append(result)
+                print(f"크롤링 중 오류 발생 (sid1={sid1}, sid2={sid2}, page={page}): {result}")
+                continue
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_list = []
-            
-            # 뉴스 리스트 추출
-            news_items = soup.select('ul.type06_headline li') + soup.select('ul.type06 li')
+            for news in result:
+                if news['url'] in seen_urls:
+                    continue
+                seen_urls.add(news['url'])
+                merged.append(Article.from_mapping(news, sid1=sid1, sid2=sid2))
+        
+        return merged
+    
+    async def _gather_limited(self, calls) -> list:
+        """
+        동기 함수들을 스레드에서 동시에 실행 (전체/호스트별 동시 실행 수 제한)
+        
+        Args:
+            calls: (함수, 인자 튜플) 이터러블
+        
+        Returns:
+            입력 순서대로 정렬된 결과 리스트 (실패한 호출은 예외 객체)
+        """
+        import asyncio
+        
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limit = asyncio.Semaphore(self.per_host_limit)
+        
+        # 모든 요청이 base_url 호스트로 가므로 호스트별 제한은 하나
+        async def run(func, args):
+            async with global_limit, host_limit:
+                return await asyncio.to_thread(func, *args)
+        
+        return await asyncio.gather(
+            *(run(func, args) for func, args in calls),
+            return_exceptions=True
+        )
+    
+    def crawl(self, sections: Optional[Iterable[Section]] = None,
+              pages: int = 1, date: Optional[str] = None) -> List[Article]:
+        """crawl_async의 동기 버전"""
+        import asyncio
+        
+        return asyncio.run(self.crawl_async(sections, pages, date))
+    
+    def _iter_ordered(self, calls: Iterable[Tuple[Callable, tuple]]) -> Iterator[object]:
+        """
+        동기 함수들을 스레드에서 동시에 실행하고 입력 순서대로 결과를 하나씩 반환
+        
+        동시에 진행하는 호출은 max_concurrency/per_host_limit 이하로 유지되며,
+        앞쪽 결과는 뒤쪽 호출을 기다리지 않고 바로 나옵니다. 소비를 중단하면
+        아직 시작하지 않은 호출은 취소됩니다.
+        
+        Args:
+            calls: (함수, 인자 튜플) 이터러블
+        
+        Yields:
+            입력 순서대로 결과 (실패한 호출은 예외 객체)
+        """
+        # 모든 요청이 base_url 호스트로 가므로 두 제한 중 작은 값이 동시 실행 수
+        workers = max(min(self.max_concurrency, self.per_host_limit), 1)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        calls = iter(calls)
+        pending = deque()
+        
+        def submit() -> bool:
+            call = next(calls, None)
+            if call is None:
+                return False
+            func, args = call
+            pending.append(executor.submit(func, *args))
+            return True
+        
+        try:
+            while len(pending) < workers and submit():
+                pass
             
-            for item in news_items[:limit]:
-                link_tag = item.select_one('dt:not(.photo) a') or item.select_one('a')
-                if link_tag:
-                    title = link_tag.get_text(strip=True)
-                    url = link_tag.get('href', '')
+            while pending:
+                future = pending.popleft()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                # 결과를 넘기기 전에 빈 자리를 채워 소비 중에도 요청이 진행되도록 함
+                submit()
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def iter_news(self, sections: Optional[Iterable[Section]] = None,
+                  pages: int = 1, date: Optional[str] = None) -> Iterator[Article]:
+        """
+        crawl의 스트리밍 버전 (페이지를 파싱할 때마다 기사를 바로 반환)
+        
+        순서, 중복 제거, 실패한 페이지 처리는 crawl_async와 같습니다.
+        
+        Args:
+            sections: (sid1, sid2) 리스트 (기본값: 전체 섹션 + 세부 섹션)
+            pages: 섹션별로 가져올 페이지 수
+            date: 조회 날짜 (YYYYMMDD, 기본값: 오늘)
+        
+        Yields:
+            Article (제목, URL, sid1, sid2 포함)
+        """
+        if sections is None:
+            sections = all_sections()
+        
+        jobs = [
+            (sid1, sid2, page)
+            for sid1, sid2 in sections
+            for page in range(1, pages + 1)
+        ]
+        results = self._iter_ordered(
+            (self._fetch_page, (sid1, sid2, page, date))
+            for sid1, sid2, page in jobs
+        )
+        seen_urls = set()
+        
+        try:
+            for (sid1, sid2, page), result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, requests.RequestException):
+                        raise result
+                    print(f"크롤링 중 오류 발생 (sid1={sid1}, sid2={sid2}, page={page}): {result}")
+                    continue
+                
+                for news in result:
+                    if news['url'] in seen_urls:
+                        continue
+                    seen_urls.add(news['url'])
+                    yield Article.from_mapping(news, sid1=sid1, sid2=sid2)
+        finally:
+            results.close()
+    
+    def _crawl_section_incremental(self, sid1: str, sid2: Optional[str],
+                                   max_pages: int, today: str) -> Tuple[List[Article], Optional[dict], int, bool]:
+        """
+        한 섹션의 목록 페이지를 최신순으로 넘기며 기준점 기사 직전까지 수집
+        
+        Returns:
+            (새 기사 리스트, 새 기준점 또는 None, 요청 페이지 수, 성공 여부)
+            요청이 중간에 실패하면 누락이 생길 수 있으므로 기준점을 갱신하지 않습니다.
+        """
+        section = HighWaterMarkStore.section_key(sid1, sid2)
+        mark = self.watermarks.get(section)
+        mark_key = (mark['oid'], mark['aid']) if mark else None
+        
+        # 기준점 날짜부터 오늘까지 최신 날짜 먼저 (최대 7일)
+        dates = [today]
+        if mark and mark['date'] < today:
+            day = datetime.strptime(today, '%Y%m%d')
+            while len(dates) < 7:
+                day -= timedelta(days=1)
+                date = day.strftime('%Y%m%d')
+                if date < mark['date']:
+                    break
+                dates.append(date)
+        
+        collected = []
+        seen_urls = set()
+        new_mark = None
+        fetches = 0
+        reached_mark = False
+        
+        try:
+            for date in dates:
+                previous_first = None
+                
+                for page in range(1, max_pages + 1):
+                    if fetches >= max_pages:
+                        break
+                    news_list = self._fetch_page(sid1, sid2, page, date)
+                    fetches += 1
                     
-                    # URL이 상대경로인 경우 절대경로로 변환
-                    if url.startswith('/'):
-                        url = 'https://news.naver.com' + url
+                    # 마지막 페이지를 넘기면 네이버는 마지막 페이지를 다시 보여줌
+                    if not news_list or news_list[0]['url'] == previous_first:
+                        break
+                    previous_first = news_list[0]['url']
                     
-                    news_list.append({
-                        'title': title,
-                        'url': url
-                    })
+                    for news in news_list:
+                        key = parse_article_key(news['url'])
+                        if mark_key is not None and key == mark_key:
+                            reached_mark = True
+                            break
+                        if key is not None and new_mark is None:
+                            new_mark = {'oid': key[0], 'aid': key[1], 'date': date}
+                        if news['url'] not in seen_urls:
+                            seen_urls.add(news['url'])
+                            collected.append(Article(news['title'], *key, sid1=sid1, sid2=sid2,
+                                                     thumbnail=news.get('thumbnail'))
+                                             if key is not None else
+                                             Article.from_mapping(news, sid1=sid1, sid2=sid2))
+                    
+                    # 첫 실행(기준점 없음)은 첫 페이지만 수집
+                    if reached_mark or mark_key is None:
+                        break
                 
-                if len(news_list) >= limit:
+                if reached_mark or mark_key is None or fetches >= max_pages:
                     break
-            
-            return news_list
         
         except requests.RequestException as e:
-            print(f"크롤링 중 오류 발생: {e}")
-            return []
+            print(f"크롤링 중 오류 발생 (sid1={sid1}, sid2={sid2}): {e}")
+            return collected, None, fetches, False
+        
+        print(f"📄 {section}: 목록 {fetches}페이지 요청, 새 기사 {len(collected)}개")
+        return collected, new_mark, fetches, True
+    
+    def crawl_incremental(self, sections: Optional[Iterable[Section]] = None,
+                          max_pages: int = 10, today: Optional[str] = None) -> List[Article]:
+        """
+        섹션별로 지난 실행 이후 새로 올라온 기사만 수집
+        
+        각 섹션은 목록 페이지를 최신순으로 넘기다가 지난 실행의 가장 최신
+        기사(기준점)를 만나면 멈추므로, 새 기사가 많을수록 요청 수가 늘고
+        새 기사가 없으면 페이지 하나만 요청합니다. 섹션끼리는 동시에 진행합니다.
+        
+        새 기준점은 commit_watermarks()를 호출해야 반영되므로, 전송에
+        실패하면 다음 실행에서 같은 기사를 다시 수집합니다.
+        
+        Args:
+            sections: (sid1, sid2) 리스트 (기본값: 속보 [('001', None)])
+            max_pages: 섹션별 최대 요청 페이지 수
+            today: 기준 날짜 (YYYYMMDD, 기본값: 오늘)
+        
+        Returns:
+            섹션 순서 → 최신순으로 정렬된 새 기사 리스트
+        
+        Raises:
+            ValueError: 기준점 저장소(watermarks)가 없는 경우
+        """
+        return list(self.iter_incremental(sections, max_pages, today))
+    
+    def iter_incremental(self, sections: Optional[Iterable[Section]] = None,
+                         max_pages: int = 10, today: Optional[str] = None) -> Iterator[Article]:
+        """
+        crawl_incremental의 스트리밍 버전 (섹션 수집이 끝날 때마다 기사를 바로 반환)
+        
+        섹션별 결과(last_crawl_stats)와 새 기준점은 해당 섹션의 기사를
+        반환하기 전에 기록됩니다. 중간에 소비를 멈추면 남은 섹션은 요청하지 않습니다.
+        커밋하지 않은 이전 수집의 기준점은 버립니다. (전송에 실패한 사이클의
+        기준점이 다른 섹션을 보낸 다음 사이클에서 커밋되지 않도록)
+        
+        Raises:
+            ValueError: 기준점 저장소(watermarks)가 없는 경우
+        """
+        if self.watermarks is None:
+            raise ValueError("증분 크롤링에는 watermarks 저장소가 필요합니다.")
+        
+        sections = list(sections or [('001', None)])
+        today = today or datetime.now().strftime('%Y%m%d')
+        self.last_crawl_stats = {}
+        self._pending_marks = {}
+        return self._iter_incremental(sections, max_pages, today)
     
-    def format_news_message(self, news_list: List[Dict[str, str]]) -> str:
+    def _iter_incremental(self, sections: List[Section], max_pages: int,
+                          today: str) -> Iterator[Article]:
+        results = self._iter_ordered(
+            (self._crawl_section_incremental, (sid1, sid2, max_pages, today))
+            for sid1, sid2 in sections
+        )
+        seen_urls = set()
+        
+        try:
+            for (sid1, sid2), result in zip(sections, results):
+                if isinstance(result, BaseException):
+                    raise result
+                
+                news_list, new_mark, pages, ok = result
+                self.last_crawl_stats[(sid1, sid2)] = {
+                    'articles': len(news_list), 'pages': pages, 'ok': ok
+                }
+                if new_mark is not None:
+                    self._pending_marks[HighWaterMarkStore.section_key(sid1, sid2)] = new_mark
+                
+                for news in news_list:
+                    if news['url'] not in seen_urls:
+                        seen_urls.add(news['url'])
+                        yield news
+        finally:
+            results.close()
+    
+    def commit_watermarks(self):
+        """crawl_incremental로 얻은 새 기준점을 저장 (수집한 기사를 처리한 뒤 호출)"""
+        if self.watermarks is None or not self._pending_marks:
+            return
+        
+        for section, mark in self._pending_marks.items():
+            self.watermarks.set(section, **mark)
+        self._pending_marks = {}
+        self.watermarks.save()
+    
+    def get_breaking_news(self, limit: int = 10, sid1: str = '001',
+                          sid2: Optional[str] = None) -> List[Article]:
+        """
+        네이버 속보 뉴스 가져오기
+        
+        Args:
+            limit: 가져올 뉴스 개수 (기본값: 10)
+            sid1: 섹션 코드 (기본값: '001' 속보)
+            sid2: 세부 섹션 코드 (선택)
+        
+        Returns:
+            Article 리스트 (dict처럼 제목, URL 사용 가능)
+        """
+        news_list = self.crawl(sections=[(sid1, sid2)], pages=1)
+        return news_list[:limit]
+    
+    def format_news_message(self, news_list: Sequence[Mapping[str, str]]) -> str:
         """
         뉴스 리스트를 메시지 형식으로 포맷팅
         
         Args:
-            news_list: 뉴스 리스트
+            news_list: 뉴스 리스트 (dict 또는 Article)
         
         Returns:
             포맷팅된 메시지 문자열
@@ -85,13 +596,13 @@ class NaverNewsCrawler:
         if not news_list:
             return "오늘의 뉴스를 가져올 수 없습니다."
         
-        message = "📰 오늘의 네이버 뉴스 TOP 10\n\n"
-        
-        for idx, news in enumerate(news_list, 1):
-            message += f"{idx}. {news['title']}\n"
-            message += f"   🔗 {news['url']}\n\n"
+        parts = ["📰 오늘의 네이버 뉴스 TOP 10"]
+        parts.extend(
+            f"{idx}. {news['title']}{outlets_suffix(news) if 'outlets' in news else ''}\n   🔗 {news['url']}"
+            for idx, news in enumerate(news_list, 1)
+        )
         
-        return message.strip()
+        return '\n\n'.join(parts)
 
 
 if __name__ == "__main__":
@@ -103,4 +614,4 @@ if __name__ == "__main__":
         print(f"✅ {len(news)}개의 뉴스를 가져왔습니다.\n")
         print(crawler.format_news_message(news))
     else:
-        print("❌ 뉴스를 가져오지 못했습니다.")
\ No newline at end of file
+        print("❌ 뉴스를 가져오지 못했습니다.")
@@ -0,0 +1,328 @@
+"""
+데몬 실행 파일
+크롤러, 전송 객체, 커넥션 풀을 유지한 채 일정에 따라 사이클을 반복 실행합니다.
+
+일정은 SCHEDULE_CRON(cron 표현식) 또는 SCHEDULE_INTERVAL(초) +
+SCHEDULE_JITTER(초)로 설정합니다. SCHEDULE_MODE=adaptive이면 섹션별
+발행 속도에 따라 섹션마다 수집 간격을 조정합니다. (증분 수집 전용)
+
+METRICS_ENABLED=true와 METRICS_PORT를 설정하면 /metrics에서 Prometheus
+형식으로 계측 값을 내보냅니다.
+
+COORDINATION_DB를 설정하면 같은 파일을 공유하는 여러 데몬이 하트비트를
+기록하고 섹션을 나누어 수집하며, 같은 메시지는 한 번만 보냅니다.
+"""
+
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Set
+from adaptive_scheduler import AdaptiveScheduler
+from crawler import parse_sections
+from metrics import MetricsServer, get_metrics
+from main import (create_clusterer, create_coordinator, create_crawler, create_enricher, create_outbox,
+                  create_renderer, create_sender, create_seen_index, create_thumbnails, load_env, run_cycle)
+
+
+class CronSchedule:
+    """5필드 cron 표현식 일정 클래스 (분 시 일 월 요일)"""
+    
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+    
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron 표현식 (예: '*/10 7-22 * * 1-5')
+        
+        Raises:
+            ValueError: 표현식 형식이 잘못된 경우
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: {expression}")
+        
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        )
+        self.days_restricted = fields[2] != '*'
+        self.weekdays_restricted = fields[4] != '*'
+    
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+                if step < 1:
+                    raise ValueError(f"잘못된 cron 간격: {field}")
+            
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            
+            # 요일 7은 일요일(0)로 취급
+            if high == 6 and end == 7:
+                values.add(0)
+                end = 6
+                if start == 7:
+                    continue
+            if start < low or end > high or start > end:
+                raise ValueError(f"cron 값 범위 초과: {field}")
+            
+            values.update(range(start, end + 1, step))
+        
+        return values
+    
+    def _day_matches(self, moment: datetime) -> bool:
+        # cron 요일은 일요일이 0, datetime.weekday()는 월요일이 0
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        
+        # 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+    
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        주어진 시각 이후 첫 실행 시각 계산
+        
+        Args:
+            moment: 기준 시각
+        
+        Returns:
+            다음 실행 시각 (초 단위 0)
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + (candidate.month == 12)
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식: {self.expression}")
+    
+    def __str__(self) -> str:
+        return f"cron '{self.expression}'"
+
+
+class IntervalSchedule:
+    """고정 간격 + 무작위 지연(jitter) 일정 클래스"""
+    
+    def __init__(self, interval: float, jitter: float = 0.0):
+        """
+        Args:
+            interval: 실행 간격 (초)
+            jitter: 매 실행마다 더할 최대 무작위 지연 (초)
+        """
+        if interval <= 0:
+            raise ValueError("실행 간격은 0보다 커야 합니다.")
+        self.interval = interval
+        self.jitter = jitter
+    
+    def next_after(self, moment: datetime) -> datetime:
+        """주어진 시각 이후 다음 실행 시각 계산"""
+        delay = self.interval + random.uniform(0, self.jitter)
+        return moment + timedelta(seconds=delay)
+    
+    def __str__(self) -> str:
+        return f"{self.interval:g}초 간격 (jitter {self.jitter:g}초)"
+
+
+def schedule_from_env():
+    """환경 변수로 일정 생성 (기본값: 10분 간격, jitter 30초)"""
+    cron = os.getenv('SCHEDULE_CRON')
+    if cron:
+        return CronSchedule(cron)
+    
+    return IntervalSchedule(
+        float(os.getenv('SCHEDULE_INTERVAL', 600)),
+        float(os.getenv('SCHEDULE_JITTER', 30))
+    )
+
+
+class Daemon:
+    """사이클을 일정에 따라 반복 실행하는 데몬 클래스"""
+    
+    def __init__(self, schedule, cycle: Callable[[], bool], run_on_start: bool = True):
+        """
+        Args:
+            schedule: next_after(datetime)을 제공하는 일정 객체
+            cycle: 한 사이클을 실행하고 성공 여부를 반환하는 함수
+            run_on_start: 시작하자마자 한 번 실행할지 여부
+        """
+        self.schedule = schedule
+        self.cycle = cycle
+        self.run_on_start = run_on_start
+        self.stop_event = threading.Event()
+        self._cycle_lock = threading.Lock()
+        self.cycles_run = 0
+        self.cycles_skipped = 0
+    
+    def stop(self, *_):
+        """데몬 종료 요청 (진행 중인 사이클은 끝까지 실행)"""
+        self.stop_event.set()
+    
+    def install_signal_handlers(self):
+        """SIGTERM/SIGINT 수신 시 정상 종료하도록 설정"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+    
+    def run_once(self) -> Optional[bool]:
+        """
+        사이클 한 번 실행
+        
+        Returns:
+            사이클 성공 여부 (이전 사이클이 아직 실행 중이면 None)
+        """
+        # 사이클이 겹치지 않도록 진행 중이면 건너뜀
+        if not self._cycle_lock.acquire(blocking=False):
+            self.cycles_skipped += 1
+            print("⏭️ 이전 사이클이 아직 실행 중이라 건너뜁니다.")
+            return None
+        
+        try:
+            started = time.monotonic()
+            try:
+                result = self.cycle()
+            except Exception as e:
+                print(f"\n❌ 사이클 실행 중 오류 발생: {e}")
+                import traceback
+                traceback.print_exc()
+                result = False
+            
+            self.cycles_run += 1
+            print(f"⏱️ 사이클 소요 시간: {time.monotonic() - started:.2f}초")
+            return result
+        finally:
+            self._cycle_lock.release()
+    
+    def run(self):
+        """종료 요청이 올 때까지 일정에 따라 사이클 실행"""
+        print(f"🕒 데몬 시작: {self.schedule}")
+        
+        if self.run_on_start and not self.stop_event.is_set():
+            self.run_once()
+        
+        while not self.stop_event.is_set():
+            # 다음 실행 시각은 사이클이 끝난 시점 기준으로 계산 (밀린 실행은 건너뜀)
+            next_run = self.schedule.next_after(datetime.now())
+            print(f"💤 다음 실행 예정: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+            
+            wait_seconds = max((next_run - datetime.now()).total_seconds(), 0)
+            if self.stop_event.wait(wait_seconds):
+                break
+            
+            self.run_once()
+        
+        print("👋 데몬을 종료합니다.")
+
+
+def main():
+    """데몬 메인 함수"""
+    load_env()
+    
+    coordinator = create_coordinator()
+    sender = create_sender(coordinator)
+    if sender is None:
+        sys.exit(1)
+    if coordinator is not None:
+        coordinator.start_heartbeat()
+        print(f"🤝 복제본 {coordinator.replica_id}로 참여합니다.")
+    
+    crawler = create_crawler()
+    seen_index = create_seen_index()
+    renderer = create_renderer()
+    clusterer = create_clusterer()
+    enricher = create_enricher()
+    thumbnails = create_thumbnails()
+    outbox = create_outbox()
+    
+    if os.getenv('SCHEDULE_MODE') == 'adaptive':
+        if crawler.watermarks is None:
+            print("❌ 적응형 일정은 CRAWL_MODE=incremental에서만 사용할 수 있습니다.")
+            sys.exit(1)
+        
+        schedule = AdaptiveScheduler.from_env(parse_sections(os.getenv('CRAWL_SECTIONS', '001')))
+        
+        def cycle() -> bool:
+            # 예정 시각이 된 섹션만 수집하고 결과로 발행 속도 갱신
+            sections = schedule.due()
+            if not sections:
+                return True
+            if coordinator is not None:
+                # 다른 복제본이 담당하는 섹션은 미뤄 두고 담당이 바뀌는지 다시 확인
+                owned = coordinator.shard(sections)
+                for section in sections:
+                    if section not in owned:
+                        schedule.defer(section)
+                sections = owned
+                if not sections:
+                    return True
+            try:
+                return run_cycle(crawler, sender, seen_index, renderer, sections=sections, clusterer=clusterer,
+                                 enricher=enricher, thumbnails=thumbnails, outbox=outbox,
+                                 coordinator=coordinator)
+            finally:
+                schedule.record_crawl(sections, crawler.last_crawl_stats)
+                schedule.print_snapshot()
+        
+        run_on_start = True
+    else:
+        schedule = schedule_from_env()
+        
+        def cycle() -> bool:
+            return run_cycle(crawler, sender, seen_index, renderer, clusterer=clusterer, enricher=enricher,
+                             thumbnails=thumbnails, outbox=outbox, coordinator=coordinator)
+        
+        run_on_start = os.getenv('DAEMON_RUN_ON_START', 'true').lower() != 'false'
+    
+    metrics_server = None
+    if os.getenv('METRICS_PORT'):
+        if get_metrics().enabled:
+            metrics_server = MetricsServer(int(os.getenv('METRICS_PORT'))).start()
+            print(f"📈 메트릭 엔드포인트: http://0.0.0.0:{metrics_server.port}/metrics")
+        else:
+            print("⚠️ METRICS_PORT를 사용하려면 METRICS_ENABLED=true로 설정하세요.")
+    
+    daemon = Daemon(schedule, cycle, run_on_start=run_on_start)
+    daemon.install_signal_handlers()
+    
+    try:
+        daemon.run()
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
+        if coordinator is not None:
+            coordinator.leave()
+        if enricher is not None:
+            enricher.close()
+        seen_index.close()
+        crawler.transport.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+디스크 캐시 모듈
+JSON 값을 파일 단위로 저장하고 LRU 방식으로 정리하는 캐시를 제공합니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DiskLRUCache:
+    """항목 수 상한을 가진 LRU 디스크 캐시 클래스"""
+    
+    def __init__(self, directory: str, max_entries: int = 1000):
+        """
+        Args:
+            directory: 캐시 파일을 저장할 디렉토리
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, None]' = OrderedDict()
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+        # 마지막 사용 시각(mtime) 순서로 LRU 순서 복원
+        files = sorted(self.directory.glob('*.json'), key=lambda path: path.stat().st_mtime)
+        for path in files:
+            self._entries[path.stem] = None
+    
+    def _digest(self, key: str) -> str:
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.json"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 값 조회
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            저장된 값 (없으면 None)
+        """
+        digest = self._digest(key)
+        
+        with self._lock:
+            if digest not in self._entries:
+                return None
+            
+            path = self._path(digest)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                self._entries.pop(digest, None)
+                return None
+            
+            # 해시 충돌 대비 원래 키 확인
+            if entry.get('key') != key:
+                return None
+            
+            self._entries.move_to_end(digest)
+            return entry['value']
+    
+    def set(self, key: str, value: Any):
+        """
+        캐시 값 저장 (원자적 쓰기)
+        
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+        """
+        digest = self._digest(key)
+        
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'key': key, 'value': value}, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(digest))
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            
+            self._entries[digest] = None
+            self._entries.move_to_end(digest)
+            self._evict()
+    
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            digest, _ = self._entries.popitem(last=False)
+            try:
+                os.remove(self._path(digest))
+            except FileNotFoundError:
+                pass
+    
+    def __len__(self) -> int:
+        return len(self._entries)
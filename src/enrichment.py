@@ -0,0 +1,281 @@
+"""
+기사 보강 모듈
+목록 페이지에는 제목과 링크만 있으므로, 기사 상세 페이지를 받아 언론사 이름,
+입력 시각, 첫 문단 요약, 썸네일을 추출하여 기사에 채웁니다.
+
+상세 페이지는 크기 제한이 있는 스레드 풀에서 동시에 받고, 추출 결과는
+oid/aid 키로 디스크 캐시에 저장합니다. 같은 기사가 여러 사이클이나 여러
+메시지에 들어가도 상세 페이지는 한 번만 받으며, 동시에 같은 기사를 요청하면
+먼저 시작한 요청의 결과를 함께 씁니다.
+"""
+
+import html
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional
+
+import requests
+
+from article import ARTICLE_URL_FORMAT, Article, ArticleKey, article_key
+from disk_cache import DiskLRUCache
+from http_client import HttpTransport, get_transport
+from metrics import get_metrics
+
+
+# 리다이렉트 없이 바로 받는 모바일 기사 페이지 (메시지 링크와 같은 URL)
+ARTICLE_DETAIL_URL = ARTICLE_URL_FORMAT
+
+# 기사에 채우는 필드
+DETAIL_FIELDS = ('press', 'published', 'lead', 'thumbnail')
+
+_META_TAG = re.compile(r'<meta\s[^>]*>', re.I)
+_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_DATE_TIME = re.compile(r'data-date-time="(\d{4}-\d{2}-\d{2} \d{2}:\d{2}(?::\d{2})?)"')
+_ISO_TIME = re.compile(r'(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}(?::\d{2})?)')
+_WHITESPACE = re.compile(r'\s+')
+
+# 본문은 <head>의 메타 태그와 기사 머리의 입력 시각만 쓰므로 앞부분만 검사
+_SCAN_LIMIT = 256 * 1024
+
+
+def _meta_tags(text: str) -> Dict[str, str]:
+    # property/name → content (같은 이름이 여러 번 나오면 처음 값)
+    tags = {}
+    for tag in _META_TAG.findall(text):
+        attrs = {name.lower(): double or single for name, double, single in _ATTRIBUTE.findall(tag)}
+        name = (attrs.get('property') or attrs.get('name') or '').lower()
+        content = attrs.get('content')
+        if name and content and name not in tags:
+            tags[name] = html.unescape(content).strip()
+    return tags
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = _WHITESPACE.sub(' ', text).strip()
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + '…'
+
+
+def parse_article_page(content: bytes, content_type: Optional[str] = None,
+                       max_lead_length: int = 200) -> Dict[str, str]:
+    """
+    기사 상세 페이지에서 보강 정보 추출
+    
+    Args:
+        content: 응답 본문 바이트
+        content_type: Content-Type 헤더 값
+        max_lead_length: 첫 문단 요약 최대 글자 수
+    
+    Returns:
+        'press', 'published', 'lead', 'thumbnail' 중 찾은 항목만 담은 dict
+    """
+    # 목록 파서 모듈은 보강할 기사가 있을 때만 로드
+    from list_parser import decode_body
+    
+    text = decode_body(content[:_SCAN_LIMIT], content_type)
+    tags = _meta_tags(text)
+    details = {}
+    
+    # 네이버 기사 페이지는 og:article:author가 '언론사 | 네이버'
+    press = tags.get('og:article:author') or tags.get('twitter:creator')
+    if press:
+        details['press'] = press.split('|')[0].strip()
+    
+    # 기사 머리의 입력 시각 (없으면 article:published_time 메타 태그)
+    match = _DATE_TIME.search(text)
+    if match:
+        published = match.group(1)
+    else:
+        match = _ISO_TIME.search(tags.get('article:published_time', ''))
+        published = f"{match.group(1)} {match.group(2)}" if match else None
+    if published:
+        details['published'] = published if len(published) > 16 else published + ':00'
+    
+    lead = tags.get('og:description') or tags.get('description')
+    if lead:
+        details['lead'] = _shorten(lead, max_lead_length)
+    
+    thumbnail = tags.get('og:image')
+    if thumbnail and thumbnail.startswith('http'):
+        details['thumbnail'] = thumbnail
+    
+    return details
+
+
+class ArticleEnricher:
+    """기사 상세 페이지 보강 클래스"""
+    
+    def __init__(self, cache: Optional[DiskLRUCache] = None, transport: Optional[HttpTransport] = None,
+                 max_workers: int = 8, max_lead_length: int = 200):
+        """
+        Args:
+            cache: 추출 결과 디스크 캐시 (선택, 없으면 사이클마다 다시 받음)
+            transport: HTTP 전송 객체 (기본값: 프로세스 공용 transport)
+            max_workers: 동시에 받을 상세 페이지 수
+            max_lead_length: 첫 문단 요약 최대 글자 수
+        """
+        self.cache = cache
+        self.transport = transport or get_transport()
+        self.max_workers = max_workers
+        self.max_lead_length = max_lead_length
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._lock = threading.Lock()
+        self._inflight: Dict[ArticleKey, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.fetches = 0
+        self.errors = 0
+    
+    @classmethod
+    def from_env(cls, cache_dir: str) -> 'ArticleEnricher':
+        """ENRICH_WORKERS, ENRICH_CACHE_MAX_ENTRIES, ENRICH_LEAD_MAX_LENGTH 환경 변수로 생성"""
+        return cls(
+            cache=DiskLRUCache(cache_dir, max_entries=int(os.getenv('ENRICH_CACHE_MAX_ENTRIES', 5000))),
+            max_workers=int(os.getenv('ENRICH_WORKERS', 8)),
+            max_lead_length=int(os.getenv('ENRICH_LEAD_MAX_LENGTH', 200))
+        )
+    
+    @staticmethod
+    def cache_key(key: ArticleKey) -> str:
+        """추출 결과 캐시 키 ('oid/aid')"""
+        return f"{key[0]:03d}/{key[1]:010d}"
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='enrich')
+            return self._executor
+    
+    def _fetch(self, key: ArticleKey) -> Optional[Dict[str, str]]:
+        """
+        상세 페이지를 받아 추출 (캐시에 저장)
+        
+        Returns:
+            추출 결과 (요청 실패 시 None, 다음 사이클에 다시 시도)
+        """
+        url = ARTICLE_DETAIL_URL.format(oid=key[0], aid=key[1])
+        metrics = get_metrics()
+        try:
+            with metrics.span('enrich_fetch'):
+                response = self.transport.get(url, headers=self.headers)
+            if response.status_code in (404, 410):
+                # 삭제된 기사는 빈 결과를 저장하여 다시 요청하지 않음
+                details = {}
+            else:
+                response.raise_for_status()
+                details = parse_article_page(response.content, response.headers.get('Content-Type'),
+                                             self.max_lead_length)
+        except requests.RequestException as e:
+            print(f"⚠️ 기사 상세 페이지 요청 실패 ({url}): {e}")
+            metrics.inc('enrich_total', result='error')
+            with self._lock:
+                self.errors += 1
+            return None
+        
+        metrics.inc('enrich_total', result='fetched')
+        with self._lock:
+            self.fetches += 1
+        if self.cache is not None:
+            self.cache.set(self.cache_key(key), details)
+        return details
+    
+    def _submit(self, key: ArticleKey) -> Future:
+        # 같은 기사를 이미 받는 중이면 그 Future를 함께 사용
+        pool = self._pool()
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = pool.submit(self._fetch, key)
+            self._inflight[key] = future
+        # 이미 끝난 Future는 콜백을 바로 실행하므로 잠금 밖에서 등록
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+    
+    def _forget(self, key: ArticleKey):
+        with self._lock:
+            self._inflight.pop(key, None)
+    
+    def lookup(self, keys: List[ArticleKey]) -> Dict[ArticleKey, Dict[str, str]]:
+        """
+        기사별 보강 정보 조회 (캐시에 없는 기사만 동시에 받음)
+        
+        Args:
+            keys: (oid, aid) 리스트
+        
+        Returns:
+            (oid, aid) → 추출 결과 (요청에 실패한 기사는 빠짐)
+        """
+        results: Dict[ArticleKey, Dict[str, str]] = {}
+        futures: Dict[ArticleKey, Future] = {}
+        metrics = get_metrics()
+        
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get(self.cache_key(key)) if self.cache is not None else None
+            if cached is not None:
+                results[key] = cached
+                metrics.inc('enrich_total', result='hit')
+                with self._lock:
+                    self.hits += 1
+            else:
+                futures[key] = self._submit(key)
+        
+        for key, future in futures.items():
+            details = future.result()
+            if details is not None:
+                results[key] = details
+        
+        return results
+    
+    def enrich(self, news_list: List[Mapping]) -> List[Mapping]:
+        """
+        기사 리스트에 언론사/입력 시각/요약/썸네일 채우기
+        
+        목록 페이지에서 이미 얻은 값은 그대로 두고 비어 있는 필드만 채웁니다.
+        기사 ID를 알 수 없거나 상세 페이지를 받지 못한 기사는 그대로 반환합니다.
+        
+        Args:
+            news_list: 기사 리스트 (dict 또는 Article)
+        
+        Returns:
+            입력 순서를 유지한 기사 리스트
+        """
+        keys = [article_key(news) for news in news_list]
+        with get_metrics().span('enrich'):
+            details = self.lookup([key for key in keys if key is not None])
+        
+        enriched = []
+        for news, key in zip(news_list, keys):
+            found = details.get(key) if key is not None else None
+            fields = {name: value for name, value in (found or {}).items()
+                      if name in DETAIL_FIELDS and value and not news.get(name)}
+            if not fields:
+                enriched.append(news)
+            elif isinstance(news, Article):
+                enriched.append(news.replace(**fields))
+            else:
+                enriched.append({**news, **fields})
+        return enriched
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        보강 통계
+        
+        Returns:
+            {'hits': 캐시 적중 수, 'fetches': 상세 페이지 요청 수, 'errors': 실패 수}
+        """
+        with self._lock:
+            return {'hits': self.hits, 'fetches': self.fetches, 'errors': self.errors}
+    
+    def close(self):
+        """스레드 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
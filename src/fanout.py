@@ -0,0 +1,456 @@
+"""
+다중 수신자 발송 모듈
+구독자 목록을 관리하고 같은 메시지를 여러 구독자에게 병렬로 전송합니다.
+
+각 구독자는 자신의 '나에게 보내기' 토큰(client_id/refresh_token)을 가지며,
+메시지는 한 번만 인코딩하여 모든 구독자에게 재사용합니다.
+키워드를 등록한 구독자는 제목에 키워드가 들어간 기사만 받습니다.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from http_client import HttpTransport, get_transport
+from kakao_sender import KakaoSender
+from keyword_matcher import KeywordRouter
+from outbox import Outbox
+from retry import CircuitBreaker, RetryPolicy
+from token_store import TokenStore
+
+
+@dataclass
+class Subscriber:
+    """구독자 정보"""
+    id: str
+    client_id: str
+    refresh_token: str
+    client_secret: Optional[str] = None
+    keywords: List[str] = field(default_factory=list)
+
+
+@dataclass
+class DeliveryResult:
+    """구독자별 전송 결과"""
+    subscriber_id: str
+    success: bool
+    latency: float
+    messages_sent: int = 0
+    error: Optional[str] = None
+
+
+class SubscriberRegistry:
+    """JSON 파일 기반 구독자 목록 클래스"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 구독자 JSON 파일 경로 ({"subscribers": [...]} 형식)
+        """
+        self.path = Path(path)
+        self.subscribers: Dict[str, Subscriber] = {}
+        self.mtime: Optional[float] = None
+        self.load()
+    
+    def load(self):
+        """파일에서 구독자 목록 다시 읽기 (파일이 없으면 빈 목록)"""
+        if not self.path.exists():
+            self.subscribers = {}
+            self.mtime = None
+            return
+        
+        self.mtime = self.path.stat().st_mtime
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        self.subscribers = {
+            entry['id']: Subscriber(**entry)
+            for entry in data.get('subscribers', [])
+        }
+    
+    def reload_if_changed(self) -> bool:
+        """파일이 바뀌었으면 다시 읽기"""
+        mtime = self.path.stat().st_mtime if self.path.exists() else None
+        if mtime == self.mtime:
+            return False
+        self.load()
+        return True
+    
+    def keywords(self) -> Dict[str, List[str]]:
+        """구독자 ID → 키워드 목록 (키워드가 있는 구독자만)"""
+        return {
+            subscriber.id: subscriber.keywords
+            for subscriber in self.subscribers.values()
+            if subscriber.keywords
+        }
+    
+    def save(self):
+        """구독자 목록 저장"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'subscribers': [asdict(subscriber) for subscriber in self.subscribers.values()]}
+        
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.path)
+    
+    def add(self, subscriber: Subscriber):
+        self.subscribers[subscriber.id] = subscriber
+    
+    def remove(self, subscriber_id: str):
+        self.subscribers.pop(subscriber_id, None)
+    
+    def __iter__(self):
+        return iter(self.subscribers.values())
+    
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+
+class TokenBucket:
+    """토큰 버킷 방식 속도 제한 클래스"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """요청 한 건을 보낼 수 있을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+class FanoutDispatcher:
+    """여러 구독자에게 메시지를 병렬 전송하는 클래스"""
+    
+    def __init__(self, senders: Dict[str, KakaoSender], max_workers: int = 16,
+                 rate_per_token: float = 1.0, burst: int = 1,
+                 keywords: Optional[Dict[str, List[str]]] = None,
+                 redelivery: Optional[Outbox] = None):
+        """
+        Args:
+            senders: 구독자 ID → KakaoSender
+            max_workers: 동시에 전송할 구독자 수
+            rate_per_token: 토큰(구독자)별 초당 전송 수 상한
+            burst: 토큰별 연속 전송 허용 수
+            keywords: 구독자 ID → 구독 키워드 (없는 구독자는 모든 기사를 받음)
+            redelivery: 일부 구독자에게 보내지 못한 메시지를 그 구독자 몫으로 저장할 발송 대기열
+        """
+        self.senders = senders
+        self.max_workers = max_workers
+        self.limiters = {
+            subscriber_id: TokenBucket(rate_per_token, burst)
+            for subscriber_id in senders
+        }
+        self.redelivery = redelivery
+        self.registry: Optional[SubscriberRegistry] = None
+        self.router = KeywordRouter()
+        self.router.sync(keywords or {})
+    
+    @classmethod
+    def from_registry(cls, registry: SubscriberRegistry, token_dir: str,
+                      transport: Optional[HttpTransport] = None, coordinator=None,
+                      **kwargs) -> 'FanoutDispatcher':
+        """
+        구독자 목록으로 발송기 생성
+        
+        모든 구독자가 커넥션 풀, 재시도 정책, 서킷 브레이커를 공유하고
+        토큰은 구독자별 파일(token_dir/{id}.json)에 보관합니다.
+        
+        Args:
+            registry: 구독자 목록
+            token_dir: 구독자별 토큰 저장 디렉토리
+            transport: HTTP 전송 객체 (기본값: 프로세스 공용 transport)
+            coordinator: 복제본 조정 객체 (선택, 구독자별로 같은 메시지를 한 번만 전송)
+            **kwargs: FanoutDispatcher 생성 인자
+        """
+        transport = transport or get_transport()
+        retry_policy = RetryPolicy()
+        token_breaker = CircuitBreaker('kauth')
+        message_breaker = CircuitBreaker('kapi')
+        
+        senders = {
+            subscriber.id: KakaoSender(
+                subscriber.client_id,
+                subscriber.refresh_token,
+                subscriber.client_secret,
+                transport=transport,
+                token_store=TokenStore(str(Path(token_dir) / f"{subscriber.id}.json")),
+                retry_policy=retry_policy,
+                token_breaker=token_breaker,
+                message_breaker=message_breaker,
+                coordinator=coordinator,
+                recipient_id=subscriber.id
+            )
+            for subscriber in registry
+        }
+        dispatcher = cls(senders, keywords=registry.keywords(), **kwargs)
+        dispatcher.registry = registry
+        return dispatcher
+    
+    def reload_keywords(self) -> bool:
+        """
+        구독자 파일이 바뀌었으면 키워드 다시 반영
+        
+        바뀐 구독자의 키워드만 오토마톤에 반영하며, 새로 추가된 구독자는
+        토큰이 없으므로 다음 재시작 때부터 받습니다.
+        
+        Returns:
+            키워드를 다시 반영했는지 여부
+        """
+        if self.registry is None or not self.registry.reload_if_changed():
+            return False
+        
+        keywords = self.registry.keywords()
+        self.router.sync({
+            subscriber_id: keywords.get(subscriber_id, [])
+            for subscriber_id in self.senders
+        })
+        return True
+    
+    @property
+    def has_keywords(self) -> bool:
+        """키워드를 등록한 구독자가 있는지 여부"""
+        return len(self.router.automaton) > 0
+    
+    def _deliver(self, subscriber_id: str, template_objects: List[str]) -> DeliveryResult:
+        sender = self.senders[subscriber_id]
+        limiter = self.limiters[subscriber_id]
+        started = time.monotonic()
+        sent = 0
+        
+        try:
+            for template_object in template_objects:
+                limiter.acquire()
+                if not sender.send_template_object(template_object):
+                    return DeliveryResult(subscriber_id, False, time.monotonic() - started,
+                                          sent, "전송 실패")
+                sent += 1
+        except Exception as e:
+            return DeliveryResult(subscriber_id, False, time.monotonic() - started, sent, str(e))
+        
+        return DeliveryResult(subscriber_id, True, time.monotonic() - started, sent)
+    
+    def dispatch(self, template_objects: List[str],
+                 subscriber_ids: Optional[List[str]] = None) -> List[DeliveryResult]:
+        """
+        인코딩된 메시지들을 구독자들에게 병렬 전송
+        
+        구독자 한 명에게는 메시지를 순서대로 보내고, 구독자끼리는 병렬로 보냅니다.
+        
+        Args:
+            template_objects: JSON 인코딩된 template_object 리스트
+            subscriber_ids: 보낼 구독자 ID 리스트 (기본값: 전체)
+        
+        Returns:
+            구독자별 전송 결과 리스트
+        """
+        subscriber_ids = list(self.senders) if subscriber_ids is None else subscriber_ids
+        if not subscriber_ids:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(subscriber_ids))) as executor:
+            return list(executor.map(
+                lambda subscriber_id: self._deliver(subscriber_id, template_objects),
+                subscriber_ids
+            ))
+    
+    def dispatch_stream(self, template_objects: Iterable[str],
+                        subscriber_ids: Optional[List[str]] = None) -> List[DeliveryResult]:
+        """
+        메시지가 만들어지는 대로 하나씩 구독자들에게 병렬 전송
+        
+        dispatch는 메시지를 모두 받은 뒤 보내지만, 이 메서드는 이터러블에서
+        메시지가 나올 때마다 바로 보냅니다. 전송에 실패한 구독자는 이후
+        메시지를 받지 않으므로 구독자별 메시지 순서는 dispatch와 같습니다.
+        
+        Args:
+            template_objects: JSON 인코딩된 template_object 이터러블
+            subscriber_ids: 보낼 구독자 ID 리스트 (기본값: 전체)
+        
+        Returns:
+            구독자별 전송 결과 리스트 (메시지별 결과를 합산)
+        """
+        subscriber_ids = list(self.senders) if subscriber_ids is None else subscriber_ids
+        results = {
+            subscriber_id: DeliveryResult(subscriber_id, True, 0.0)
+            for subscriber_id in subscriber_ids
+        }
+        if not subscriber_ids:
+            return []
+        
+        # 실행기는 스트림 전체에서 하나만 만들어 메시지마다 다시 만들지 않음
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(subscriber_ids))) as executor:
+            for template_object in template_objects:
+                active = [subscriber_id for subscriber_id, result in results.items() if result.success]
+                if not active:
+                    break
+                
+                futures = [executor.submit(self._deliver, subscriber_id, [template_object])
+                           for subscriber_id in active]
+                for future in futures:
+                    result = future.result()
+                    total = results[result.subscriber_id]
+                    total.success = result.success
+                    total.latency += result.latency
+                    total.messages_sent += result.messages_sent
+                    total.error = result.error
+        
+        return list(results.values())
+    
+    def _send_groups(self, groups: Iterable[Tuple[Optional[List[str]], Iterable[str]]]) -> bool:
+        """
+        묶음별로 메시지를 전송하고, 일부 구독자만 실패하면 그 구독자에게 보내지 못한
+        메시지를 발송 대기열에 구독자별 작업으로 저장
+        
+        Args:
+            groups: (구독자 ID 리스트 또는 None(전체), 메시지 이터러블) 리스트
+        
+        Returns:
+            모두 전송했거나 실패한 구독자의 메시지를 대기열에 저장했는지 여부
+            (모두 실패했거나 대기열이 없으면 False)
+        """
+        results = []
+        unsent: List[Tuple[str, List[str]]] = []
+        
+        for subscriber_ids, template_objects in groups:
+            iterator = iter(template_objects)
+            payloads: List[str] = []
+            
+            def collect():
+                for template_object in iterator:
+                    payloads.append(template_object)
+                    yield template_object
+            
+            group_results = self.dispatch_stream(collect(), subscriber_ids)
+            results.extend(group_results)
+            if not all(result.success for result in group_results):
+                # 전원이 실패하면 남은 메시지를 렌더링하지 않고 멈추므로 마저 꺼냄
+                payloads.extend(iterator)
+                unsent.extend((result.subscriber_id, payloads[result.messages_sent:])
+                              for result in group_results if not result.success)
+        
+        print_report(results)
+        if not unsent:
+            return True
+        if len(unsent) == len(results) or self.redelivery is None:
+            return False
+        
+        queued = sum(self.redelivery.enqueue(payloads, [subscriber_id]) for subscriber_id, payloads in unsent)
+        print(f"📮 전송 실패한 구독자 {len(unsent)}명의 메시지 {queued}개를 발송 대기열에 저장")
+        return True
+    
+    def send_template_objects(self, template_objects: Iterable[str],
+                              subscriber_ids: Optional[List[str]] = None) -> bool:
+        """
+        인코딩된 메시지들을 구독자들에게 전송하고 결과 출력
+        
+        일부 구독자만 실패하면 그 구독자가 받지 못한 메시지만 발송 대기열에
+        넣고 성공으로 취급합니다. (토큰이 만료된 구독자 한 명 때문에 나머지
+        구독자가 같은 기사를 반복해서 받지 않으면서도 실패한 구독자의 기사를
+        잃지 않도록) 메시지는 이터러블에서 나오는 대로 바로 전송합니다.
+        
+        Args:
+            template_objects: JSON 인코딩된 template_object 이터러블
+            subscriber_ids: 보낼 구독자 ID 리스트 (기본값: 전체)
+        
+        Returns:
+            모든 구독자의 몫을 보냈거나 대기열에 저장했는지 여부
+        """
+        return self._send_groups([(subscriber_ids, template_objects)])
+    
+    def route_messages(self, news_list: Sequence[Mapping], renderer) -> List[Tuple[List[str], Iterator[str]]]:
+        """
+        구독자 키워드에 맞게 기사를 나누고 묶음별 메시지 준비
+        
+        모든 제목을 키워드 오토마톤으로 한 번씩만 훑어 구독자별 기사를 나누고,
+        같은 기사 묶음을 받는 구독자끼리는 메시지를 한 번만 렌더링합니다.
+        받을 기사가 없는 구독자는 제외합니다.
+        
+        Args:
+            news_list: 뉴스 리스트
+            renderer: 메시지 렌더러 (MessageRenderer)
+        
+        Returns:
+            (구독자 ID 리스트, 메시지 이터레이터) 리스트 (메시지는 꺼낼 때 렌더링)
+        """
+        self.reload_keywords()
+        
+        index_of = {id(news): index for index, news in enumerate(news_list)}
+        groups: Dict[tuple, List[str]] = {}
+        for subscriber_id, routed in self.router.route(news_list, self.senders).items():
+            if routed:
+                groups.setdefault(tuple(index_of[id(news)] for news in routed), []).append(subscriber_id)
+        
+        print(f"🔑 키워드 매칭: 구독자 {sum(map(len, groups.values()))}명, 기사 묶음 {len(groups)}종")
+        return [
+            (subscriber_ids, renderer.iter_render([news_list[index] for index in indices]))
+            for indices, subscriber_ids in groups.items()
+        ]
+    
+    def send_news(self, news_list: Sequence[Mapping], renderer) -> bool:
+        """
+        구독자 키워드에 맞는 기사만 골라 렌더링하고 전송 (route_messages 참고)
+        
+        Args:
+            news_list: 뉴스 리스트
+            renderer: 메시지 렌더러 (MessageRenderer)
+        
+        Returns:
+            모든 구독자의 몫을 보냈거나 대기열에 저장했는지 여부 (받을 구독자가 없으면 True)
+        """
+        groups = self.route_messages(news_list, renderer)
+        if not groups:
+            return True
+        return self._send_groups(groups)
+    
+    def send_message(self, message: str) -> bool:
+        """텍스트 메시지를 한 번 인코딩하여 전체 구독자에게 전송"""
+        return self.send_template_objects([KakaoSender.build_text_template(message)])
+    
+    def stats(self) -> dict:
+        """공유 재시도 정책/서킷 브레이커 통계 (KakaoSender.stats와 같은 형식)"""
+        if not self.senders:
+            return {
+                'retry': {'attempts': 0, 'retries': 0},
+                'kauth': {'state': CircuitBreaker.CLOSED},
+                'kapi': {'state': CircuitBreaker.CLOSED},
+            }
+        return next(iter(self.senders.values())).stats()
+
+
+def print_report(results: List[DeliveryResult]):
+    """구독자별 전송 결과 요약 출력"""
+    succeeded = [result for result in results if result.success]
+    print(f"📬 구독자 {len(results)}명 중 {len(succeeded)}명 전송 성공")
+    
+    if succeeded:
+        latencies = sorted(result.latency for result in succeeded)
+        print(f"   지연 시간: 중앙값 {latencies[len(latencies) // 2]:.2f}초, 최대 {latencies[-1]:.2f}초")
+    
+    for result in results:
+        if not result.success:
+            print(f"   ❌ {result.subscriber_id}: {result.error}")
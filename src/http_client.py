@@ -0,0 +1,156 @@
+"""
+공용 HTTP 전송 모듈
+크롤러와 카카오 전송 모듈이 함께 사용하는 keep-alive 커넥션 풀을 제공합니다.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import get_metrics
+
+
+# 기본 타임아웃 (연결, 읽기) 초 단위
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class HttpTransport:
+    """호스트별 keep-alive 커넥션 풀을 관리하는 HTTP 전송 클래스"""
+    
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 timeout: Tuple[float, float] = DEFAULT_TIMEOUT):
+        """
+        Args:
+            pool_connections: 유지할 호스트별 커넥션 풀 개수
+            pool_maxsize: 호스트별 최대 커넥션 수
+            timeout: 기본 (연결, 읽기) 타임아웃
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+    
+    @classmethod
+    def from_env(cls) -> 'HttpTransport':
+        """
+        환경 변수로 설정한 HttpTransport 생성
+        
+        HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+        HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT을 사용합니다.
+        """
+        return cls(
+            pool_connections=int(os.getenv('HTTP_POOL_CONNECTIONS', 10)),
+            pool_maxsize=int(os.getenv('HTTP_POOL_MAXSIZE', 10)),
+            timeout=(
+                float(os.getenv('HTTP_CONNECT_TIMEOUT', DEFAULT_TIMEOUT[0])),
+                float(os.getenv('HTTP_READ_TIMEOUT', DEFAULT_TIMEOUT[1]))
+            )
+        )
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        HTTP 요청 전송
+        
+        timeout을 지정하지 않으면 기본 타임아웃이 적용됩니다.
+        계측이 켜져 있으면 호스트별 지연 시간 히스토그램과 응답 바이트 수를
+        기록합니다. 새 연결을 연 요청은 connection=new로 구분되므로 재사용
+        요청과의 차이로 DNS 조회/연결 비용을 볼 수 있습니다.
+        
+        Raises:
+            requests.RequestException: 요청 실패 시
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        
+        metrics = get_metrics()
+        if not metrics.enabled:
+            return self.session.request(method, url, **kwargs)
+        
+        host = host_of(url)
+        connections = self._connection_count()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            metrics.inc('http_errors_total', host=host, error=type(e).__name__)
+            raise
+        
+        elapsed = time.perf_counter() - started
+        connection = 'new' if self._connection_count() > connections else 'reused'
+        metrics.observe('http_request_duration_seconds', elapsed, host=host, connection=connection)
+        metrics.inc('http_requests_total', host=host, method=method, status=response.status_code)
+        if not kwargs.get('stream'):
+            metrics.inc('http_response_bytes_total', len(response.content), host=host)
+        return response
+    
+    def _connection_count(self) -> int:
+        pools = self.adapter.poolmanager.pools
+        total = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                total += pool.num_connections
+        return total
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청"""
+        return self.request('POST', url, **kwargs)
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        호스트별 커넥션 재사용 통계
+        
+        Returns:
+            {호스트: {'requests': 요청 수, 'connections': 새 연결 수,
+                      'reused': 재사용 횟수}}
+        """
+        stats = {}
+        pools = self.adapter.poolmanager.pools
+        
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            entry = stats.setdefault(host, {'requests': 0, 'connections': 0, 'reused': 0})
+            entry['requests'] += pool.num_requests
+            entry['connections'] += pool.num_connections
+            entry['reused'] += max(pool.num_requests - pool.num_connections, 0)
+        
+        return stats
+    
+    def close(self):
+        """모든 커넥션 종료"""
+        self.session.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """프로세스 공용 HttpTransport 반환 (최초 호출 시 생성)"""
+    global _default_transport
+    
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport.from_env()
+        return _default_transport
+
+
+def host_of(url: str) -> str:
+    """URL에서 호스트 이름 추출"""
+    return urlparse(url).netloc
@@ -5,25 +5,125 @@
 
 import requests
 import json
-from typing import Optional
+import threading
+import time
+from typing import Iterable, Optional
+from http_client import HttpTransport, get_transport
+from token_store import TokenStore
+from retry import CircuitBreaker, RetryPolicy
+from metrics import get_metrics
 
 
 class KakaoSender:
     """카카오톡 메시지 전송 클래스"""
     
-    def __init__(self, client_id: str, refresh_token: str, client_secret: str = None):
+    def __init__(self, client_id: str, refresh_token: str, client_secret: str = None,
+                 transport: Optional[HttpTransport] = None,
+                 token_store: Optional[TokenStore] = None,
+                 expiry_margin: float = 300,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 token_breaker: Optional[CircuitBreaker] = None,
+                 message_breaker: Optional[CircuitBreaker] = None,
+                 coordinator=None, recipient_id: Optional[str] = None):
         """
         Args:
             client_id: 카카오 REST API 키
             refresh_token: 카카오 Refresh Token
             client_secret: 카카오 Client Secret (선택)
+            transport: HTTP 전송 객체 (기본값: 프로세스 공용 transport)
+            token_store: 토큰 저장소 (선택, 지정 시 토큰을 파일에 보관/재사용)
+            expiry_margin: 만료 몇 초 전부터 Access Token을 갱신할지
+            retry_policy: 재시도 정책 (기본값: 최대 4회, 지수 백오프)
+            token_breaker: kauth 서킷 브레이커 (기본값: 새로 생성)
+            message_breaker: kapi 서킷 브레이커 (기본값: 새로 생성)
+            coordinator: 복제본 조정 객체 (선택, 지정 시 같은 메시지를 복제본 전체에서 한 번만 전송)
+            recipient_id: 전송 임대에 쓰는 수신자 ID (기본값: client_id)
         """
         self.client_id = client_id
         self.refresh_token = refresh_token
         self.client_secret = client_secret  # 이 줄 추가
         self.access_token = None
+        self.access_token_expires_at = 0.0
+        self.expiry_margin = expiry_margin
         self.token_url = "https://kauth.kakao.com/oauth/token"
         self.message_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        self.transport = transport or get_transport()
+        self.token_store = token_store
+        self._refresh_lock = threading.Lock()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.token_breaker = token_breaker or CircuitBreaker('kauth')
+        self.message_breaker = message_breaker or CircuitBreaker('kapi')
+        self.coordinator = coordinator
+        self.recipient_id = recipient_id or client_id
+        
+        if self.token_store is not None:
+            self._load_tokens(self.token_store.load())
+    
+    def _load_tokens(self, stored: dict):
+        # 다른 앱의 토큰이 섞이지 않도록 client_id가 같을 때만 사용
+        if stored.get('client_id') != self.client_id:
+            return
+        
+        # 갱신되어 저장된 Refresh Token이 환경 변수 값보다 최신
+        if stored.get('refresh_token'):
+            self.refresh_token = stored['refresh_token']
+        if stored.get('access_token'):
+            self.access_token = stored['access_token']
+            self.access_token_expires_at = stored.get('expires_at', 0.0)
+    
+    def _save_tokens(self, refresh_token_expires_in: Optional[int] = None):
+        if self.token_store is None:
+            return
+        
+        data = self.token_store.load()
+        data.update({
+            'client_id': self.client_id,
+            'access_token': self.access_token,
+            'expires_at': self.access_token_expires_at,
+            'refresh_token': self.refresh_token,
+        })
+        if refresh_token_expires_in:
+            data['refresh_token_expires_at'] = time.time() + refresh_token_expires_in
+        
+        self.token_store.save(data)
+    
+    def is_token_valid(self) -> bool:
+        """Access Token이 만료 여유 시간 이상 남았는지 확인"""
+        return bool(self.access_token) and time.time() < self.access_token_expires_at - self.expiry_margin
+    
+    def ensure_access_token(self, stale_token: Optional[str] = None) -> bool:
+        """
+        유효한 Access Token 확보 (필요할 때만 kauth 요청)
+        
+        여러 스레드가 동시에 호출해도 갱신 요청은 한 번만 보내고 나머지는
+        그 결과를 공유합니다. 토큰 저장소가 있으면 다른 프로세스가 먼저
+        갱신한 토큰도 재사용합니다.
+        
+        Args:
+            stale_token: 거부된(401) 토큰. 현재 토큰이 이 값이면 만료된 것으로 취급
+        
+        Returns:
+            성공 여부
+        """
+        def usable() -> bool:
+            return self.is_token_valid() and self.access_token != stale_token
+        
+        if usable():
+            return True
+        
+        with self._refresh_lock:
+            # 대기하는 동안 다른 스레드가 이미 갱신했으면 재사용
+            if usable():
+                return True
+            
+            if self.token_store is None:
+                return self.get_access_token()
+            
+            with self.token_store.locked():
+                self._load_tokens(self.token_store.load())
+                if usable():
+                    return True
+                return self.get_access_token()
     
     def get_access_token(self) -> bool:
         """
@@ -32,6 +132,13 @@ class KakaoSender:
         Returns:
             성공 여부
         """
+        metrics = get_metrics()
+        with metrics.span('token_refresh'):
+            success = self._request_access_token()
+        metrics.inc('token_refresh_total', result='ok' if success else 'error')
+        return success
+    
+    def _request_access_token(self) -> bool:
         data = {
             'grant_type': 'refresh_token',
             'client_id': self.client_id,
@@ -40,9 +147,12 @@ class KakaoSender:
         
         if self.client_secret:
             data['client_secret'] = self.client_secret
-
+        
         try:
-            response = requests.post(self.token_url, data=data)
+            response = self.retry_policy.call(
+                lambda: self.transport.post(self.token_url, data=data),
+                self.token_breaker
+            )
             
             # 에러 상세 정보 출력
             if response.status_code != 200:
@@ -60,12 +170,18 @@ class KakaoSender:
             
             tokens = response.json()
             self.access_token = tokens.get('access_token')
+            self.access_token_expires_at = time.time() + tokens.get('expires_in', 0)
             
             # Refresh Token이 갱신된 경우 업데이트
             new_refresh_token = tokens.get('refresh_token')
             if new_refresh_token:
                 self.refresh_token = new_refresh_token
-                print(f"⚠️ Refresh Token이 갱신되었습니다: {new_refresh_token}")
+                if self.token_store is not None:
+                    print("⚠️ Refresh Token이 갱신되어 토큰 저장소에 보관했습니다.")
+                else:
+                    print(f"⚠️ Refresh Token이 갱신되었습니다: {new_refresh_token}")
+            
+            self._save_tokens(tokens.get('refresh_token_expires_in'))
             
             print("✅ Access Token 발급 성공")
             return True
@@ -74,26 +190,17 @@ class KakaoSender:
             print(f"❌ Access Token 발급 실패: {e}")
             return False
     
-    def send_message(self, message: str) -> bool:
+    @staticmethod
+    def build_text_template(message: str) -> str:
         """
-        카카오톡 '나에게 보내기'로 메시지 전송
+        텍스트 템플릿을 template_object 문자열로 인코딩
         
         Args:
             message: 전송할 메시지
         
         Returns:
-            성공 여부
+            JSON 인코딩된 template_object
         """
-        if not self.access_token:
-            if not self.get_access_token():
-                return False
-        
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        
-        # 텍스트 템플릿 생성
         template = {
             "object_type": "text",
             "text": message,
@@ -103,32 +210,118 @@ class KakaoSender:
             },
             "button_title": "뉴스 보러가기"
         }
+        return json.dumps(template)
+    
+    def send_message(self, message: str) -> bool:
+        """
+        카카오톡 '나에게 보내기'로 메시지 전송
         
-        data = {
-            'template_object': json.dumps(template)
+        Args:
+            message: 전송할 메시지
+        
+        Returns:
+            성공 여부
+        """
+        return self.send_template_object(self.build_text_template(message))
+    
+    def send_template_objects(self, template_objects: Iterable[str]) -> bool:
+        """
+        인코딩된 메시지 여러 개를 순서대로 전송 (실패 시 중단)
+        
+        Args:
+            template_objects: JSON 인코딩된 template_object 리스트
+        
+        Returns:
+            모두 전송했는지 여부
+        """
+        for template_object in template_objects:
+            if not self.send_template_object(template_object):
+                return False
+        return True
+    
+    def send_template_object(self, template_object: str) -> bool:
+        """
+        인코딩된 template_object를 '나에게 보내기'로 전송
+        
+        여러 수신자에게 같은 메시지를 보낼 때 인코딩을 한 번만 하도록
+        미리 인코딩한 문자열을 받습니다.
+        
+        Args:
+            template_object: JSON 인코딩된 메시지 템플릿
+        
+        Returns:
+            성공 여부
+        """
+        if self.coordinator is not None:
+            sent = self.coordinator.send_once(template_object, self.recipient_id,
+                                              lambda: self._send_measured(template_object))
+            if sent is None:
+                # 다른 복제본이 보내는 중이면 보내지 않은 것으로 보고 다음 전송 때 다시 확인
+                print("⏳ 다른 복제본이 보내는 중인 메시지라 다음 전송 때 다시 확인합니다.")
+                return False
+            return sent
+        return self._send_measured(template_object)
+    
+    def _send_measured(self, template_object: str) -> bool:
+        metrics = get_metrics()
+        with metrics.span('kakao_send'):
+            success = self._send_template_object(template_object)
+        metrics.inc('messages_sent_total', result='ok' if success else 'error')
+        return success
+    
+    def _send_template_object(self, template_object: str) -> bool:
+        if not self.ensure_access_token():
+            return False
+        
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded'
         }
         
-        try:
-            response = requests.post(
-                self.message_url,
-                headers=headers,
-                data=data
-            )
-            response.raise_for_status()
-            
-            print("✅ 카카오톡 메시지 전송 성공")
-            return True
+        data = {
+            'template_object': template_object
+        }
         
-        except requests.RequestException as e:
-            print(f"❌ 카카오톡 메시지 전송 실패: {e}")
+        # 401은 토큰을 한 번만 재발급한 뒤 다시 시도
+        for auth_attempt in range(2):
+            access_token = self.access_token
+            headers['Authorization'] = f'Bearer {access_token}'
             
-            # Access Token 만료 시 재시도
-            if response.status_code == 401:
-                print("🔄 Access Token 재발급 후 재시도...")
-                if self.get_access_token():
-                    return self.send_message(message)
+            try:
+                response = self.retry_policy.call(
+                    lambda: self.transport.post(self.message_url, headers=headers, data=data),
+                    self.message_breaker,
+                    idempotent=False
+                )
+                
+                if response.status_code == 401 and auth_attempt == 0:
+                    print("🔄 Access Token 재발급 후 재시도...")
+                    if not self.ensure_access_token(stale_token=access_token):
+                        return False
+                    continue
+                
+                response.raise_for_status()
+                
+                print("✅ 카카오톡 메시지 전송 성공")
+                return True
             
-            return False
+            except requests.RequestException as e:
+                print(f"❌ 카카오톡 메시지 전송 실패: {e}")
+                return False
+        
+        return False
+    
+    def stats(self) -> dict:
+        """
+        재시도/서킷 브레이커 통계
+        
+        Returns:
+            {'retry': 재시도 통계, 'kauth': 브레이커 상태, 'kapi': 브레이커 상태}
+        """
+        return {
+            'retry': self.retry_policy.stats(),
+            'kauth': self.token_breaker.stats(),
+            'kapi': self.message_breaker.stats(),
+        }
 
 
 if __name__ == "__main__":
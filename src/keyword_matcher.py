@@ -0,0 +1,221 @@
+"""
+키워드 구독 매칭 모듈
+모든 구독자의 키워드를 Aho-Corasick 오토마톤 하나로 만들어, 제목을 한 번만
+훑어서 걸린 키워드와 그 키워드를 구독한 구독자를 찾습니다.
+
+키워드가 바뀌면 트라이에 노드만 추가/비활성화하고, 실패 링크와 출력 목록은
+다음 매칭 때 한 번만 다시 계산합니다. 비활성 키워드가 많이 쌓이면 트라이를
+새로 만듭니다.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+def normalize_keyword(keyword: str) -> str:
+    """비교용 키워드 (앞뒤 공백 제거, 소문자)"""
+    return keyword.strip().lower()
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매칭 오토마톤"""
+    
+    def __init__(self, keywords: Iterable[str] = ()):
+        """
+        Args:
+            keywords: 초기 키워드 목록
+        """
+        self.keywords: Set[str] = set()
+        self.builds = 0
+        self._reset_trie()
+        for keyword in keywords:
+            self.add(keyword)
+    
+    def _reset_trie(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[Optional[str]] = [None]
+        self._out: List[Tuple[str, ...]] = [()]
+        self._inactive = 0
+        self._dirty = False
+    
+    def _insert(self, keyword: str):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(None)
+                self._out.append(())
+            state = next_state
+        
+        if self._terminal[state] == keyword:
+            self._inactive -= 1
+        self._terminal[state] = keyword
+    
+    def add(self, keyword: str):
+        """키워드 추가 (다음 매칭 전에 링크를 다시 계산)"""
+        keyword = normalize_keyword(keyword)
+        if not keyword or keyword in self.keywords:
+            return
+        self.keywords.add(keyword)
+        self._insert(keyword)
+        self._dirty = True
+    
+    def remove(self, keyword: str):
+        """키워드 제거 (트라이 노드는 남기고 출력에서만 제외)"""
+        keyword = normalize_keyword(keyword)
+        if keyword not in self.keywords:
+            return
+        self.keywords.discard(keyword)
+        self._inactive += 1
+        self._dirty = True
+    
+    def _compile(self):
+        # 비활성 키워드가 활성 키워드보다 많으면 트라이를 새로 만듦
+        if self._inactive > len(self.keywords):
+            self._reset_trie()
+            for keyword in self.keywords:
+                self._insert(keyword)
+        
+        # 너비 우선으로 실패 링크와 (실패 링크를 따라 모은) 출력 목록 계산
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        
+        while queue:
+            state = queue.popleft()
+            terminal = self._terminal[state]
+            own = (terminal,) if terminal is not None and terminal in self.keywords else ()
+            self._out[state] = own + self._out[self._fail[state]]
+            
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                queue.append(child)
+        
+        self._dirty = False
+        self.builds += 1
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        텍스트에서 키워드 찾기 (한 번 훑기)
+        
+        Yields:
+            (키워드가 끝나는 위치, 키워드) 튜플
+        """
+        if self._dirty:
+            self._compile()
+        
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        
+        for position, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for keyword in out[state]:
+                    yield position, keyword
+    
+    def find(self, text: str) -> Set[str]:
+        """텍스트에 들어 있는 키워드 집합"""
+        return {keyword for _, keyword in self.iter_matches(text)}
+    
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+class KeywordRouter:
+    """구독자별 키워드로 기사를 나누는 클래스"""
+    
+    def __init__(self):
+        self.automaton = KeywordAutomaton()
+        self._subscribers_by_keyword: Dict[str, Set[str]] = {}
+        self._keywords_by_subscriber: Dict[str, Set[str]] = {}
+    
+    def set_keywords(self, subscriber_id: str, keywords: Iterable[str]):
+        """
+        구독자 키워드 설정 (이전 목록과 다른 키워드만 오토마톤에 반영)
+        
+        Args:
+            subscriber_id: 구독자 ID
+            keywords: 키워드 목록 (비어 있으면 모든 기사를 받음)
+        """
+        new = {normalize_keyword(keyword) for keyword in keywords} - {''}
+        old = self._keywords_by_subscriber.get(subscriber_id, set())
+        
+        for keyword in new - old:
+            subscribers = self._subscribers_by_keyword.setdefault(keyword, set())
+            if not subscribers:
+                self.automaton.add(keyword)
+            subscribers.add(subscriber_id)
+        
+        for keyword in old - new:
+            subscribers = self._subscribers_by_keyword[keyword]
+            subscribers.discard(subscriber_id)
+            if not subscribers:
+                del self._subscribers_by_keyword[keyword]
+                self.automaton.remove(keyword)
+        
+        if new:
+            self._keywords_by_subscriber[subscriber_id] = new
+        else:
+            self._keywords_by_subscriber.pop(subscriber_id, None)
+    
+    def remove_subscriber(self, subscriber_id: str):
+        self.set_keywords(subscriber_id, ())
+    
+    def sync(self, subscribers: Mapping[str, Sequence[str]]):
+        """
+        구독자 ID → 키워드 목록으로 전체 상태 맞추기 (바뀐 구독자만 반영)
+        
+        Args:
+            subscribers: 구독자 ID → 키워드 목록 (없는 구독자는 키워드 구독 해제)
+        """
+        for subscriber_id in set(self._keywords_by_subscriber) - set(subscribers):
+            self.remove_subscriber(subscriber_id)
+        for subscriber_id, keywords in subscribers.items():
+            self.set_keywords(subscriber_id, keywords)
+    
+    def has_keywords(self, subscriber_id: str) -> bool:
+        return subscriber_id in self._keywords_by_subscriber
+    
+    def match(self, text: str) -> Set[str]:
+        """텍스트에 걸린 키워드를 구독한 구독자 ID 집합"""
+        matched = set()
+        for keyword in self.automaton.find(text):
+            matched |= self._subscribers_by_keyword[keyword]
+        return matched
+    
+    def route(self, news_list: Sequence[Mapping], subscriber_ids: Iterable[str]) -> Dict[str, List[Mapping]]:
+        """
+        구독자별로 받을 기사 나누기
+        
+        키워드가 없는 구독자는 모든 기사를, 키워드가 있는 구독자는 제목에
+        키워드가 들어간 기사만 받습니다. 제목은 한 번씩만 훑습니다.
+        
+        Args:
+            news_list: 뉴스 리스트
+            subscriber_ids: 보낼 구독자 ID 목록
+        
+        Returns:
+            구독자 ID → 기사 리스트 (입력 순서 유지)
+        """
+        routes = {subscriber_id: [] for subscriber_id in subscriber_ids}
+        everything = [subscriber_id for subscriber_id in routes if not self.has_keywords(subscriber_id)]
+        
+        for news in news_list:
+            for subscriber_id in everything:
+                routes[subscriber_id].append(news)
+            for subscriber_id in self.match(news['title']):
+                if subscriber_id in routes:
+                    routes[subscriber_id].append(news)
+        
+        return routes
@@ -0,0 +1,243 @@
+"""
+뉴스 목록 페이지 파서 모듈
+list.naver 목록 페이지에서 기사 제목과 URL, 사진 기사(dt.photo)의 썸네일
+URL을 추출합니다.
+
+기본 'fast' 백엔드는 원본 바이트를 한 번만 디코딩하고 ul.type06_headline /
+ul.type06 영역만 스트리밍으로 처리합니다. 'bs4' 백엔드는 기존
+BeautifulSoup 전체 트리 방식이며 비교 및 대체용으로 남겨 둡니다.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Dict, Optional
+
+
+PARSER_BACKENDS = ('fast', 'bs4')
+
+# 목록 페이지 기본 문자셋 (헤더/메타 태그에 없을 때)
+DEFAULT_CHARSET = 'utf-8'
+
+# euc-kr로 표기된 페이지에도 확장 완성형 글자가 섞여 있어 cp949로 디코딩
+CHARSET_ALIASES = {
+    'euc-kr': 'cp949',
+    'euckr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+}
+
+_HEADER_CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+_BASE_URL = 'https://news.naver.com'
+
+
+def detect_charset(content: bytes, content_type: Optional[str] = None) -> str:
+    """
+    응답 문자셋 결정 (Content-Type 헤더 → meta 태그 → 기본값 순)
+    
+    Args:
+        content: 응답 본문 바이트
+        content_type: Content-Type 헤더 값
+    
+    Returns:
+        디코딩에 사용할 문자셋 이름
+    """
+    match = _HEADER_CHARSET.search(content_type or '')
+    if match:
+        charset = match.group(1)
+    else:
+        match = _META_CHARSET.search(content[:2048])
+        charset = match.group(1).decode('ascii') if match else DEFAULT_CHARSET
+    
+    charset = charset.lower()
+    return CHARSET_ALIASES.get(charset, charset)
+
+
+def decode_body(content: bytes, content_type: Optional[str] = None) -> str:
+    """응답 본문을 문자셋 감지 없이 한 번에 디코딩"""
+    try:
+        return content.decode(detect_charset(content, content_type), errors='replace')
+    except LookupError:
+        return content.decode(DEFAULT_CHARSET, errors='replace')
+
+
+def _absolute_url(url: str) -> str:
+    # URL이 상대경로인 경우 절대경로로 변환
+    if url.startswith('/'):
+        return _BASE_URL + url
+    return url
+
+
+class _ListPageParser(HTMLParser):
+    """ul.type06_headline / ul.type06 영역의 li만 추적하는 스트리밍 파서"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headline_items: List[Dict[str, str]] = []
+        self.normal_items: List[Dict[str, str]] = []
+        self._ul_stack: List[Optional[str]] = []
+        self._li_target: Optional[List[Dict[str, str]]] = None
+        self._li_depth = 0
+        self._dt_stack: List[bool] = []
+        self._dt_link: Optional[Dict] = None
+        self._any_link: Optional[Dict] = None
+        self._link: Optional[Dict] = None
+        self._thumbnail: Optional[str] = None
+    
+    def _target_list(self) -> Optional[List[Dict[str, str]]]:
+        for kind in reversed(self._ul_stack):
+            if kind == 'headline':
+                return self.headline_items
+            if kind == 'normal':
+                return self.normal_items
+        return None
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'ul':
+            classes = (dict(attrs).get('class') or '').split()
+            if 'type06_headline' in classes:
+                self._ul_stack.append('headline')
+            elif 'type06' in classes:
+                self._ul_stack.append('normal')
+            else:
+                self._ul_stack.append(None)
+            return
+        
+        if tag == 'li':
+            target = self._target_list()
+            if target is None:
+                return
+            if self._li_target is not None and len(self._ul_stack) == self._li_depth:
+                # 닫히지 않은 li는 다음 li 시작 시 닫힌 것으로 처리
+                self._finish_item()
+            if self._li_target is None:
+                self._li_target = target
+                self._li_depth = len(self._ul_stack)
+            return
+        
+        if self._li_target is None:
+            return
+        
+        if tag == 'dt':
+            classes = (dict(attrs).get('class') or '').split()
+            self._dt_stack.append('photo' not in classes)
+        elif tag == 'img' and self._thumbnail is None:
+            self._thumbnail = dict(attrs).get('src') or None
+        elif tag == 'a' and self._link is None:
+            self._link = {
+                'href': dict(attrs).get('href') or '',
+                'chunks': [],
+                'in_dt': any(self._dt_stack),
+            }
+    
+    def handle_endtag(self, tag):
+        if tag == 'ul':
+            if self._li_target is not None and len(self._ul_stack) == self._li_depth:
+                self._finish_item()
+            if self._ul_stack:
+                self._ul_stack.pop()
+        elif self._li_target is None:
+            return
+        elif tag == 'li':
+            if len(self._ul_stack) == self._li_depth:
+                self._finish_item()
+        elif tag == 'dt':
+            if self._dt_stack:
+                self._dt_stack.pop()
+        elif tag == 'a' and self._link is not None:
+            link = self._link
+            self._link = None
+            if link['in_dt'] and self._dt_link is None:
+                self._dt_link = link
+            if self._any_link is None:
+                self._any_link = link
+    
+    def handle_data(self, data):
+        if self._link is not None:
+            text = data.strip()
+            if text:
+                self._link['chunks'].append(text)
+    
+    def _finish_item(self):
+        link = self._dt_link or self._any_link
+        if link is not None:
+            item = {
+                'title': ''.join(link['chunks']),
+                'url': _absolute_url(link['href'])
+            }
+            if self._thumbnail:
+                item['thumbnail'] = _absolute_url(self._thumbnail)
+            self._li_target.append(item)
+        
+        self._li_target = None
+        self._li_depth = 0
+        self._dt_stack = []
+        self._dt_link = None
+        self._any_link = None
+        self._link = None
+        self._thumbnail = None
+
+
+def _parse_fast(html: str) -> List[Dict[str, str]]:
+    # 첫 type06 목록 앞의 <ul>부터 마지막 </ul>까지만 파싱
+    first = html.find('type06')
+    if first == -1:
+        return []
+    start = max(html.rfind('<ul', 0, first), 0)
+    end = html.rfind('</ul>')
+    end = len(html) if end == -1 else end + len('</ul>')
+    
+    parser = _ListPageParser()
+    parser.feed(html[start:end])
+    parser.close()
+    if parser._li_target is not None:
+        parser._finish_item()
+    
+    return parser.headline_items + parser.normal_items
+
+
+def _parse_bs4(html: str) -> List[Dict[str, str]]:
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    news_list = []
+    
+    # 뉴스 리스트 추출
+    news_items = soup.select('ul.type06_headline li') + soup.select('ul.type06 li')
+    
+    for item in news_items:
+        link_tag = item.select_one('dt:not(.photo) a') or item.select_one('a')
+        if link_tag:
+            news = {
+                'title': link_tag.get_text(strip=True),
+                'url': _absolute_url(link_tag.get('href', ''))
+            }
+            thumbnail = next((img['src'] for img in item.find_all('img') if img.get('src')), None)
+            if thumbnail:
+                news['thumbnail'] = _absolute_url(thumbnail)
+            news_list.append(news)
+    
+    return news_list
+
+
+def parse_news_list(content: bytes, content_type: Optional[str] = None,
+                    backend: str = 'fast') -> List[Dict[str, str]]:
+    """
+    목록 페이지에서 뉴스 추출
+    
+    Args:
+        content: 응답 본문 바이트
+        content_type: Content-Type 헤더 값 (문자셋 결정용)
+        backend: 파서 백엔드 ('fast' 또는 'bs4')
+    
+    Returns:
+        뉴스 리스트 (제목, URL, 사진 기사는 썸네일 URL 포함)
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드: {backend}")
+    
+    html = decode_body(content, content_type)
+    
+    if backend == 'bs4':
+        return _parse_bs4(html)
+    return _parse_fast(html)
@@ -5,25 +5,98 @@
 
 import os
 import sys
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from dotenv import load_dotenv
-from crawler import NaverNewsCrawler
+from typing import TYPE_CHECKING, List, Optional, Union
+from crawler import NaverNewsCrawler, Section, parse_sections
 from kakao_sender import KakaoSender
+from http_client import get_transport
+from disk_cache import DiskLRUCache
+from seen_index import SeenArticleIndex
+from token_store import TokenStore
+from fanout import FanoutDispatcher, SubscriberRegistry
+from message_renderer import MessageRenderer
+from watermark import HighWaterMarkStore
+from metrics import get_metrics
+from outbox import Outbox, deliver, print_stats
+from archive import HeadlineArchive
+from coordination import Coordinator
+from enrichment import ArticleEnricher
+from thumbnails import ThumbnailCache
 
-# .env 파일 로드 (프로젝트 루트 기준)
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+if TYPE_CHECKING:
+    # NumPy를 쓰는 묶음 처리기는 CLUSTER_STORIES=true일 때만 로드
+    from clustering import StoryClusterer
 
+project_root = Path(__file__).parent.parent
+env_path = project_root / '.env'
 
-def main():
-    """메인 함수"""
-    print("=" * 50)
-    print("📰 네이버 뉴스 카카오톡 자동 발송 봇")
-    print(f"⏰ 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 50)
+
+def load_env():
+    """.env 파일 로드 (프로젝트 루트 기준, 파일이 없으면 건너뜀)"""
+    if not env_path.exists():
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=env_path)
+
+
+def create_crawler() -> NaverNewsCrawler:
+    """
+    목록 캐시를 연결한 크롤러 생성
+    
+    CRAWL_MODE=incremental이면 섹션별 기준점 저장소를, ARCHIVE_DIR이
+    설정되어 있으면 기사 보관소도 연결합니다.
+    """
+    cache = DiskLRUCache(
+        os.getenv('NEWS_CACHE_DIR', str(project_root / '.cache' / 'list_pages')),
+        max_entries=int(os.getenv('NEWS_CACHE_MAX_ENTRIES', 500))
+    )
+    
+    watermarks = None
+    if os.getenv('CRAWL_MODE', 'latest') == 'incremental':
+        watermarks = HighWaterMarkStore(
+            os.getenv('WATERMARK_PATH', str(project_root / 'data' / 'watermarks.json'))
+        )
+    
+    archive = None
+    if os.getenv('ARCHIVE_DIR'):
+        archive = HeadlineArchive.from_env(os.getenv('ARCHIVE_DIR'))
+    
+    return NaverNewsCrawler(cache=cache, watermarks=watermarks, archive=archive)
+
+
+def create_sender(coordinator: Optional[Coordinator] = None) -> Optional[Union[KakaoSender, FanoutDispatcher]]:
+    """
+    환경 변수로 카카오 전송 객체 생성 (설정이 없으면 None)
+    
+    SUBSCRIBERS_FILE이 설정되어 있으면 구독자 전체에게 보내는
+    FanoutDispatcher를, 아니면 단일 KakaoSender를 생성합니다.
+    coordinator를 넘기면 같은 메시지를 복제본 전체에서 한 번만 보냅니다.
+    일부 구독자에게 보내지 못한 메시지는 발송 대기열(OUTBOX_PATH, 없으면
+    data/redelivery.db)에 그 구독자 몫으로 저장해 다음 사이클에 다시 보냅니다.
+    """
+    subscribers_file = os.getenv('SUBSCRIBERS_FILE')
+    if subscribers_file:
+        registry = SubscriberRegistry(subscribers_file)
+        if not len(registry):
+            print(f"❌ 오류: 구독자가 없습니다 ({subscribers_file})")
+            return None
+        
+        print(f"👥 구독자 {len(registry)}명에게 전송합니다.")
+        return FanoutDispatcher.from_registry(
+            registry,
+            os.getenv('SUBSCRIBER_TOKEN_DIR', str(project_root / 'data' / 'tokens')),
+            max_workers=int(os.getenv('FANOUT_WORKERS', 16)),
+            coordinator=coordinator,
+            rate_per_token=float(os.getenv('FANOUT_RATE_PER_TOKEN', 1.0)),
+            redelivery=Outbox.from_env(
+                os.getenv('OUTBOX_PATH') or str(project_root / 'data' / 'redelivery.db')
+            )
+        )
     
-    # 환경 변수 로드
     client_id = os.getenv('KAKAO_CLIENT_ID')
     refresh_token = os.getenv('KAKAO_REFRESH_TOKEN')
     client_secret = os.getenv('KAKAO_CLIENT_SECRET')
@@ -31,33 +104,368 @@ def main():
     if not client_id or not refresh_token:
         print("❌ 오류: 환경 변수가 설정되지 않았습니다.")
         print("   KAKAO_CLIENT_ID와 KAKAO_REFRESH_TOKEN을 설정해주세요.")
-        sys.exit(1)
+        return None
     
+    token_store = TokenStore(os.getenv('KAKAO_TOKEN_STORE', str(project_root / 'data' / 'kakao_token.json')))
+    return KakaoSender(client_id, refresh_token, client_secret, token_store=token_store,
+                       coordinator=coordinator)
+
+
+def create_seen_index() -> SeenArticleIndex:
+    """발송 이력 인덱스 생성"""
+    return SeenArticleIndex(os.getenv('SEEN_DB_PATH', str(project_root / 'data' / 'seen.db')))
+
+
+def create_renderer() -> MessageRenderer:
+    """메시지 렌더러 생성 (MESSAGE_TEMPLATE: text, list, feed)"""
+    return MessageRenderer(
+        template=os.getenv('MESSAGE_TEMPLATE', 'text'),
+        max_text_length=int(os.getenv('MESSAGE_TEXT_MAX_LENGTH', 200))
+    )
+
+
+def create_clusterer() -> Optional['StoryClusterer']:
+    """CLUSTER_STORIES=true이면 같은 기사 묶음 처리기 생성"""
+    if os.getenv('CLUSTER_STORIES', 'false').lower() != 'true':
+        return None
+    
+    from clustering import StoryClusterer
+    return StoryClusterer.from_env()
+
+
+def create_enricher() -> Optional[ArticleEnricher]:
+    """ENRICH_ARTICLES=true이면 기사 상세 페이지 보강 처리기 생성"""
+    if os.getenv('ENRICH_ARTICLES', 'false').lower() != 'true':
+        return None
+    return ArticleEnricher.from_env(
+        os.getenv('ENRICH_CACHE_DIR', str(project_root / '.cache' / 'articles'))
+    )
+
+
+def create_thumbnails() -> Optional[ThumbnailCache]:
+    """THUMBNAILS=true이고 이미지를 쓰는 템플릿(feed, list)이면 썸네일 캐시 생성"""
+    if os.getenv('THUMBNAILS', 'false').lower() != 'true':
+        return None
+    if os.getenv('MESSAGE_TEMPLATE', 'text') not in ('feed', 'list'):
+        return None
+    return ThumbnailCache.from_env(
+        os.getenv('THUMBNAIL_CACHE_DIR', str(project_root / '.cache' / 'thumbnails'))
+    )
+
+
+def create_outbox() -> Optional[Outbox]:
+    """OUTBOX_PATH가 설정되어 있으면 발송 대기열 생성"""
+    path = os.getenv('OUTBOX_PATH')
+    if not path:
+        return None
+    return Outbox.from_env(path)
+
+
+def create_coordinator() -> Optional[Coordinator]:
+    """
+    COORDINATION_DB가 설정되어 있으면 복제본 조정 객체 생성 (데몬 전용)
+    
+    섹션 분배는 하트비트로 살아 있는 복제본을 판단하므로 하트비트를 계속
+    기록하는 데몬에서만 씁니다. 크론으로 한 번씩 실행하면 복제본마다 보는
+    살아 있는 복제본 목록이 달라 같은 섹션을 여러 번 수집하고 보냅니다.
+    """
+    path = os.getenv('COORDINATION_DB')
+    if not path:
+        return None
+    return Coordinator.from_env(path)
+
+
+def run_cycle(crawler: NaverNewsCrawler, sender: Union[KakaoSender, FanoutDispatcher],
+              seen_index: SeenArticleIndex,
+              renderer: Optional[MessageRenderer] = None,
+              sections: Optional[List[Section]] = None,
+              clusterer: Optional['StoryClusterer'] = None,
+              outbox: Optional[Outbox] = None,
+              coordinator: Optional[Coordinator] = None,
+              enricher: Optional[ArticleEnricher] = None,
+              thumbnails: Optional[ThumbnailCache] = None) -> bool:
+    """
+    크롤링 → 중복 제거 → 전송 한 사이클 실행
+    
+    Args:
+        crawler: 뉴스 크롤러
+        sender: 카카오톡 전송 객체 (단일 수신자 또는 다중 구독자)
+        seen_index: 발송 이력 인덱스
+        renderer: 메시지 렌더러 (기본값: 환경 변수 설정으로 생성)
+        sections: 증분 수집할 섹션 (기본값: CRAWL_SECTIONS)
+        clusterer: 같은 기사 묶음 처리기 (기본값: 환경 변수 설정으로 생성, 일괄 모드 전용)
+        outbox: 발송 대기열 (기본값: OUTBOX_PATH 설정 시 생성, 일괄 모드 전용)
+        coordinator: 복제본 조정 객체 (선택, 데몬 전용, 지정 시 살아 있는 복제본끼리 섹션을 나누어 수집)
+        enricher: 기사 상세 페이지 보강 처리기 (기본값: 환경 변수 설정으로 생성, 일괄 모드 전용)
+        thumbnails: 썸네일 캐시 (기본값: 환경 변수 설정으로 생성, 일괄 모드 전용)
+    
+    PIPELINE_MODE=stream이면 모든 기사를 모으지 않고 수집되는 대로 메시지를
+    만들어 보냅니다. 키워드를 등록한 구독자가 있으면 구독자별로 기사를
+    나누어야 하므로 일괄 모드로 실행합니다.
+    
+    발송 대기열을 쓰면 렌더링한 메시지를 대기열에 저장한 시점에 기사를 발송
+    이력에 기록하고, 전송은 대기열에서 꺼내 보냅니다. (OUTBOX_DELIVERY=worker이면
+    이 사이클에서는 보내지 않고 `python src/outbox.py deliver`가 보냄)
+    
+    Returns:
+        성공 여부 (새 뉴스가 없어 건너뛴 경우도 성공, 대기열을 쓰면 저장 성공 여부)
+    """
+    metrics = get_metrics()
+    if isinstance(sender, FanoutDispatcher):
+        sender.reload_keywords()
+    routed = isinstance(sender, FanoutDispatcher) and sender.has_keywords
+    outbox = outbox or create_outbox()
+    
+    if coordinator is not None:
+        # 최신 모드는 목록 한 페이지만 받으므로 복제본 하나만 수집
+        candidates = ([('001', None)] if crawler.watermarks is None
+                      else sections or parse_sections(os.getenv('CRAWL_SECTIONS', '001')))
+        owned = coordinator.shard(candidates)
+        coordinator.purge(float(os.getenv('SEEN_TTL_DAYS', 30)) * 86400)
+        if not owned:
+            print(f"🤝 담당 섹션이 없어 건너뜁니다. (복제본 {coordinator.replica_id})")
+            return True
+        print(f"🤝 복제본 {coordinator.replica_id}: 섹션 {len(owned)}/{len(candidates)}개 담당")
+        if crawler.watermarks is not None:
+            sections = owned
+    
+    try:
+        with metrics.span('cycle'):
+            if os.getenv('PIPELINE_MODE', 'batch') == 'stream' and not routed and outbox is None:
+                success = _run_stream_cycle(crawler, sender, seen_index, renderer, sections, metrics)
+            else:
+                success = _run_cycle(crawler, sender, seen_index, renderer, sections, clusterer, enricher,
+                                     thumbnails, outbox, metrics)
+            
+            # 대기열이 없어도 구독자별로 다시 보낼 메시지가 저장되어 있을 수 있음
+            queue = outbox if outbox is not None else getattr(sender, 'redelivery', None)
+            if isinstance(queue, Outbox):
+                if os.getenv('OUTBOX_DELIVERY', 'inline') == 'inline':
+                    # 이번 사이클에서 넣은 작업과 지난번에 보내지 못한 작업을 함께 전송
+                    with metrics.span('deliver'):
+                        counts = deliver(queue, sender,
+                                         workers=int(os.getenv('OUTBOX_WORKERS', 1)),
+                                         batch_size=int(os.getenv('OUTBOX_BATCH_SIZE', 10)))
+                    print(f"📤 대기열 전송 {counts['delivered']}개, 실패 {counts['failed']}개")
+                queue.purge(float(os.getenv('OUTBOX_TTL_DAYS', 7)) * 86400)
+                print_stats(queue)
+            
+            return success
+    finally:
+        if crawler.archive is not None:
+            crawler.archive.flush()
+        metrics.log_snapshot()
+
+
+def _run_cycle(crawler: NaverNewsCrawler, sender: Union[KakaoSender, FanoutDispatcher],
+               seen_index: SeenArticleIndex, renderer: Optional[MessageRenderer],
+               sections: Optional[List[Section]], clusterer: Optional['StoryClusterer'],
+               enricher: Optional[ArticleEnricher], thumbnails: Optional[ThumbnailCache],
+               outbox: Optional[Outbox], metrics) -> bool:
     # 1. 네이버 뉴스 크롤링
     print("\n🔍 네이버 뉴스 크롤링 시작...")
-    crawler = NaverNewsCrawler()
-    news_list = crawler.get_breaking_news(limit=10)
+    incremental = crawler.watermarks is not None
+    
+    with metrics.span('crawl'):
+        if incremental:
+            news_list = crawler.crawl_incremental(
+                sections or parse_sections(os.getenv('CRAWL_SECTIONS', '001')),
+                max_pages=int(os.getenv('CRAWL_MAX_PAGES', 10))
+            )
+        else:
+            news_list = crawler.get_breaking_news(limit=10)
+    
+    cache_stats = crawler.cache_stats()
+    print(f"🗂️ 목록 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회")
     
     if not news_list:
+        if incremental:
+            print("ℹ️ 지난 실행 이후 새로운 뉴스가 없습니다.")
+            crawler.commit_watermarks()
+            return True
         print("❌ 뉴스를 가져오지 못했습니다.")
-        sys.exit(1)
+        return False
     
     print(f"✅ {len(news_list)}개의 뉴스를 수집했습니다.")
     
-    # 2. 메시지 포맷팅
-    message = crawler.format_news_message(news_list)
+    # 이미 발송한 기사 제외
+    with metrics.span('dedup'):
+        seen_index.compact(float(os.getenv('SEEN_TTL_DAYS', 30)) * 86400)
+        news_list = seen_index.filter_new(news_list)
+    
+    if not news_list:
+        print("ℹ️ 새로운 뉴스가 없어 전송을 건너뜁니다.")
+        crawler.commit_watermarks()
+        return True
+    
+    print(f"🆕 새로운 뉴스 {len(news_list)}개")
+    
+    # 여러 언론사가 보도한 같은 기사는 하나로 묶음 (발송 이력에는 모두 기록)
+    digest = news_list
+    clusterer = clusterer or create_clusterer()
+    if clusterer is not None:
+        with metrics.span('cluster'):
+            digest = clusterer.collapse(news_list)
+        print(f"🧩 같은 기사 묶음: {len(news_list)}개 → {len(digest)}개")
+    
+    # 보낼 기사(묶음 대표)만 상세 페이지로 언론사/입력 시각/요약/썸네일 보강
+    enricher = enricher or create_enricher()
+    if enricher is not None:
+        digest = enricher.enrich(digest)
+        enrich_stats = enricher.stats()
+        print(f"📝 기사 보강: 캐시 {enrich_stats['hits']}개, 요청 {enrich_stats['fetches']}개, "
+              f"실패 {enrich_stats['errors']}개")
+    
+    # 썸네일은 처음 보는 URL만 받아 확인하고, 쓸 수 없는 이미지는 메시지에서 뺌
+    thumbnails = thumbnails or create_thumbnails()
+    if thumbnails is not None:
+        digest = thumbnails.apply(digest)
+        thumbnail_stats = thumbnails.stats()
+        print(f"🖼️ 썸네일: 메모리 {thumbnail_stats['memory']}회, 디스크 {thumbnail_stats['disk']}회, "
+              f"확인 {thumbnail_stats['fetched']}개, 제외 {thumbnail_stats['rejected']}개")
+    
+    renderer = renderer or create_renderer()
+    
+    if outbox is not None:
+        # 2. 메시지를 렌더링하여 발송 대기열에 저장 (전송은 대기열에서)
+        with metrics.span('render'):
+            if isinstance(sender, FanoutDispatcher) and sender.has_keywords:
+                queued = sum(outbox.enqueue(template_objects, subscriber_ids)
+                             for subscriber_ids, template_objects in sender.route_messages(digest, renderer))
+            else:
+                queued = outbox.enqueue(renderer.render(digest))
+        print(f"📮 발송 대기열에 메시지 {queued}개 저장")
+        sent = True
+    elif isinstance(sender, FanoutDispatcher) and sender.has_keywords:
+        # 2~3. 구독자 키워드별로 기사를 나누어 렌더링 후 전송
+        print("\n📱 카카오톡 메시지 전송 시작 (구독 키워드별)...")
+        with metrics.span('send'):
+            sent = sender.send_news(digest, renderer)
+    else:
+        # 2. 메시지 렌더링 (템플릿 제한에 맞게 최소 개수로 분할)
+        with metrics.span('render'):
+            template_objects = renderer.render(digest)
+        print(f"✉️ {renderer.template} 템플릿 메시지 {len(template_objects)}개")
+        
+        # 3. 카카오톡 전송
+        print("\n📱 카카오톡 메시지 전송 시작...")
+        
+        with metrics.span('send'):
+            sent = sender.send_template_objects(template_objects)
+    
+    if outbox is None:
+        sender_stats = sender.stats()
+        print(f"🔁 카카오 API 재시도 {sender_stats['retry']['retries']}회 "
+              f"(kauth: {sender_stats['kauth']['state']}, kapi: {sender_stats['kapi']['state']})")
+    
+    if not sent:
+        return False
     
-    # 3. 카카오톡 전송
-    print("\n📱 카카오톡 메시지 전송 시작...")
-    sender = KakaoSender(client_id, refresh_token, client_secret)
+    seen_index.add_many(news_list)
+    crawler.commit_watermarks()
     
-    if sender.send_message(message):
+    for host, stats in get_transport().stats().items():
+        print(f"🔌 {host}: 요청 {stats['requests']}회, 연결 재사용 {stats['reused']}회")
+    
+    return True
+
+
+def _run_stream_cycle(crawler: NaverNewsCrawler, sender: Union[KakaoSender, FanoutDispatcher],
+                      seen_index: SeenArticleIndex, renderer: Optional[MessageRenderer],
+                      sections: Optional[List[Section]], metrics) -> bool:
+    # 페이지(증분 모드는 섹션)를 파싱하는 대로 중복 제거 → 렌더링 → 전송으로 흘려보내고
+    # 메시지 하나가 차면 바로 보냄. 발송 이력과 기준점은 모든 메시지를 보낸 뒤 기록
+    print("\n🔍 네이버 뉴스 스트리밍 수집/전송 시작...")
+    incremental = crawler.watermarks is not None
+    seen_index.compact(float(os.getenv('SEEN_TTL_DAYS', 30)) * 86400)
+    
+    if incremental:
+        crawled = crawler.iter_incremental(
+            sections or parse_sections(os.getenv('CRAWL_SECTIONS', '001')),
+            max_pages=int(os.getenv('CRAWL_MAX_PAGES', 10))
+        )
+    else:
+        crawled = crawler.iter_news([('001', None)], pages=1)
+    
+    renderer = renderer or create_renderer()
+    counts = {'crawled': 0, 'messages': 0}
+    delivered = []
+    started = time.perf_counter()
+    
+    def count_crawled(news_iter):
+        for news in news_iter:
+            counts['crawled'] += 1
+            yield news
+    
+    def collect_new(news_iter):
+        for news in news_iter:
+            delivered.append(news)
+            yield news
+    
+    def time_messages(template_objects):
+        for template_object in template_objects:
+            if not counts['messages']:
+                metrics.observe('time_to_first_message_seconds', time.perf_counter() - started)
+            counts['messages'] += 1
+            yield template_object
+    
+    news_iter = count_crawled(crawled if incremental else islice(crawled, 10))
+    stream = time_messages(renderer.iter_render(collect_new(seen_index.iter_new(news_iter))))
+    
+    try:
+        sent = sender.send_template_objects(stream)
+    finally:
+        crawled.close()
+    
+    print(f"✅ 수집 {counts['crawled']}개, 새로운 뉴스 {len(delivered)}개, "
+          f"{renderer.template} 템플릿 메시지 {counts['messages']}개")
+    
+    if not counts['crawled'] and not incremental:
+        print("❌ 뉴스를 가져오지 못했습니다.")
+        return False
+    
+    if not sent:
+        return False
+    
+    if delivered:
+        seen_index.add_many(delivered)
+    else:
+        print("ℹ️ 새로운 뉴스가 없어 전송을 건너뜁니다.")
+    crawler.commit_watermarks()
+    return True
+
+
+def main():
+    """메인 함수"""
+    if '--profile-startup' in sys.argv[1:]:
+        from startup_profile import print_startup_profile
+        print_startup_profile(__file__)
+        return
+    
+    load_env()
+    
+    print("=" * 50)
+    print("📰 네이버 뉴스 카카오톡 자동 발송 봇")
+    print(f"⏰ 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+    
+    if os.getenv('COORDINATION_DB'):
+        print("❌ COORDINATION_DB는 데몬(python src/daemon.py)에서만 사용할 수 있습니다.")
+        sys.exit(1)
+    
+    sender = create_sender()
+    if sender is None:
+        sys.exit(1)
+    
+    success = run_cycle(create_crawler(), sender, create_seen_index())
+    
+    if success:
         print("\n" + "=" * 50)
         print("🎉 모든 작업이 성공적으로 완료되었습니다!")
         print("=" * 50)
     else:
         print("\n" + "=" * 50)
-        print("❌ 메시지 전송에 실패했습니다.")
+        print("❌ 작업에 실패했습니다.")
         print("=" * 50)
         sys.exit(1)
 
@@ -69,4 +477,4 @@ if __name__ == "__main__":
         print(f"\n❌ 예상치 못한 오류 발생: {e}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,200 @@
+"""
+메시지 렌더링 모듈
+뉴스 리스트를 카카오톡 텍스트/리스트/피드 템플릿으로 변환합니다.
+
+기사를 한 번씩만 훑으면서 템플릿별 제한에 맞게 최소 개수의 메시지로
+묶고, 기사별 렌더링 결과(JSON 조각)는 캐시하여 여러 사이클이나 여러
+수신자의 메시지에 같은 기사가 나와도 다시 렌더링하지 않습니다.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from article import outlets_suffix
+
+
+TEMPLATES = ('text', 'list', 'feed')
+
+# 카카오 메시지 템플릿 제한
+TEXT_MAX_LENGTH = 200
+LIST_MAX_ITEMS = 3
+LIST_MIN_ITEMS = 2
+
+DEFAULT_LINK = {
+    "web_url": "https://news.naver.com",
+    "mobile_web_url": "https://news.naver.com"
+}
+
+
+def _encode(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+class MessageRenderer:
+    """뉴스 리스트 → 카카오 template_object 변환 클래스"""
+    
+    def __init__(self, template: str = 'text', header: str = "📰 오늘의 네이버 뉴스",
+                 max_text_length: int = TEXT_MAX_LENGTH, cache_size: int = 4096):
+        """
+        Args:
+            template: 템플릿 종류 ('text', 'list', 'feed')
+            header: 메시지 머리말 (text/list 템플릿)
+            max_text_length: text 템플릿 최대 글자 수
+            cache_size: 기사별 렌더링 캐시 크기
+        
+        Raises:
+            ValueError: 지원하지 않는 템플릿인 경우
+        """
+        if template not in TEMPLATES:
+            raise ValueError(f"지원하지 않는 템플릿: {template}")
+        
+        self.template = template
+        self.header = header
+        self.max_text_length = max_text_length
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: 'OrderedDict[Tuple[str, str, str, object], str]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _cached(self, news: Dict[str, str], render) -> str:
+        key = (self.template, news['url'], news['title'], news.get('outlets'),
+               news.get('press'), news.get('published'), news.get('lead'), news.get('thumbnail'))
+        
+        with self._lock:
+            fragment = self._cache.get(key)
+            if fragment is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return fragment
+            self.cache_misses += 1
+        
+        fragment = render(news)
+        
+        with self._lock:
+            self._cache[key] = fragment
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return fragment
+    
+    @staticmethod
+    def _render_text_item(news: Dict[str, str], title_room: Optional[int] = None) -> str:
+        # title_room을 넘는 제목은 잘라내고 링크 줄은 항상 그대로 둠
+        title = f"{news['title']}{outlets_suffix(news)}"
+        if title_room is not None and len(title) > title_room:
+            title = title[:max(title_room - 1, 0)] + '…'
+        return f"{title}\n   🔗 {news['url']}"
+    
+    @staticmethod
+    def _render_content(news: Dict[str, str]) -> str:
+        link = {"web_url": news['url'], "mobile_web_url": news['url']}
+        content = {"title": news['title'], "link": link}
+        # 보강 단계에서 채운 입력 시각('MM-DD HH:MM')과 첫 문단 요약도 표시
+        published = (news.get('published') or '')[5:16]
+        byline = ' · '.join(value for value in (news.get('press'), published) if value)
+        description = (byline + outlets_suffix(news)).strip()
+        if news.get('lead'):
+            description = f"{description}\n{news['lead']}" if description else news['lead']
+        if description:
+            content["description"] = description
+        if news.get('thumbnail'):
+            content["image_url"] = news['thumbnail']
+        return _encode(content)
+    
+    def _text_message(self, body: str) -> str:
+        return ''.join((
+            '{"object_type": "text", "text": ', _encode(body),
+            ', "link": ', _encode(DEFAULT_LINK),
+            ', "button_title": "뉴스 보러가기"}'
+        ))
+    
+    def _list_message(self, fragments: List[str]) -> str:
+        return ''.join((
+            '{"object_type": "list", "header_title": ', _encode(self.header),
+            ', "header_link": ', _encode(DEFAULT_LINK),
+            ', "contents": [', ', '.join(fragments), ']}'
+        ))
+    
+    def _feed_message(self, fragment: str) -> str:
+        return ''.join(('{"object_type": "feed", "content": ', fragment, '}'))
+    
+    def _iter_text(self, news_iter: Iterable[Dict[str, str]]) -> Iterator[str]:
+        header = f"{self.header}\n\n"
+        parts: List[str] = []
+        length = 0
+        
+        for idx, news in enumerate(news_iter, 1):
+            prefix = f"{idx}. "
+            item = prefix + self._cached(news, self._render_text_item)
+            separator = 2 if parts else 0
+            
+            if parts and len(header) + length + separator + len(item) > self.max_text_length:
+                yield self._text_message(header + '\n\n'.join(parts))
+                parts, length, separator = [], 0, 0
+            
+            # 기사 하나가 제한을 넘으면 제목만 줄여서 보냄 (링크는 잘리면 열리지 않음)
+            room = self.max_text_length - len(header)
+            if len(item) > room:
+                link_length = len(f"\n   🔗 {news['url']}")
+                item = prefix + self._render_text_item(news, room - len(prefix) - link_length)
+            
+            parts.append(item)
+            length += separator + len(item)
+        
+        if parts:
+            yield self._text_message(header + '\n\n'.join(parts))
+    
+    def _iter_list(self, news_iter: Iterable[Dict[str, str]]) -> Iterator[str]:
+        fragments: List[str] = []
+        
+        for news in news_iter:
+            fragments.append(self._cached(news, self._render_content))
+            if len(fragments) == LIST_MAX_ITEMS:
+                yield self._list_message(fragments)
+                fragments = []
+        
+        # 리스트 템플릿은 최소 2개가 필요하므로 1개 남으면 피드로 보냄
+        if len(fragments) >= LIST_MIN_ITEMS:
+            yield self._list_message(fragments)
+        elif fragments:
+            yield self._feed_message(fragments[0])
+    
+    def _iter_feed(self, news_iter: Iterable[Dict[str, str]]) -> Iterator[str]:
+        for news in news_iter:
+            yield self._feed_message(self._cached(news, self._render_content))
+    
+    def iter_render(self, news_iter: Iterable[Dict[str, str]]) -> Iterator[str]:
+        """
+        뉴스를 template_object 문자열로 변환 (메시지가 찰 때마다 생성)
+        
+        Args:
+            news_iter: 뉴스 리스트 또는 이터러블
+        
+        Yields:
+            JSON 인코딩된 template_object
+        """
+        if self.template == 'list':
+            return self._iter_list(news_iter)
+        if self.template == 'feed':
+            return self._iter_feed(news_iter)
+        return self._iter_text(news_iter)
+    
+    def render(self, news_list: Iterable[Dict[str, str]]) -> List[str]:
+        """
+        뉴스 리스트를 최소 개수의 template_object 문자열로 변환
+        
+        Args:
+            news_list: 뉴스 리스트
+        
+        Returns:
+            JSON 인코딩된 template_object 리스트
+        """
+        return list(self.iter_render(news_list))
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """기사별 렌더링 캐시 통계"""
+        with self._lock:
+            return {'hits': self.cache_hits, 'misses': self.cache_misses, 'size': len(self._cache)}
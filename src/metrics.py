@@ -0,0 +1,304 @@
+"""
+계측 모듈
+단계별 소요 시간(span), 카운터, 호스트별 HTTP 지연 히스토그램을 수집하여
+JSON 로그와 Prometheus 텍스트 형식으로 내보냅니다.
+
+METRICS_ENABLED가 true가 아니면 모든 호출이 아무 일도 하지 않는 객체로
+처리되므로 계측 코드가 있어도 비용이 거의 없습니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, TextIO, Tuple
+
+
+# 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = 'newsbot_'
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + '}'
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram 형식)"""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+    
+    def cumulative(self) -> Iterator[Tuple[float, int]]:
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+
+class Metrics:
+    """카운터/히스토그램/span 수집 클래스"""
+    
+    enabled = True
+    
+    def __init__(self, log_stream: Optional[TextIO] = None):
+        """
+        Args:
+            log_stream: JSON 로그를 쓸 스트림 (None이면 JSON 로그를 남기지 않음)
+        """
+        self.log_stream = log_stream
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 기록"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+    
+    @contextmanager
+    def span(self, name: str, **labels):
+        """
+        단계 소요 시간 측정
+        
+        stage_duration_seconds{stage=name} 히스토그램에 기록하고 JSON 로그를
+        남깁니다. 예외가 나면 status=error로 기록한 뒤 예외를 그대로 전달합니다.
+        """
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            yield
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.observe('stage_duration_seconds', duration, stage=name, **labels)
+            self.log_event('span', span=name, status=status,
+                           duration_ms=round(duration * 1000, 3), **labels)
+    
+    def log_event(self, event: str, **fields):
+        """JSON 로그 한 줄 기록"""
+        if self.log_stream is None:
+            return
+        line = json.dumps({'ts': round(time.time(), 3), 'event': event, **fields}, ensure_ascii=False)
+        with self._lock:
+            self.log_stream.write(line + '\n')
+            self.log_stream.flush()
+    
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        현재 값 요약
+        
+        Returns:
+            {'counters': {이름: {레이블: 값}},
+             'histograms': {이름: {레이블: {'count', 'sum'}}}}
+        """
+        def labels_text(key: LabelKey) -> str:
+            return ','.join(f"{name}={value}" for name, value in key)
+        
+        with self._lock:
+            return {
+                'counters': {
+                    name: {labels_text(key): value for key, value in series.items()}
+                    for name, series in self.counters.items()
+                },
+                'histograms': {
+                    name: {
+                        labels_text(key): {'count': histogram.count, 'sum': round(histogram.sum, 6)}
+                        for key, histogram in series.items()
+                    }
+                    for name, series in self.histograms.items()
+                },
+            }
+    
+    def log_snapshot(self):
+        """현재 값을 JSON 로그로 기록 (사이클 종료 시 사용)"""
+        self.log_event('metrics', **self.snapshot())
+    
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 변환"""
+        lines = []
+        
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                metric = METRIC_PREFIX + name
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in series.items():
+                    lines.append(f"{metric}{_format_labels(key)} {value:g}")
+            
+            for name, series in sorted(self.histograms.items()):
+                metric = METRIC_PREFIX + name
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in series.items():
+                    for bound, total in histogram.cumulative():
+                        lines.append(f"{metric}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {total}")
+                    lines.append(f"{metric}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+        
+        return '\n'.join(lines) + '\n'
+
+
+class _NullSpan:
+    """아무 일도 하지 않는 span (재사용)"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullMetrics:
+    """계측 비활성화 시 사용하는 빈 구현"""
+    
+    enabled = False
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        pass
+    
+    def observe(self, name: str, value: float, **labels):
+        pass
+    
+    def span(self, name: str, **labels) -> _NullSpan:
+        return _NULL_SPAN
+    
+    def log_event(self, event: str, **fields):
+        pass
+    
+    def snapshot(self) -> Dict[str, dict]:
+        return {'counters': {}, 'histograms': {}}
+    
+    def log_snapshot(self):
+        pass
+    
+    def render_prometheus(self) -> str:
+        return ''
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """
+    프로세스 공용 계측 객체 반환 (최초 호출 시 환경 변수로 생성)
+    
+    METRICS_ENABLED=true이면 Metrics, 아니면 NullMetrics를 사용합니다.
+    METRICS_LOG에 파일 경로(또는 '-': 표준 에러)를 지정하면 JSON 로그를 남깁니다.
+    """
+    global _metrics
+    
+    if _metrics is not None:
+        return _metrics
+    
+    with _metrics_lock:
+        if _metrics is None:
+            if os.getenv('METRICS_ENABLED', 'false').lower() != 'true':
+                _metrics = NullMetrics()
+            else:
+                log_path = os.getenv('METRICS_LOG')
+                if not log_path:
+                    log_stream = None
+                elif log_path == '-':
+                    log_stream = sys.stderr
+                else:
+                    log_stream = open(log_path, 'a', encoding='utf-8')
+                _metrics = Metrics(log_stream)
+        return _metrics
+
+
+def set_metrics(metrics):
+    """공용 계측 객체 교체 (테스트/부하 테스트용, None이면 환경 변수로 다시 생성)"""
+    global _metrics
+    with _metrics_lock:
+        _metrics = metrics
+
+
+class MetricsServer:
+    """Prometheus /metrics 엔드포인트 서버 (별도 스레드에서 실행)"""
+    
+    def __init__(self, port: int, host: str = '0.0.0.0', metrics=None):
+        """
+        Args:
+            port: 포트 (0이면 빈 포트 자동 선택)
+            host: 바인드 주소
+            metrics: 내보낼 계측 객체 (기본값: 공용 계측 객체)
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        source = metrics
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = (source or get_metrics()).render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def port(self) -> int:
+        return self.server.server_port
+    
+    def start(self) -> 'MetricsServer':
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
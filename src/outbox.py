@@ -0,0 +1,379 @@
+"""
+발송 대기열(outbox) 모듈
+렌더링한 메시지를 SQLite 파일에 발송 작업으로 저장하고, 별도의 전송 워커가
+꺼내 보냅니다. 카카오 API가 실패해도 작업이 남아 있으므로 다시 크롤링하지
+않고 다음 전송 때 이어서 보냅니다.
+
+- 작업을 꺼낸 워커는 가시성 제한 시간(visibility timeout) 동안 작업을
+  독점하며, 그 안에 완료하지 못하면 다른 워커가 다시 꺼냅니다.
+- 전송 후 완료 기록 전에 워커가 죽으면 같은 메시지를 다시 보낼 수 있습니다.
+  (최소 한 번 전송)
+- 같은 메시지(수신자 + 내용)는 멱등 키로 한 번만 대기열에 들어갑니다.
+
+전송 워커만 따로 실행할 수도 있습니다.
+
+    python src/outbox.py deliver --workers 4 --batch-size 20
+    python src/outbox.py stats
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from metrics import get_metrics
+
+
+@dataclass
+class OutboxJob:
+    """대기열에서 꺼낸 발송 작업"""
+    id: int
+    key: str
+    payload: str
+    recipients: Optional[List[str]]
+    attempts: int
+    lease: str
+
+
+class Outbox:
+    """SQLite 기반 발송 대기열 클래스"""
+    
+    PENDING = 'pending'
+    DONE = 'done'
+    DEAD = 'dead'
+    
+    def __init__(self, path: str, visibility_timeout: float = 300.0, max_attempts: int = 10,
+                 retry_delay: float = 30.0, max_retry_delay: float = 3600.0):
+        """
+        Args:
+            path: SQLite 파일 경로 (여러 프로세스가 함께 사용 가능)
+            visibility_timeout: 꺼낸 작업을 독점하는 시간 (초)
+            max_attempts: 이 횟수만큼 실패하면 dead 상태로 보관
+            retry_delay: 첫 실패 후 다시 꺼낼 때까지 대기 시간 (초, 실패할 때마다 두 배)
+            max_retry_delay: 재시도 대기 시간 상한 (초)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._lock = threading.Lock()
+        
+        # 트랜잭션은 직접 시작 (BEGIN IMMEDIATE로 프로세스 간 작업 꺼내기를 직렬화)
+        self.conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " key TEXT NOT NULL UNIQUE,"
+            " payload TEXT NOT NULL,"
+            " recipients TEXT,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " visible_at REAL NOT NULL,"
+            " lease TEXT,"
+            " last_error TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL"
+            ")"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_ready_idx ON jobs (status, visible_at)")
+    
+    @classmethod
+    def from_env(cls, path: str) -> 'Outbox':
+        """OUTBOX_VISIBILITY_TIMEOUT, OUTBOX_MAX_ATTEMPTS 환경 변수로 생성"""
+        return cls(
+            path,
+            visibility_timeout=float(os.getenv('OUTBOX_VISIBILITY_TIMEOUT', 300)),
+            max_attempts=int(os.getenv('OUTBOX_MAX_ATTEMPTS', 10))
+        )
+    
+    @staticmethod
+    def idempotency_key(payload: str, recipients: Optional[List[str]] = None) -> str:
+        """수신자와 메시지 내용으로 만든 멱등 키"""
+        scope = ','.join(sorted(recipients)) if recipients is not None else '*'
+        return hashlib.sha256(f"{scope}\n{payload}".encode('utf-8')).hexdigest()
+    
+    def enqueue(self, template_objects: Iterable[str], recipients: Optional[List[str]] = None) -> int:
+        """
+        메시지들을 발송 작업으로 저장
+        
+        이미 대기 중이거나 보낸(보관 기간 안의) 메시지는 건너뜁니다.
+        
+        Args:
+            template_objects: JSON 인코딩된 template_object 이터러블
+            recipients: 받을 구독자 ID 리스트 (기본값: 전송 객체의 전체 수신자)
+        
+        Returns:
+            새로 저장한 작업 수
+        """
+        now = time.time()
+        encoded = json.dumps(recipients) if recipients is not None else None
+        rows = [
+            (self.idempotency_key(payload, recipients), payload, encoded, self.PENDING, now, now, now)
+            for payload in template_objects
+        ]
+        
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (key, payload, recipients, status, visible_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            inserted = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        
+        get_metrics().inc('outbox_jobs_total', inserted, event='enqueued')
+        return inserted
+    
+    def claim(self, batch_size: int = 10) -> List[OutboxJob]:
+        """
+        보낼 수 있는 작업을 오래된 순서로 꺼내기
+        
+        꺼낸 작업은 visibility_timeout 동안 다른 워커가 꺼낼 수 없습니다.
+        
+        Args:
+            batch_size: 한 번에 꺼낼 최대 작업 수
+        
+        Returns:
+            작업 리스트 (없으면 빈 리스트)
+        """
+        now = time.time()
+        lease = uuid.uuid4().hex
+        
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            rows = self.conn.execute(
+                "SELECT id, key, payload, recipients, attempts FROM jobs"
+                " WHERE status = ? AND visible_at <= ? ORDER BY id LIMIT ?",
+                (self.PENDING, now, batch_size)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE jobs SET lease = ?, attempts = attempts + 1, visible_at = ?, updated_at = ?"
+                " WHERE id = ?",
+                [(lease, now + self.visibility_timeout, now, row[0]) for row in rows]
+            )
+            self.conn.execute("COMMIT")
+        
+        return [
+            OutboxJob(job_id, key, payload, json.loads(recipients) if recipients else None,
+                      attempts + 1, lease)
+            for job_id, key, payload, recipients, attempts in rows
+        ]
+    
+    def ack(self, jobs: List[OutboxJob]):
+        """
+        전송한 작업을 완료로 기록
+        
+        가시성 제한 시간이 지나 다른 워커가 다시 꺼낸 작업이어도 이미 보냈으므로
+        완료로 기록합니다. 멱등 키는 purge 전까지 남아 같은 메시지의 재등록을 막습니다.
+        """
+        if not jobs:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "UPDATE jobs SET status = ?, lease = NULL, last_error = NULL, updated_at = ? WHERE id = ?",
+                [(self.DONE, now, job.id) for job in jobs]
+            )
+            self.conn.execute("COMMIT")
+        get_metrics().inc('outbox_jobs_total', len(jobs), event='delivered')
+    
+    def release(self, jobs: List[OutboxJob]):
+        """보내지 않은 작업을 바로 다시 꺼낼 수 있게 반환 (시도 횟수 복원)"""
+        if not jobs:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "UPDATE jobs SET lease = NULL, attempts = attempts - 1, visible_at = ?, updated_at = ?"
+                " WHERE id = ? AND lease = ? AND status = ?",
+                [(now, now, job.id, job.lease, self.PENDING) for job in jobs]
+            )
+            self.conn.execute("COMMIT")
+    
+    def fail(self, job: OutboxJob, error: str):
+        """
+        전송 실패 기록
+        
+        max_attempts에 도달하면 dead로 보관하고, 아니면 재시도 대기 시간이
+        지난 뒤 다시 꺼낼 수 있게 합니다. 다른 워커가 이미 다시 꺼낸 작업이면
+        무시합니다.
+        """
+        now = time.time()
+        dead = job.attempts >= self.max_attempts
+        delay = min(self.retry_delay * 2 ** (job.attempts - 1), self.max_retry_delay)
+        
+        with self._lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, lease = NULL, visible_at = ?, last_error = ?, updated_at = ?"
+                " WHERE id = ? AND lease = ?",
+                (self.DEAD if dead else self.PENDING, now + delay, error, now, job.id, job.lease)
+            )
+        get_metrics().inc('outbox_jobs_total', event='dead' if dead else 'failed')
+    
+    def requeue_dead(self) -> int:
+        """dead 작업을 시도 횟수를 초기화하여 다시 대기열에 넣기"""
+        now = time.time()
+        with self._lock:
+            return self.conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, visible_at = ?, updated_at = ? WHERE status = ?",
+                (self.PENDING, now, now, self.DEAD)
+            ).rowcount
+    
+    def purge(self, ttl_seconds: float) -> int:
+        """
+        보관 기간이 지난 완료/dead 작업 삭제
+        
+        Args:
+            ttl_seconds: 보관 기간 (초, 이 기간 동안 같은 메시지는 다시 들어오지 않음)
+        
+        Returns:
+            삭제된 작업 수
+        """
+        cutoff = time.time() - ttl_seconds
+        with self._lock:
+            return self.conn.execute(
+                "DELETE FROM jobs WHERE status != ? AND updated_at < ?", (self.PENDING, cutoff)
+            ).rowcount
+    
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수 (pending: 지금 꺼낼 수 있음, inflight: 워커가 보내는 중 또는 재시도 대기)"""
+        now = time.time()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, visible_at <= ?, COUNT(*) FROM jobs GROUP BY 1, 2", (now,)
+            ).fetchall()
+        
+        stats = {'pending': 0, 'inflight': 0, self.DONE: 0, self.DEAD: 0}
+        for status, visible, count in rows:
+            if status == self.PENDING:
+                stats['pending' if visible else 'inflight'] += count
+            else:
+                stats[status] += count
+        return stats
+    
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
+
+
+def _send_job(sender, job: OutboxJob) -> bool:
+    if job.recipients is None:
+        return sender.send_template_objects([job.payload])
+    # 일부 구독자만 실패하면 FanoutDispatcher가 그 구독자 몫의 작업을 따로 저장
+    return sender.send_template_objects([job.payload], job.recipients)
+
+
+def deliver(outbox: Outbox, sender, workers: int = 1, batch_size: int = 10) -> Dict[str, int]:
+    """
+    대기 중인 작업을 전송 워커들로 보내기
+    
+    워커는 작업을 batch_size개씩 꺼내 순서대로 보내고 한 번에 완료로 기록합니다.
+    전송에 실패하면 (카카오 장애일 가능성이 높으므로) 실패한 작업은 재시도
+    대기로, 남은 작업은 대기열로 돌려놓고 해당 워커를 멈춥니다.
+    
+    Args:
+        outbox: 발송 대기열
+        sender: 카카오톡 전송 객체 (KakaoSender 또는 FanoutDispatcher)
+        workers: 동시에 작업을 꺼내 보내는 워커 수
+        batch_size: 워커가 한 번에 꺼낼 작업 수
+    
+    Returns:
+        {'delivered': 보낸 작업 수, 'failed': 실패한 작업 수}
+    """
+    counts = {'delivered': 0, 'failed': 0}
+    counts_lock = threading.Lock()
+    metrics = get_metrics()
+    
+    def work():
+        while True:
+            jobs = outbox.claim(batch_size)
+            if not jobs:
+                return
+            
+            for index, job in enumerate(jobs):
+                try:
+                    with metrics.span('outbox_deliver'):
+                        sent = _send_job(sender, job)
+                    error = None if sent else "전송 실패"
+                except Exception as e:
+                    error = str(e)
+                
+                if error is not None:
+                    outbox.ack(jobs[:index])
+                    outbox.fail(job, error)
+                    outbox.release(jobs[index + 1:])
+                    with counts_lock:
+                        counts['delivered'] += index
+                        counts['failed'] += 1
+                    return
+            
+            outbox.ack(jobs)
+            with counts_lock:
+                counts['delivered'] += len(jobs)
+    
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        for future in [executor.submit(work) for _ in range(max(workers, 1))]:
+            future.result()
+    
+    return counts
+
+
+def print_stats(outbox: Outbox):
+    """대기열 상태 출력"""
+    stats = outbox.stats()
+    print(f"📮 발송 대기열: 대기 {stats['pending']}개, 전송/재시도 대기 {stats['inflight']}개, "
+          f"완료 {stats['done']}개, 실패 보관 {stats['dead']}개")
+
+
+def main():
+    import argparse
+    from main import create_outbox, create_sender, load_env
+    
+    arg_parser = argparse.ArgumentParser(description="발송 대기열 전송 워커")
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+    deliver_parser = subparsers.add_parser('deliver', help="대기 중인 작업 전송")
+    deliver_parser.add_argument('--workers', type=int, default=int(os.getenv('OUTBOX_WORKERS', 1)))
+    deliver_parser.add_argument('--batch-size', type=int, default=int(os.getenv('OUTBOX_BATCH_SIZE', 10)))
+    subparsers.add_parser('stats', help="상태별 작업 수 출력")
+    subparsers.add_parser('requeue-dead', help="실패 보관 작업을 다시 대기열에 넣기")
+    args = arg_parser.parse_args()
+    
+    load_env()
+    outbox = create_outbox()
+    if outbox is None:
+        print("❌ 오류: OUTBOX_PATH가 설정되지 않았습니다.")
+        sys.exit(1)
+    
+    if args.command == 'deliver':
+        sender = create_sender()
+        if sender is None:
+            sys.exit(1)
+        counts = deliver(outbox, sender, workers=args.workers, batch_size=args.batch_size)
+        print(f"📤 전송 {counts['delivered']}개, 실패 {counts['failed']}개")
+    elif args.command == 'requeue-dead':
+        print(f"♻️ {outbox.requeue_dead()}개 작업을 다시 대기열에 넣었습니다.")
+    
+    print_stats(outbox)
+    outbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+재시도 정책 모듈
+지수 백오프 재시도와 서킷 브레이커로 외부 API 호출을 보호합니다.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+from metrics import get_metrics
+
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# 멱등이 아닌 요청(메시지 전송)도 재시도할 상태 코드 (서버가 요청을 처리하지 않았음이 분명한 경우,
+# 503은 Retry-After가 있을 때만)
+NON_IDEMPOTENT_RETRYABLE_STATUS = frozenset({429, 503})
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생하는 예외"""
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 요청을 차단하는 서킷 브레이커 클래스"""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            name: 브레이커 이름 (로그/통계용)
+            failure_threshold: 차단으로 전환할 연속 실패 횟수
+            reset_timeout: 차단 후 시험 요청을 허용하기까지의 시간 (초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def before_call(self):
+        """
+        요청 전 호출 가능 여부 확인
+        
+        Raises:
+            CircuitOpenError: 차단 중인 경우
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            
+            if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._trial_in_flight):
+                self.rejected += 1
+                get_metrics().inc('circuit_rejected_total', breaker=self.name)
+                raise CircuitOpenError(f"{self.name} 서킷 브레이커가 열려 있습니다.")
+            
+            if self.state == self.HALF_OPEN:
+                # 반개방 상태에서는 시험 요청 하나만 허용
+                self._trial_in_flight = True
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                    print(f"🚧 {self.name} 서킷 브레이커 차단 ({self.reset_timeout:g}초)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+    
+    def stats(self) -> Dict[str, object]:
+        """브레이커 상태 통계"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected,
+            }
+
+
+class RetryPolicy:
+    """지수 백오프 + jitter 재시도 정책 클래스"""
+    
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5,
+                 max_delay: float = 30.0, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 요청 포함)
+            base_delay: 첫 재시도 대기 시간의 상한 (초)
+            max_delay: 대기 시간 상한 (Retry-After 포함, 초)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.max_attempts = max(max_attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.attempts = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+    
+    def backoff(self, retry_number: int) -> float:
+        """재시도 대기 시간 (full jitter: 0 ~ min(max, base * 2^n) 균등 분포)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+    
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간으로 변환"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+    
+    def _count(self, retry: bool):
+        with self._lock:
+            self.attempts += 1
+            if retry:
+                self.retries += 1
+    
+    def _should_retry(self, response: requests.Response, idempotent: bool) -> bool:
+        if idempotent:
+            return response.status_code in RETRYABLE_STATUS
+        if response.status_code not in NON_IDEMPOTENT_RETRYABLE_STATUS:
+            return False
+        return response.status_code == 429 or self.retry_after(response) is not None
+    
+    def call(self, request: Callable[[], requests.Response],
+             breaker: Optional[CircuitBreaker] = None, idempotent: bool = True) -> requests.Response:
+        """
+        재시도 정책을 적용하여 요청 실행
+        
+        연결 오류/타임아웃과 429, 5xx 응답만 재시도합니다. 마지막 시도까지
+        실패하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킵니다.
+        
+        멱등이 아닌 요청(idempotent=False)은 서버가 이미 처리했을 수 있는 읽기
+        타임아웃과 500/502/504를 재시도하지 않고, 요청이 서버에 닿지 않은 연결
+        오류(연결 타임아웃 포함)와 429, Retry-After가 있는 503만 재시도합니다.
+        
+        Args:
+            request: 요청 함수
+            breaker: 서킷 브레이커 (선택)
+            idempotent: 같은 요청을 다시 보내도 안전한지 여부 (메시지 전송은 False)
+        
+        Returns:
+            응답 객체
+        
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+            requests.RequestException: 모든 시도가 연결 오류로 실패한 경우
+        """
+        for attempt in range(self.max_attempts):
+            if breaker is not None:
+                breaker.before_call()
+            
+            self._count(retry=attempt > 0)
+            last_attempt = attempt == self.max_attempts - 1
+            
+            try:
+                response = request()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                # 연결 타임아웃은 ConnectionError이기도 하므로 여기서 걸러지는 것은 읽기 타임아웃
+                if last_attempt or not (idempotent or isinstance(e, requests.ConnectionError)):
+                    raise
+                get_metrics().inc('retries_total', reason=type(e).__name__)
+                self.sleep(self.backoff(attempt))
+                continue
+            except Exception:
+                # 재시도하지 않는 오류도 실패로 기록 (반개방 시험 요청이 끝나지 않은 채 남지 않도록)
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            
+            if response.status_code not in RETRYABLE_STATUS:
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+            
+            if breaker is not None:
+                breaker.record_failure()
+            if last_attempt or not self._should_retry(response, idempotent):
+                return response
+            
+            get_metrics().inc('retries_total', reason=response.status_code)
+            delay = self.retry_after(response)
+            if delay is None:
+                delay = self.backoff(attempt)
+            print(f"🔁 HTTP {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_attempts - 1})")
+            self.sleep(min(delay, self.max_delay))
+        
+        raise AssertionError("unreachable")
+    
+    def stats(self) -> Dict[str, int]:
+        """재시도 통계"""
+        with self._lock:
+            return {'attempts': self.attempts, 'retries': self.retries}
@@ -0,0 +1,186 @@
+"""
+발송 이력 인덱스 모듈
+이미 발송한 기사를 (oid, aid) 기준으로 저장하여 중복 발송을 막습니다.
+
+SQLite 파일에 이력을 영구 저장하고, 메모리의 Bloom 필터로 대부분의
+조회를 디스크 접근 없이 처리합니다.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from article import ArticleKey, article_key, parse_article_key
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 클래스"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 예상 항목 수
+            error_rate: 목표 오탐률
+        """
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.num_bits = max(int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: ArticleKey):
+        digest = hashlib.blake2b(f"{key[0]}/{key[1]}".encode('ascii'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, key: ArticleKey):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def __contains__(self, key: ArticleKey) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class SeenArticleIndex:
+    """발송한 기사 이력 인덱스 클래스"""
+    
+    def __init__(self, path: str, capacity: int = 100000, error_rate: float = 0.001):
+        """
+        Args:
+            path: SQLite 파일 경로
+            capacity: Bloom 필터 초기 용량 (초과 시 두 배로 재구성)
+            error_rate: Bloom 필터 목표 오탐률
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " oid INTEGER NOT NULL,"
+            " aid INTEGER NOT NULL,"
+            " seen_at REAL NOT NULL,"
+            " PRIMARY KEY (oid, aid)"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS seen_at_idx ON seen (seen_at)")
+        self.conn.commit()
+        
+        total = self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self._rebuild_bloom(max(capacity, total * 2))
+    
+    def _rebuild_bloom(self, capacity: int):
+        self.bloom = BloomFilter(capacity, self.error_rate)
+        for oid, aid in self.conn.execute("SELECT oid, aid FROM seen"):
+            self.bloom.add((oid, aid))
+    
+    def __contains__(self, key: ArticleKey) -> bool:
+        with self._lock:
+            # Bloom 필터에 없으면 확실히 처음 보는 기사
+            if key not in self.bloom:
+                return False
+            row = self.conn.execute(
+                "SELECT 1 FROM seen WHERE oid = ? AND aid = ?", key
+            ).fetchone()
+            return row is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+    
+    def contains_url(self, url: str) -> bool:
+        """기사 URL의 발송 여부 확인"""
+        key = parse_article_key(url)
+        return key is not None and key in self
+    
+    def filter_new(self, news_list: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        발송하지 않은 기사만 추출
+        
+        URL에서 기사 ID를 알 수 없는 항목은 새 기사로 취급합니다.
+        
+        Args:
+            news_list: 뉴스 리스트
+        
+        Returns:
+            처음 보는 기사 리스트 (입력 순서 유지, 입력 내 중복 제거)
+        """
+        return list(self.iter_new(news_list))
+    
+    def iter_new(self, news_iter: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+        """
+        filter_new의 스트리밍 버전 (입력을 하나씩 확인하여 새 기사만 반환)
+        
+        Args:
+            news_iter: 뉴스 리스트 또는 이터러블
+        
+        Yields:
+            처음 보는 기사 (입력 순서 유지, 입력 내 중복 제거)
+        """
+        batch_keys = set()
+        
+        for news in news_iter:
+            key = article_key(news)
+            if key is not None:
+                if key in batch_keys or key in self:
+                    continue
+                batch_keys.add(key)
+            yield news
+    
+    def add_many(self, news_list: Iterable[Dict[str, str]], seen_at: Optional[float] = None):
+        """
+        기사를 발송 이력에 추가
+        
+        Args:
+            news_list: 뉴스 리스트
+            seen_at: 기록 시각 (기본값: 현재 시각)
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        keys = [key for key in (article_key(news) for news in news_list) if key]
+        
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO seen (oid, aid, seen_at) VALUES (?, ?, ?)",
+                [(oid, aid, seen_at) for oid, aid in keys]
+            )
+            self.conn.commit()
+            
+            for key in keys:
+                self.bloom.add(key)
+            
+            if self.bloom.count > self.bloom.capacity:
+                self._rebuild_bloom(max(self.bloom.capacity, self.bloom.count) * 2)
+    
+    def compact(self, ttl_seconds: float) -> int:
+        """
+        오래된 이력 삭제 후 Bloom 필터 재구성
+        
+        Args:
+            ttl_seconds: 보관 기간 (초)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        cutoff = time.time() - ttl_seconds
+        
+        with self._lock:
+            deleted = self.conn.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+            self.conn.commit()
+            if deleted:
+                self._rebuild_bloom(self.bloom.capacity)
+        
+        return deleted
+    
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
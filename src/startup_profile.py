@@ -0,0 +1,137 @@
+"""
+시작 시간 프로파일 모듈
+새 인터프리터에서 `python -X importtime`으로 실행 파일을 import하여 모듈별
+import 시간과 콜드 스타트 시간을 측정합니다.
+
+이미 import된 모듈은 다시 측정할 수 없으므로 항상 별도 프로세스에서
+측정합니다. (`python src/main.py --profile-startup`)
+"""
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+# 시작할 때는 로드하지 않고 필요한 경로에서만 로드하는 모듈
+DEFERRED_MODULES = (
+    'numpy',        # 같은 기사 묶음 (CLUSTER_STORIES=true)
+    'clustering',
+    'list_parser',  # 캐시에 없는 목록 페이지 파싱
+    'bs4',          # NEWS_PARSER=bs4
+    'asyncio',      # crawl_async
+    'dotenv',       # .env 파일이 있을 때
+    'http.server',  # METRICS_PORT
+)
+
+
+@dataclass
+class ImportTiming:
+    """모듈 하나의 import 시간 (마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _import_command(script: str) -> List[str]:
+    path = Path(script).resolve()
+    code = f"import sys; sys.path.insert(0, {str(path.parent)!r}); import {path.stem}"
+    return [sys.executable, '-c', code]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    `-X importtime` 출력 파싱
+    
+    Args:
+        output: 표준 오류 출력 ("import time: self | cumulative | name" 형식)
+    
+    Returns:
+        import된 순서의 모듈별 시간 리스트
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(stripped, int(fields[0]), int(fields[1]),
+                                    (len(name) - len(stripped) - 1) // 2))
+    return timings
+
+
+def measure_imports(script: str) -> List[ImportTiming]:
+    """실행 파일을 새 인터프리터에서 import하며 모듈별 시간 측정"""
+    command = _import_command(script)
+    result = subprocess.run(command[:1] + ['-X', 'importtime'] + command[1:],
+                            capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def cold_start_time(script: str, runs: int = 3) -> Tuple[float, float]:
+    """
+    실행 파일 import까지 걸리는 콜드 스타트 시간
+    
+    Args:
+        script: 실행 파일 경로
+        runs: 반복 횟수 (가장 빠른 값 사용)
+    
+    Returns:
+        (import 시간, 빈 인터프리터 시작 시간) 초 단위 튜플
+    """
+    def best(command: List[str]) -> float:
+        elapsed = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run(command, check=True, capture_output=True)
+            elapsed.append(time.perf_counter() - started)
+        return min(elapsed)
+    
+    return best(_import_command(script)), best([sys.executable, '-c', 'pass'])
+
+
+def package_totals(timings: List[ImportTiming]) -> Dict[str, int]:
+    """최상위 패키지별 self 시간 합계 (예: requests.*, urllib3.*)"""
+    totals: Dict[str, int] = {}
+    for timing in timings:
+        package = timing.module.split('.', 1)[0]
+        totals[package] = totals.get(package, 0) + timing.self_us
+    return totals
+
+
+def print_startup_profile(script: str, top: int = 15):
+    """
+    실행 파일의 시작 시간 프로파일 출력
+    
+    Args:
+        script: 실행 파일 경로 (예: src/main.py)
+        top: 출력할 패키지 수
+    """
+    project_modules = {path.stem for path in Path(script).resolve().parent.glob('*.py')}
+    timings = measure_imports(script)
+    elapsed, baseline = cold_start_time(script)
+    
+    print(f"⏱️ 콜드 스타트: {elapsed * 1000:.1f}ms (인터프리터 시작 {baseline * 1000:.1f}ms 포함)")
+    
+    print("\n📦 프로젝트 모듈 (누적 import 시간)")
+    for timing in timings:
+        if timing.module in project_modules:
+            print(f"   {'  ' * timing.depth}{timing.module:<{24 - 2 * timing.depth}} {timing.cumulative_us / 1000:8.1f}ms")
+    
+    print(f"\n🐢 import 시간이 긴 패키지 상위 {top}개 (self 시간 합계)")
+    totals = sorted(package_totals(timings).items(), key=lambda item: item[1], reverse=True)
+    for package, total_us in totals[:top]:
+        print(f"   {package:<24} {total_us / 1000:8.1f}ms")
+    
+    loaded = {timing.module for timing in timings}
+    deferred = [module for module in DEFERRED_MODULES if module not in loaded]
+    eager = [module for module in DEFERRED_MODULES if module in loaded]
+    print(f"\n💤 지연 로딩: {', '.join(deferred) or '(없음)'}")
+    if eager:
+        print(f"⚠️ 시작 시 로드됨: {', '.join(eager)}")
@@ -0,0 +1,131 @@
+"""
+적응형 수집 일정 테스트 모듈
+"""
+
+from datetime import datetime
+
+import pytest
+
+from adaptive_scheduler import AdaptiveScheduler
+
+
+BUSY = ('100', None)
+QUIET = ('103', '237')
+
+
+def make_scheduler(**kwargs):
+    """시각을 직접 넘기는 테스트용 스케줄러 생성"""
+    options = dict(latency_target=300, min_interval=60, max_interval=1800,
+                   budget_per_minute=100, half_life=600, clock=lambda: 0.0)
+    options.update(kwargs)
+    return AdaptiveScheduler([BUSY, QUIET], **options)
+
+
+def poll_repeatedly(scheduler, counts, rounds=10):
+    """섹션별로 예정 시각마다 지정한 개수의 기사를 수집한 것으로 기록"""
+    now = 0.0
+    for _ in range(rounds * len(counts)):
+        section = min(counts, key=lambda section: scheduler.states[section].next_poll)
+        now = max(now, scheduler.states[section].next_poll)
+        scheduler.record(section, counts[section], now)
+    return now
+
+
+class TestAdaptiveScheduler:
+    """AdaptiveScheduler 테스트 클래스"""
+    
+    def test_all_sections_due_on_start(self):
+        """시작하면 모든 섹션을 수집하는지 테스트"""
+        scheduler = make_scheduler()
+        assert scheduler.due(0.0) == [BUSY, QUIET]
+        assert scheduler.next_after(datetime.fromtimestamp(10)) == datetime.fromtimestamp(10)
+    
+    def test_busy_section_polled_more_often(self):
+        """발행이 많은 섹션은 목표 지연마다, 조용한 섹션은 드물게 수집하는지 테스트"""
+        scheduler = make_scheduler()
+        scheduler.record(BUSY, 20, 0.0)
+        scheduler.record(QUIET, 20, 0.0)
+        
+        poll_repeatedly(scheduler, {BUSY: 30, QUIET: 0})
+        
+        assert scheduler.states[BUSY].interval == 300
+        assert scheduler.states[QUIET].interval == 1800
+        assert scheduler.states[BUSY].rate * 3600 > 100
+    
+    def test_slow_section_capped_at_latency_target(self):
+        """발행이 드문 섹션도 최근 기사가 있으면 목표 지연마다 수집하는지 테스트"""
+        scheduler = make_scheduler()
+        scheduler.record(QUIET, 0, 0.0)
+        
+        # 약 20분에 기사 1개 (1/rate = 1200초 > 목표 지연 300초)
+        now = 0.0
+        for index in range(1, 13):
+            now = scheduler.states[QUIET].next_poll
+            scheduler.record(QUIET, 1 if index % 4 == 0 else 0, now)
+        
+        assert 0 < scheduler.states[QUIET].rate * 300 < 1
+        assert scheduler.states[QUIET].interval == 300
+        
+        # 최대 간격 동안 기사가 없으면 조용한 섹션으로 돌아감
+        scheduler.record(QUIET, 0, now + 1900)
+        assert scheduler.states[QUIET].interval == 1800
+    
+    def test_budget_stretches_only_quiet_sections(self):
+        """분당 요청 예산을 넘으면 최근 기사가 없는 섹션의 간격만 늘리는지 테스트"""
+        scheduler = make_scheduler(budget_per_minute=0.3)
+        scheduler.record(BUSY, 0, 0.0)
+        scheduler.record(BUSY, 5, 300.0)
+        scheduler.record(QUIET, 0, 300.0)
+        
+        assert scheduler.states[BUSY].interval == 300
+        assert scheduler.states[QUIET].interval == pytest.approx(600)
+        assert scheduler.requests_per_minute() <= 0.3 + 1e-9
+        
+        scheduler.budget_per_minute = 0.2
+        scheduler.record(BUSY, 5, 600.0)
+        assert scheduler.states[BUSY].interval == 300
+        assert scheduler.states[QUIET].interval == 1800
+    
+    def test_budget_is_hard_ceiling(self):
+        """최근 기사가 나온 섹션만으로 예산을 넘으면 그 섹션도 예산에 맞게 늘리는지 테스트"""
+        scheduler = make_scheduler(budget_per_minute=0.1)
+        scheduler.record(BUSY, 0, 0.0)
+        scheduler.record(BUSY, 5, 300.0)
+        scheduler.record(QUIET, 0, 300.0)
+        
+        assert scheduler.states[BUSY].interval == pytest.approx(600)
+        assert scheduler.states[QUIET].interval == 1800
+        assert scheduler.requests_per_minute() <= 0.1 + 60 / 1800 + 1e-9
+        
+        # 예산이 아주 작아도 최대 간격보다 늘리지는 않음
+        scheduler.budget_per_minute = 0.01
+        scheduler.record(BUSY, 5, 900.0)
+        assert scheduler.states[BUSY].interval == 1800
+    
+    def test_error_backoff(self):
+        """연속 실패 시 간격이 2배씩 늘고 성공하면 복구되는지 테스트"""
+        scheduler = make_scheduler(error_backoff=60)
+        
+        scheduler.record_crawl([BUSY, QUIET], {BUSY: {'articles': 5, 'pages': 1, 'ok': False}}, 0.0)
+        assert scheduler.states[BUSY].interval == 60
+        # 결과가 없는 섹션도 실패로 기록
+        assert scheduler.states[QUIET].errors == 1
+        
+        scheduler.record_error(BUSY, 60.0)
+        assert scheduler.states[BUSY].interval == 120
+        assert scheduler.due(100.0) == [QUIET]
+        
+        scheduler.record_crawl([BUSY], {BUSY: {'articles': 5, 'pages': 1, 'ok': True}}, 180.0)
+        assert scheduler.states[BUSY].errors == 0
+        assert scheduler.states[BUSY].next_poll == 180.0 + scheduler.states[BUSY].interval
+    
+    def test_snapshot(self):
+        """일정 현황 테스트"""
+        scheduler = make_scheduler()
+        scheduler.record(BUSY, 3, 0.0)
+        
+        snapshot = scheduler.snapshot(now=100.0)
+        
+        assert [entry['section'] for entry in snapshot] == ['103/237', '100']
+        assert snapshot[1]['next_poll_in'] == 200.0
+        assert snapshot[1]['articles'] == 3
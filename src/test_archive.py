@@ -0,0 +1,135 @@
+"""
+기사 보관소 테스트 모듈
+"""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+import archive as archive_module
+from archive import HeadlineArchive, parse_time
+from crawler import NaverNewsCrawler
+
+
+DAY1 = datetime(2026, 10, 5, 9, 0).timestamp()
+DAY2 = datetime(2026, 10, 6, 9, 0).timestamp()
+
+
+def make_news(sid1, start, count):
+    return [
+        {'title': f"{sid1} 뉴스 {index}", 'url': f"https://news.naver.com/article/001/{index:010d}"}
+        for index in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def filled_archive(tmp_path):
+    """이틀 동안 두 섹션 기사를 기록한 보관소"""
+    archive = HeadlineArchive(str(tmp_path / 'archive'), block_size=50)
+    archive.add_many(make_news('101', 0, 120), sid1='101', crawled_at=DAY1)
+    archive.add_many(make_news('102', 1000, 30), sid1='102', crawled_at=DAY1 + 60)
+    archive.add_many(make_news('101', 2000, 10), sid1='101', sid2='259', crawled_at=DAY2)
+    archive.flush()
+    return archive
+
+
+class TestHeadlineArchive:
+    """HeadlineArchive 테스트 클래스"""
+    
+    def test_query_decompresses_matching_blocks_only(self, filled_archive):
+        """섹션/시간 범위가 맞는 블록만 압축을 푸는지 테스트"""
+        with patch.object(archive_module.zlib, 'decompress', wraps=archive_module.zlib.decompress) as spy:
+            results = list(filled_archive.query(sid1='102', start=DAY1, end=DAY2))
+        
+        assert [article.title for _, article in results] == [f"102 뉴스 {index}" for index in range(1000, 1030)]
+        assert all(timestamp == DAY1 + 60 for timestamp, _ in results)
+        assert spy.call_count == 1
+        
+        with patch.object(archive_module.zlib, 'decompress', wraps=archive_module.zlib.decompress) as spy:
+            results = list(filled_archive.query(sid1='101', start=DAY2))
+        assert [(article.key, article.sid2) for _, article in results][0] == ((1, 2000), '259')
+        assert len(results) == 10
+        assert spy.call_count == 1
+    
+    def test_get_by_article_id(self, filled_archive):
+        """기사 ID 색인으로 조회하는지 테스트"""
+        timestamp, article = filled_archive.get(1, 2005)
+        
+        assert timestamp == DAY2
+        assert article.title == "101 뉴스 2005"
+        assert article.url == "https://n.news.naver.com/mnews/article/001/0000002005"
+        assert filled_archive.get(1, 999) is None
+    
+    def test_id_index_is_append_only(self, filled_archive):
+        """블록을 기록할 때 ID 색인을 다시 쓰지 않고 구간만 이어 붙이는지 테스트"""
+        ids_path = filled_archive.root / '20261005.ids'
+        before = ids_path.read_bytes()
+        
+        filled_archive.add_many(make_news('101', 500, 20), sid1='101', crawled_at=DAY1 + 120)
+        filled_archive.add_many(make_news('101', 50, 1), sid1='101', crawled_at=DAY1 + 120)
+        filled_archive.flush()
+        
+        after = ids_path.read_bytes()
+        assert after[:len(before)] == before
+        assert len(after) == 170 * archive_module._ID_ENTRY.size
+        assert filled_archive.get(1, 510)[1].title == "101 뉴스 510"
+        assert filled_archive.get(1, 30)[1].title == "101 뉴스 30"
+        assert filled_archive.get(1, 1015)[1].title == "102 뉴스 1015"
+        
+        # 블록 색인을 기록하기 전에 중단된 구간은 다음 기록 때 잘라냄
+        with open(ids_path, 'ab') as f:
+            f.write(archive_module._ID_ENTRY.pack(1 << 40 | 7777, 99))
+        filled_archive.add_many(make_news('101', 600, 1), sid1='101', crawled_at=DAY1 + 180)
+        filled_archive.flush()
+        assert len(ids_path.read_bytes()) == 171 * archive_module._ID_ENTRY.size
+        assert filled_archive.get(1, 600)[1].title == "101 뉴스 600"
+        assert filled_archive.get(1, 7777) is None
+    
+    def test_dedup_and_reopen(self, filled_archive):
+        """같은 기사는 다시 열어도 한 번만 보관하는지 테스트"""
+        reopened = HeadlineArchive(str(filled_archive.root))
+        
+        assert reopened.add_many(make_news('101', 115, 10), sid1='101', crawled_at=DAY2) == 5
+        assert [article.aid for _, article in reopened.query(sid1='101', start=DAY2)][-5:] == list(range(120, 125))
+        reopened.flush()
+        assert reopened.stats()['articles'] == 165
+        assert reopened.stats()['days'] == 2
+    
+    def test_recent_ids_pruned_by_day(self, filled_archive):
+        """새 날짜가 시작되면 dedup_days보다 오래된 날짜의 ID는 메모리에서 버리는지 테스트"""
+        reopened = HeadlineArchive(str(filled_archive.root), dedup_days=2)
+        day3 = DAY2 + 86400
+        
+        assert reopened.add_many(make_news('101', 2000, 1), sid1='101', crawled_at=day3) == 0
+        assert sorted(reopened._recent_ids) == ['20261006', '20261007']
+        assert reopened.add_many(make_news('101', 0, 1), sid1='101', crawled_at=day3) == 1
+
+
+def test_parse_time():
+    """CLI 시각 인자 파싱 테스트"""
+    now = datetime(2026, 10, 17, 12, 0)
+    
+    assert parse_time('7d', now) == datetime(2026, 10, 10, 12, 0).timestamp()
+    assert parse_time('2026-10-01') == datetime(2026, 10, 1).timestamp()
+    with pytest.raises(ValueError):
+        parse_time('last week')
+
+
+@patch('http_client.HttpTransport.get')
+def test_crawler_feeds_archive(mock_get, tmp_path):
+    """크롤러가 받은 목록 페이지 기사를 보관소에 넘기는지 테스트"""
+    html = '<ul class="type06_headline"><li><dt><a href="/article/020/0000000001">경제 뉴스</a></dt></li></ul>'
+    mock_get.return_value = Mock(status_code=200, content=html.encode('utf-8'),
+                                 headers={'Content-Type': 'text/html; charset=utf-8'})
+    archive = HeadlineArchive(str(tmp_path / 'archive'))
+    crawler = NaverNewsCrawler(archive=archive)
+    
+    crawler.crawl(sections=[('101', '259')])
+    crawler.crawl(sections=[('101', '259')])
+    archive.flush()
+    
+    results = list(archive.query(sid1='101'))
+    assert [(article.title, article.key, article.sid2) for _, article in results] == [
+        ('경제 뉴스', (20, 1), '259'),
+    ]
@@ -0,0 +1,93 @@
+"""
+기사 레코드 테스트 모듈
+"""
+
+import pickle
+import tracemalloc
+
+import pytest
+
+from article import Article, article_key
+
+
+def make_dicts(count):
+    return [
+        {'title': f"뉴스 {idx}", 'url': f"https://news.naver.com/article/001/{idx:010d}",
+         'sid1': '001', 'sid2': None}
+        for idx in range(count)
+    ]
+
+
+class TestArticle:
+    """Article 테스트 클래스"""
+    
+    def test_dict_compatibility(self):
+        """dict 기사처럼 사용할 수 있는지 테스트"""
+        article = Article.from_url('뉴스', 'https://n.news.naver.com/mnews/article/001/0012345678?sid=100',
+                                   sid1='100')
+        
+        assert (article.oid, article.aid) == (1, 12345678)
+        assert article['url'] == 'https://n.news.naver.com/mnews/article/001/0012345678'
+        assert article['title'] == '뉴스'
+        assert article.get('press') is None
+        assert dict(article) == {'title': '뉴스', 'url': article.url, 'sid1': '100'}
+        assert article == {'title': '뉴스', 'url': article.url, 'sid1': '100'}
+        assert article_key(article) == (1, 12345678)
+    
+    def test_real_href_round_trip(self):
+        """목록 페이지의 실제 링크가 열리는 기사 URL로 다시 만들어지는지 테스트"""
+        href = 'https://n.news.naver.com/mnews/article/395/2806341205?sid=100'
+        article = Article.from_url('뉴스', href)
+        
+        assert article.key == (395, 2806341205)
+        assert article.url == 'https://n.news.naver.com/mnews/article/395/2806341205'
+        assert Article.from_url('뉴스', article.url).url == article.url
+    
+    def test_url_without_ids(self):
+        """기사 ID가 없는 URL은 그대로 보관하는지 테스트"""
+        article = Article.from_url('메뉴', 'https://news.naver.com/main/list.naver')
+        
+        assert article.key is None
+        assert article.url == 'https://news.naver.com/main/list.naver'
+        with pytest.raises(ValueError):
+            Article('제목')
+    
+    def test_immutable(self):
+        """변경 불가와 replace 테스트"""
+        article = Article('뉴스', 1, 2)
+        
+        with pytest.raises(AttributeError):
+            article.title = '변경'
+        with pytest.raises(AttributeError):
+            article.extra = 1
+        
+        changed = article.replace(sid1='100')
+        assert changed.sid1 == '100' and article.sid1 is None
+        assert changed.key == article.key
+    
+    def test_interned_and_picklable(self):
+        """섹션/언론사 문자열 공유와 pickle 왕복 테스트"""
+        first = Article('뉴스 1', 1, 1, sid1=''.join(['1', '00']), press=''.join(['연합', '뉴스']))
+        second = Article('뉴스 2', 1, 2, sid1=''.join(['10', '0']), press=''.join(['연합뉴', '스']))
+        
+        assert first.sid1 is second.sid1
+        assert first.press is second.press
+        assert pickle.loads(pickle.dumps(first)) == first
+        assert hash(first) == hash(first.replace(title='다른 제목'))
+    
+    def test_smaller_than_dicts(self):
+        """같은 기사를 dict보다 적은 메모리로 보관하는지 테스트"""
+        def measure(build):
+            tracemalloc.start()
+            try:
+                items = build()
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            del items
+            return size
+        
+        dict_size = measure(lambda: make_dicts(5000))
+        article_size = measure(lambda: [Article.from_mapping(news) for news in make_dicts(5000)])
+        
+        assert article_size < dict_size * 0.75
@@ -0,0 +1,86 @@
+"""
+기사 묶음 테스트 모듈
+"""
+
+import random
+
+import pytest
+
+from article import Article
+from clustering import StoryClusterer, normalize_title
+
+
+TITLES = [
+    "[속보] 정부, 내일 국무회의서 경제 대책 논의",
+    "정부 내일 국무회의서 경제대책 논의(종합)",
+    "삼성전자 3분기 영업이익 10조 돌파",
+    "[단독] 삼성전자, 3분기 영업이익 10조원 돌파",
+    "서울 아파트값 5주 연속 상승",
+    "",
+    "오늘 날씨 맑음",
+]
+
+
+def test_normalize_title():
+    """괄호 머리말/문장 부호/공백 제거 테스트"""
+    assert normalize_title("[속보] 삼성전자, 10조 돌파…(종합)") == "삼성전자10조돌파"
+
+
+class TestStoryClusterer:
+    """StoryClusterer 테스트 클래스"""
+    
+    def test_cluster_similar_titles(self):
+        """비슷한 제목끼리만 묶는지 테스트"""
+        labels = StoryClusterer().cluster(TITLES)
+        
+        assert labels.tolist() == [0, 0, 2, 2, 4, 5, 6]
+    
+    def test_signature_estimates_jaccard(self):
+        """서명 일치 비율이 실제 Jaccard 유사도에 가까운지 테스트"""
+        clusterer = StoryClusterer(num_perm=256, bands=64)
+        signatures = clusterer.signatures(["가나다라마바사아", "가나다라마바사자"])
+        
+        # 2-gram 7개 중 6개 공통 → Jaccard 6/8
+        estimate = (signatures[0] == signatures[1]).mean()
+        assert estimate == pytest.approx(6 / 8, abs=0.1)
+    
+    def test_large_input_matches_planted_clusters(self):
+        """많은 제목에서도 심어 둔 묶음을 찾는지 테스트"""
+        rng = random.Random(3)
+        syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 2000, 7)]
+        titles, expected = [], []
+        
+        for story in range(2000):
+            words = [''.join(rng.choice(syllables) for _ in range(3)) for _ in range(6)]
+            for copy in range(story % 3 + 1):
+                titles.append(('[속보] ' if copy else '') + ' '.join(words))
+                expected.append(story)
+        
+        labels = StoryClusterer().cluster(titles).tolist()
+        
+        assert len(set(labels)) == 2000
+        groups = {}
+        for label, story in zip(labels, expected):
+            groups.setdefault(label, set()).add(story)
+        assert all(len(stories) == 1 for stories in groups.values())
+    
+    def test_collapse_counts_outlets(self):
+        """묶음 대표 기사와 언론사 수 테스트 (dict/Article 모두)"""
+        news_list = [
+            Article.from_url(TITLES[0], 'https://n.news.naver.com/mnews/article/001/0000000001'),
+            {'title': TITLES[1], 'url': 'https://n.news.naver.com/mnews/article/023/0000000002'},
+            {'title': TITLES[1], 'url': 'https://n.news.naver.com/mnews/article/001/0000000003'},
+            {'title': TITLES[2], 'url': 'https://n.news.naver.com/mnews/article/015/0000000004'},
+        ]
+        
+        collapsed = StoryClusterer().collapse(news_list)
+        
+        assert [news['title'] for news in collapsed] == [TITLES[0], TITLES[2]]
+        assert isinstance(collapsed[0], Article)
+        assert collapsed[0]['outlets'] == 2
+        assert 'outlets' not in collapsed[1]
+    
+    def test_invalid_bands(self):
+        """num_perm이 bands로 나누어 떨어지지 않으면 오류"""
+        with pytest.raises(ValueError):
+            StoryClusterer(num_perm=64, bands=10)
@@ -0,0 +1,160 @@
+"""
+복제본 조정 테스트 모듈
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from coordination import Coordinator, lease_key
+import main
+from main import run_cycle
+
+
+SECTIONS = [('100', None), ('101', None), ('101', '259'), ('102', None), ('103', None),
+            ('104', None), ('105', None), ('105', '230'), ('110', None), ('154', None)]
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """같은 DB를 공유하는 복제본 3개"""
+    path = str(tmp_path / 'coordination.db')
+    replicas = [Coordinator(path, replica_id=f"replica-{index}", heartbeat_ttl=0.3) for index in range(3)]
+    for replica in replicas:
+        replica.heartbeat()
+    yield replicas
+    for replica in replicas:
+        replica.close()
+
+
+class TestSharding:
+    """섹션 분배 테스트 클래스"""
+    
+    def test_shards_cover_sections_once(self, fleet):
+        """살아 있는 복제본끼리 섹션을 겹치지 않게 모두 나누는지 테스트"""
+        shards = [replica.shard(SECTIONS) for replica in fleet]
+        
+        assert sorted((section for shard in shards for section in shard), key=str) == sorted(SECTIONS, key=str)
+        assert all(shards)
+    
+    def test_rebalance_when_replica_dies(self, fleet):
+        """하트비트가 끊긴 복제본의 섹션만 남은 복제본에게 넘어가는지 테스트"""
+        before = [fleet[0].shard(SECTIONS), fleet[1].shard(SECTIONS), fleet[2].shard(SECTIONS)]
+        
+        time.sleep(0.35)
+        fleet[0].heartbeat()
+        fleet[1].heartbeat()
+        after = [fleet[0].shard(SECTIONS), fleet[1].shard(SECTIONS)]
+        
+        assert fleet[0].live_replicas() == ['replica-0', 'replica-1']
+        assert sorted(after[0] + after[1], key=str) == sorted(SECTIONS, key=str)
+        assert set(before[0]) <= set(after[0]) and set(before[1]) <= set(after[1])
+    
+    def test_leave_hands_over_immediately(self, fleet):
+        """정상 종료한 복제본의 섹션은 바로 다시 나뉘는지 테스트"""
+        fleet[2].leave()
+        
+        shards = [fleet[0].shard(SECTIONS), fleet[1].shard(SECTIONS)]
+        assert sorted(shards[0] + shards[1], key=str) == sorted(SECTIONS, key=str)
+
+
+class TestSendLease:
+    """전송 임대 테스트 클래스"""
+    
+    def test_send_once_across_replicas(self, fleet):
+        """같은 메시지/수신자는 복제본 전체에서 한 번만 보내는지 테스트"""
+        send = Mock(return_value=True)
+        
+        assert all(replica.send_once('msg', 'alice', send) for replica in fleet)
+        assert fleet[1].send_once('msg', 'bob', send)
+        assert send.call_count == 2
+    
+    def test_failed_send_is_released(self, fleet):
+        """보내지 못한 메시지는 다른 복제본이 다시 보낼 수 있는지 테스트"""
+        assert not fleet[0].send_once('msg', 'alice', Mock(return_value=False))
+        with pytest.raises(RuntimeError):
+            fleet[1].send_once('msg', 'alice', Mock(side_effect=RuntimeError("연결 끊김")))
+        
+        send = Mock(return_value=True)
+        assert fleet[2].send_once('msg', 'alice', send)
+        send.assert_called_once()
+    
+    def test_in_progress_is_not_sent(self, fleet):
+        """다른 복제본이 보내는 중인 메시지는 보낸 것으로 치지 않는지 테스트"""
+        key = lease_key('msg', 'alice')
+        assert fleet[0].acquire(key)
+        send = Mock(return_value=True)
+        
+        assert fleet[1].send_once('msg', 'alice', send) is None
+        assert not send.called
+        
+        fleet[0].complete(key)
+        assert fleet[1].send_once('msg', 'alice', send) is True
+        assert not send.called
+    
+    def test_expired_lease_is_taken_over(self, fleet):
+        """보내는 중에 죽은 복제본의 임대는 만료 후 넘겨받는지 테스트"""
+        fleet[0].lease_ttl = 0.05
+        assert fleet[0].acquire('key')
+        assert not fleet[1].acquire('key')
+        
+        time.sleep(0.06)
+        assert fleet[1].acquire('key')
+        fleet[1].complete('key')
+        fleet[0].complete('key')
+        
+        fleet[2].lease_ttl = 0
+        assert not fleet[2].acquire('key')
+    
+    def test_lease_renewed_while_sending(self, fleet):
+        """재시도로 전송이 lease_ttl보다 길어져도 다른 복제본이 넘겨받지 않는지 테스트"""
+        fleet[0].lease_ttl = 0.06
+        key = lease_key('msg', 'alice')
+        taken = []
+        
+        def slow_send():
+            for _ in range(4):
+                time.sleep(0.05)
+                taken.append(fleet[1].acquire(key))
+            return True
+        
+        assert fleet[0].send_once('msg', 'alice', slow_send) is True
+        assert taken == [False] * 4
+        assert fleet[1].is_done(key)
+    
+    def test_complete_reports_lost_lease(self, fleet):
+        """임대를 잃은 뒤의 완료 기록은 실패로 알리는지 테스트"""
+        fleet[0].lease_ttl = 0.05
+        assert fleet[0].acquire('key')
+        time.sleep(0.06)
+        assert fleet[1].acquire('key')
+        
+        assert fleet[0].complete('key') is False
+        assert not fleet[0].is_done('key')
+        assert fleet[1].complete('key') is True
+
+
+def test_run_cycle_crawls_owned_sections(fleet):
+    """증분 모드 사이클이 이 복제본이 담당하는 섹션만 수집하는지 테스트"""
+    crawler = Mock(archive=None)
+    crawler.crawl_incremental.return_value = []
+    crawler.cache_stats.return_value = {'hits': 0, 'misses': 0}
+    seen_index = Mock()
+    
+    for replica in fleet:
+        assert run_cycle(crawler, Mock(), seen_index, sections=SECTIONS, outbox=None, coordinator=replica)
+    
+    crawled = [section for call in crawler.crawl_incremental.call_args_list for section in call.args[0]]
+    assert sorted(crawled, key=str) == sorted(SECTIONS, key=str)
+
+
+def test_one_shot_refuses_coordination(tmp_path, monkeypatch):
+    """한 번 실행 모드는 하트비트가 없으므로 COORDINATION_DB 설정을 거부하는지 테스트"""
+    monkeypatch.setenv('COORDINATION_DB', str(tmp_path / 'coordination.db'))
+    monkeypatch.setattr('sys.argv', ['main.py'])
+    monkeypatch.setattr(main, 'create_sender', Mock())
+    
+    with pytest.raises(SystemExit):
+        main.main()
+    assert not main.create_sender.called
@@ -2,10 +2,35 @@
 네이버 뉴스 크롤러 테스트 모듈
 """
 
+import threading
+
 import pytest
 import requests
 from unittest.mock import Mock, patch, MagicMock
 from crawler import NaverNewsCrawler
+from kakao_sender import KakaoSender
+from main import run_cycle
+from seen_index import SeenArticleIndex
+from disk_cache import DiskLRUCache
+from list_parser import PARSER_BACKENDS
+from watermark import HighWaterMarkStore
+
+
+def make_response(html, status_code=200, headers=None):
+    """목록 페이지 Mock 응답 생성"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.text = html
+    mock_response.content = html.encode('utf-8')
+    mock_response.headers = headers or {'Content-Type': 'text/html; charset=utf-8'}
+    mock_response.raise_for_status = Mock()
+    return mock_response
+
+
+@pytest.fixture(params=PARSER_BACKENDS)
+def parser_backend(request):
+    """모든 파서 백엔드에 대해 테스트 실행"""
+    return request.param
 
 
 class TestNaverNewsCrawler:
@@ -17,8 +42,8 @@ class TestNaverNewsCrawler:
         assert crawler.base_url == "https://news.naver.com/main/list.naver"
         assert 'User-Agent' in crawler.headers
     
-    @patch('crawler.requests.get')
-    def test_get_breaking_news_success(self, mock_get):
+    @patch('http_client.HttpTransport.get')
+    def test_get_breaking_news_success(self, mock_get, parser_backend):
         """뉴스 가져오기 성공 테스트"""
         # Mock HTML 응답 생성
         mock_html = """
@@ -37,47 +62,228 @@ class TestNaverNewsCrawler:
         """
         
         # Mock 응답 설정
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(mock_html)
         
         # 테스트 실행
-        crawler = NaverNewsCrawler()
+        crawler = NaverNewsCrawler(parser=parser_backend)
         news_list = crawler.get_breaking_news(limit=2)
         
         # 검증
         assert len(news_list) == 2
         assert news_list[0]['title'] == '테스트 뉴스 1'
-        assert 'https://news.naver.com' in news_list[0]['url']
+        assert 'https://n.news.naver.com/mnews/article/' in news_list[0]['url']
         mock_get.assert_called_once()
     
-    @patch('crawler.requests.get')
-    def test_get_breaking_news_network_error(self, mock_get):
+    @patch('http_client.HttpTransport.get')
+    def test_get_breaking_news_network_error(self, mock_get, parser_backend):
         """네트워크 오류 테스트"""
         # 네트워크 오류 시뮬레이션 (requests.RequestException 사용)
         mock_get.side_effect = requests.RequestException("Connection error")
         
-        crawler = NaverNewsCrawler()
+        crawler = NaverNewsCrawler(parser=parser_backend)
         news_list = crawler.get_breaking_news()
         
         # 오류 발생 시 빈 리스트 반환
         assert news_list == []
     
-    @patch('crawler.requests.get')
-    def test_get_breaking_news_empty_result(self, mock_get):
+    @patch('http_client.HttpTransport.get')
+    def test_get_breaking_news_empty_result(self, mock_get, parser_backend):
         """뉴스가 없는 경우 테스트"""
         # 빈 HTML 응답
-        mock_response = Mock()
-        mock_response.text = "<html><body></body></html>"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response("<html><body></body></html>")
         
-        crawler = NaverNewsCrawler()
+        crawler = NaverNewsCrawler(parser=parser_backend)
         news_list = crawler.get_breaking_news()
         
         assert news_list == []
     
+    @patch('http_client.HttpTransport.get')
+    def test_crawl_multiple_sections(self, mock_get, parser_backend):
+        """여러 섹션 동시 크롤링 시 순서 유지 및 중복 제거 테스트"""
+        def fake_get(url, params=None, **kwargs):
+            sid = params.get('sid2') or params['sid1']
+            if sid == '265':
+                raise requests.RequestException("Connection error")
+            return make_response(f"""
+            <ul class="type06_headline">
+                <li><dt><a href="/article/{sid}/1">{sid} 뉴스 1</a></dt></li>
+                <li><dt><a href="/article/001/0000000001">공통 뉴스</a></dt></li>
+            </ul>
+            """)
+        
+        mock_get.side_effect = fake_get
+        
+        crawler = NaverNewsCrawler(max_concurrency=2, per_host_limit=1, parser=parser_backend)
+        news_list = crawler.crawl(sections=[('100', None), ('100', '265'), ('101', None)])
+        
+        assert [news['title'] for news in news_list] == ['100 뉴스 1', '공통 뉴스', '101 뉴스 1']
+        assert news_list[2]['sid1'] == '101'
+        assert mock_get.call_count == 3
+    
+    @patch('http_client.HttpTransport.get')
+    def test_get_breaking_news_cache(self, mock_get, tmp_path, parser_backend):
+        """조건부 요청 캐시 적중/미스 테스트"""
+        mock_html = """
+        <ul class="type06_headline">
+            <li><dt><a href="/article/001/0012345678">테스트 뉴스 1</a></dt></li>
+        </ul>
+        """
+        
+        first = make_response(mock_html, headers={'ETag': '"v1"'})
+        same_body = make_response(mock_html, headers={'ETag': '"v2"'})
+        not_modified = make_response('', status_code=304, headers={})
+        mock_get.side_effect = [first, same_body, not_modified]
+        
+        crawler = NaverNewsCrawler(cache=DiskLRUCache(str(tmp_path)), parser=parser_backend)
+        results = [crawler.get_breaking_news() for _ in range(3)]
+        
+        assert all(news_list[0]['title'] == '테스트 뉴스 1' for news_list in results)
+        assert crawler.cache_stats() == {'hits': 2, 'misses': 1}
+        assert mock_get.call_args_list[2].kwargs['headers']['If-None-Match'] == '"v2"'
+    
+    @patch('http_client.HttpTransport.get')
+    def test_not_modified_page_is_copied_and_archived(self, mock_get, tmp_path):
+        """304 응답도 캐시 기사의 복사본을 돌려주고 보관소에 넘기는지 테스트"""
+        mock_html = ('<ul class="type06_headline">'
+                     '<li><dt><a href="/article/001/0012345678">테스트 뉴스 1</a></dt></li></ul>')
+        mock_get.side_effect = [make_response(mock_html, headers={'ETag': '"v1"'}),
+                                make_response('', status_code=304, headers={}),
+                                make_response('', status_code=304, headers={})]
+        archive = Mock()
+        crawler = NaverNewsCrawler(cache=DiskLRUCache(str(tmp_path)), archive=archive)
+        
+        crawler._fetch_page('001')
+        crawler._fetch_page('001')[0]['title'] = '변경'
+        
+        assert crawler._fetch_page('001')[0]['title'] == '테스트 뉴스 1'
+        assert archive.add_many.call_count == 3
+    
+    @patch('http_client.HttpTransport.get')
+    def test_crawl_incremental_stops_at_watermark(self, mock_get, tmp_path):
+        """증분 크롤링: 첫 실행은 첫 페이지만, 이후에는 기준점까지만 수집"""
+        # 페이지당 2개, 최신 기사 ID가 가장 큼
+        articles = {'aids': [6, 5, 4, 3, 2, 1]}
+        
+        def fake_get(url, params=None, **kwargs):
+            aids = articles['aids']
+            page = int(params.get('page', 1))
+            chunk = aids[(page - 1) * 2:page * 2] or aids[-2:]
+            items = ''.join(
+                f'<li><dt><a href="/article/001/{aid}">뉴스 {aid}</a></dt></li>' for aid in chunk
+            )
+            return make_response(f'<ul class="type06_headline">{items}</ul>')
+        
+        mock_get.side_effect = fake_get
+        store = HighWaterMarkStore(str(tmp_path / 'marks.json'))
+        crawler = NaverNewsCrawler(watermarks=store)
+        
+        first = crawler.crawl_incremental(today='20240101')
+        assert [news['title'] for news in first] == ['뉴스 6', '뉴스 5']
+        assert mock_get.call_count == 1
+        
+        # 커밋 전에는 기준점이 바뀌지 않음
+        assert store.get('001') is None
+        crawler.commit_watermarks()
+        assert store.get('001') == {'oid': 1, 'aid': 6, 'date': '20240101'}
+        
+        # 새 기사 3개가 올라오면 2페이지까지 넘기고 기준점에서 멈춤
+        articles['aids'] = [9, 8, 7, 6, 5, 4]
+        mock_get.reset_mock()
+        second = crawler.crawl_incremental(today='20240101')
+        assert [news['title'] for news in second] == ['뉴스 9', '뉴스 8', '뉴스 7']
+        assert mock_get.call_count == 2
+        
+        crawler.commit_watermarks()
+        assert HighWaterMarkStore(str(tmp_path / 'marks.json')).get('001')['aid'] == 9
+    
+    @patch('http_client.HttpTransport.get')
+    def test_crawl_incremental_last_page_and_error(self, mock_get, tmp_path):
+        """증분 크롤링: 마지막 페이지 반복 감지, 오류 시 기준점 유지"""
+        store = HighWaterMarkStore(str(tmp_path / 'marks.json'))
+        store.set('001', 1, 100, '20240101')
+        
+        # 기준점이 목록에 없으면 마지막 페이지가 반복될 때 멈춤
+        mock_get.return_value = make_response(
+            '<ul class="type06_headline"><li><dt><a href="/article/001/200">뉴스</a></dt></li></ul>'
+        )
+        crawler = NaverNewsCrawler(watermarks=store)
+        news_list = crawler.crawl_incremental(max_pages=5, today='20240101')
+        
+        assert len(news_list) == 1
+        assert mock_get.call_count == 2
+        
+        # 요청 실패 시 기준점을 갱신하지 않음
+        crawler = NaverNewsCrawler(watermarks=store)
+        mock_get.side_effect = requests.RequestException("Connection error")
+        assert crawler.crawl_incremental(today='20240101') == []
+        crawler.commit_watermarks()
+        assert store.get('001')['aid'] == 100
+    
+    @patch('http_client.HttpTransport.get')
+    def test_failed_cycle_marks_not_committed_later(self, mock_get, tmp_path):
+        """전송에 실패한 섹션의 기준점이 다른 섹션을 보낸 다음 사이클에서 커밋되지 않는지 테스트"""
+        def fake_get(url, params=None, **kwargs):
+            oid = int(params['sid1']) - 100
+            items = ''.join(
+                f'<li><dt><a href="/article/{oid:03d}/{aid}">뉴스 {oid}-{aid}</a></dt></li>' for aid in (2, 1)
+            )
+            return make_response(f'<ul class="type06_headline">{items}</ul>')
+        
+        mock_get.side_effect = fake_get
+        store = HighWaterMarkStore(str(tmp_path / 'marks.json'))
+        crawler = NaverNewsCrawler(watermarks=store)
+        sender = Mock(spec=KakaoSender)
+        sender.stats.return_value = {'retry': {'retries': 0}, 'kauth': {'state': 'closed'},
+                                     'kapi': {'state': 'closed'}}
+        sender.send_template_objects.side_effect = [False, True, True]
+        seen_index = SeenArticleIndex(str(tmp_path / 'seen.db'))
+        
+        # 데몬 사이클: 101 전송 실패 → 102만 수집/전송 성공 → 101 다시 수집
+        assert not run_cycle(crawler, sender, seen_index, sections=[('101', None)])
+        assert run_cycle(crawler, sender, seen_index, sections=[('102', None)])
+        assert store.get('101') is None
+        
+        assert run_cycle(crawler, sender, seen_index, sections=[('101', None)])
+        sent = sender.send_template_objects.call_args_list[2].args[0]
+        assert '뉴스 1-2' in ''.join(sent)
+        assert store.get('101')['aid'] == 2
+    
+    def test_iter_news_yields_before_slow_pages(self):
+        """스트리밍: 느린 뒤쪽 페이지를 기다리지 않고 첫 페이지 기사를 바로 반환"""
+        release = threading.Event()
+        
+        def fake_fetch(sid1, sid2, page, date):
+            if page > 1:
+                release.wait(5)
+            return [{'title': f'뉴스 {page}', 'url': f'https://news.naver.com/article/001/{page}'}]
+        
+        crawler = NaverNewsCrawler(max_concurrency=2, per_host_limit=2)
+        crawler._fetch_page = fake_fetch
+        stream = crawler.iter_news([('001', None)], pages=3)
+        
+        first = next(stream)
+        assert first['title'] == '뉴스 1'
+        assert not release.is_set()
+        
+        release.set()
+        assert [news['title'] for news in stream] == ['뉴스 2', '뉴스 3']
+    
+    def test_iter_news_stops_early(self):
+        """스트리밍: 소비를 멈추면 남은 페이지를 요청하지 않음"""
+        requested = []
+        
+        def fake_fetch(sid1, sid2, page, date):
+            requested.append(page)
+            return [{'title': f'뉴스 {page}', 'url': f'https://news.naver.com/article/001/{page}'}]
+        
+        crawler = NaverNewsCrawler(max_concurrency=1, per_host_limit=1)
+        crawler._fetch_page = fake_fetch
+        stream = crawler.iter_news([('001', None)], pages=10)
+        
+        assert next(stream)['title'] == '뉴스 1'
+        stream.close()
+        assert len(requested) <= 2
+    
     def test_format_news_message(self):
         """메시지 포맷팅 테스트"""
         crawler = NaverNewsCrawler()
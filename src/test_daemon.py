@@ -0,0 +1,90 @@
+"""
+데몬 일정 테스트 모듈
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from daemon import CronSchedule, Daemon, IntervalSchedule
+
+
+class TestCronSchedule:
+    """CronSchedule 테스트 클래스"""
+    
+    def test_every_ten_minutes(self):
+        """분 간격 표현식 테스트"""
+        schedule = CronSchedule('*/10 * * * *')
+        assert schedule.next_after(datetime(2024, 1, 1, 8, 3, 20)) == datetime(2024, 1, 1, 8, 10)
+    
+    def test_hour_range_rolls_to_next_day(self):
+        """시간 범위를 벗어나면 다음 날로 넘어가는지 테스트"""
+        schedule = CronSchedule('0 7-9 * * *')
+        assert schedule.next_after(datetime(2024, 1, 1, 9, 0)) == datetime(2024, 1, 2, 7, 0)
+    
+    def test_weekdays(self):
+        """요일 지정 테스트 (2024-01-06은 토요일)"""
+        schedule = CronSchedule('30 8 * * 1-5')
+        assert schedule.next_after(datetime(2024, 1, 6, 12, 0)) == datetime(2024, 1, 8, 8, 30)
+    
+    def test_sunday_as_seven(self):
+        """요일 7을 일요일로 취급하는지 테스트"""
+        schedule = CronSchedule('0 0 * * 7')
+        assert schedule.next_after(datetime(2024, 1, 1)) == datetime(2024, 1, 7)
+    
+    def test_invalid_expression(self):
+        """잘못된 표현식 테스트"""
+        with pytest.raises(ValueError):
+            CronSchedule('* * *')
+        with pytest.raises(ValueError):
+            CronSchedule('61 * * * *')
+
+
+def test_interval_jitter_bounds():
+    """고정 간격 + jitter 범위 테스트"""
+    schedule = IntervalSchedule(60, jitter=10)
+    start = datetime(2024, 1, 1)
+    
+    for _ in range(20):
+        delay = (schedule.next_after(start) - start).total_seconds()
+        assert 60 <= delay <= 70
+
+
+class TestDaemon:
+    """Daemon 테스트 클래스"""
+    
+    def test_cycles_do_not_overlap(self):
+        """실행 중인 사이클이 있으면 건너뛰는지 테스트"""
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_cycle():
+            started.set()
+            release.wait(5)
+            return True
+        
+        daemon = Daemon(IntervalSchedule(60), slow_cycle)
+        worker = threading.Thread(target=daemon.run_once)
+        worker.start()
+        started.wait(5)
+        
+        assert daemon.run_once() is None
+        release.set()
+        worker.join()
+        assert daemon.cycles_run == 1
+        assert daemon.cycles_skipped == 1
+    
+    def test_stop(self):
+        """종료 요청 시 대기 중에도 즉시 종료하는지 테스트"""
+        calls = []
+        daemon = Daemon(IntervalSchedule(3600), lambda: calls.append(1) or True)
+        worker = threading.Thread(target=daemon.run)
+        worker.start()
+        
+        time.sleep(0.1)
+        daemon.stop()
+        worker.join(5)
+        
+        assert not worker.is_alive()
+        assert calls == [1]
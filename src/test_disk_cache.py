@@ -0,0 +1,36 @@
+"""
+디스크 캐시 테스트 모듈
+"""
+
+from disk_cache import DiskLRUCache
+
+
+class TestDiskLRUCache:
+    """DiskLRUCache 테스트 클래스"""
+    
+    def test_set_and_get(self, tmp_path):
+        """저장 및 조회 테스트"""
+        cache = DiskLRUCache(str(tmp_path))
+        cache.set('key', {'articles': [{'title': '뉴스'}]})
+        
+        assert cache.get('key') == {'articles': [{'title': '뉴스'}]}
+        assert cache.get('missing') is None
+    
+    def test_lru_eviction(self, tmp_path):
+        """항목 수 초과 시 가장 오래 사용하지 않은 항목 삭제 테스트"""
+        cache = DiskLRUCache(str(tmp_path), max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert len(list(tmp_path.glob('*.json'))) == 2
+    
+    def test_reload_from_disk(self, tmp_path):
+        """재시작 후 디스크에서 항목 복원 테스트"""
+        DiskLRUCache(str(tmp_path)).set('key', 'value')
+        
+        assert DiskLRUCache(str(tmp_path)).get('key') == 'value'
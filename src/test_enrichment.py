@@ -0,0 +1,136 @@
+"""
+기사 보강 테스트 모듈
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import requests
+
+from article import Article
+from disk_cache import DiskLRUCache
+from enrichment import ArticleEnricher, parse_article_page
+from message_renderer import MessageRenderer
+
+
+ARTICLE_HTML = """<!DOCTYPE html>
+<html lang="ko"><head>
+<meta property="og:title" content="경제 뉴스 제목">
+<meta property="og:image" content="https://imgnews.pstatic.net/image/001/2026/10/17/photo.jpg">
+<meta property="og:description" content="  첫 문단 &quot;요약&quot;입니다.
+  두 번째 줄 ">
+<meta property="og:article:author" content="연합뉴스 | 네이버">
+</head><body>
+<span class="media_end_head_info_datestamp_time _ARTICLE_DATE_TIME" data-date-time="2026-10-17 09:12:33">2026.10.17. 오전 9:12</span>
+</body></html>"""
+
+
+def make_response(status_code=200, body=ARTICLE_HTML):
+    return Mock(status_code=status_code, content=body.encode('utf-8'),
+                headers={'Content-Type': 'text/html; charset=utf-8'},
+                raise_for_status=Mock(side_effect=None if status_code < 400 else requests.HTTPError(status_code)))
+
+
+def make_news(count):
+    return [Article(f"뉴스 {index}", 1, index, sid1='101') for index in range(count)]
+
+
+def test_parse_article_page():
+    """상세 페이지에서 언론사/입력 시각/요약/썸네일을 추출하는지 테스트"""
+    details = parse_article_page(ARTICLE_HTML.encode('utf-8'), 'text/html; charset=utf-8')
+    
+    assert details == {
+        'press': '연합뉴스',
+        'published': '2026-10-17 09:12:33',
+        'lead': '첫 문단 "요약"입니다. 두 번째 줄',
+        'thumbnail': 'https://imgnews.pstatic.net/image/001/2026/10/17/photo.jpg',
+    }
+    assert parse_article_page(ARTICLE_HTML.encode('utf-8'), max_lead_length=5)['lead'] == '첫 문단…'
+    assert parse_article_page(b'<meta property="article:published_time" content="2026-10-17T09:12+09:00">') == {
+        'published': '2026-10-17 09:12:00'
+    }
+
+
+class TestArticleEnricher:
+    """ArticleEnricher 테스트 클래스"""
+    
+    def test_enrich_fetches_each_article_once(self, tmp_path):
+        """캐시에 있는 기사는 다시 받지 않고 다시 열어도 재사용하는지 테스트"""
+        transport = Mock()
+        transport.get.return_value = make_response()
+        enricher = ArticleEnricher(DiskLRUCache(str(tmp_path)), transport=transport, max_workers=4)
+        news_list = make_news(5)
+        
+        enriched = enricher.enrich(news_list + news_list[:2])
+        assert transport.get.call_count == 5
+        assert [news.press for news in enriched] == ['연합뉴스'] * 7
+        assert enriched[0].key == (1, 0) and enriched[0].sid1 == '101'
+        assert transport.get.call_args_list[0].args[0] == 'https://n.news.naver.com/mnews/article/001/0000000000'
+        
+        reopened = ArticleEnricher(DiskLRUCache(str(tmp_path)), transport=transport)
+        assert reopened.enrich(news_list)[4].lead == enriched[4].lead
+        assert transport.get.call_count == 5
+        assert reopened.stats() == {'hits': 5, 'fetches': 0, 'errors': 0}
+    
+    def test_keeps_existing_fields_and_failures(self, tmp_path):
+        """목록에서 얻은 값은 유지하고 요청 실패한 기사는 그대로 두는지 테스트"""
+        transport = Mock()
+        transport.get.side_effect = [make_response(), requests.ConnectionError("연결 끊김"), make_response(404)]
+        enricher = ArticleEnricher(DiskLRUCache(str(tmp_path)), transport=transport, max_workers=1)
+        news_list = [
+            {'title': '뉴스', 'url': 'https://news.naver.com/article/001/0000000001', 'press': '목록 언론사'},
+            {'title': '실패', 'url': 'https://news.naver.com/article/001/0000000002'},
+            {'title': '삭제', 'url': 'https://news.naver.com/article/001/0000000003'},
+            {'title': '외부', 'url': 'https://example.com/news/1'},
+        ]
+        
+        enriched = enricher.enrich(news_list)
+        
+        assert enriched[0]['press'] == '목록 언론사' and enriched[0]['published'] == '2026-10-17 09:12:33'
+        assert enriched[1:] == news_list[1:]
+        assert enricher.stats() == {'hits': 0, 'fetches': 2, 'errors': 1}
+        
+        # 실패한 기사만 다시 요청 (삭제된 기사는 빈 결과가 캐시됨)
+        transport.get.side_effect = [make_response()]
+        assert enricher.enrich(news_list)[1]['lead']
+        assert transport.get.call_count == 4
+    
+    def test_concurrent_fetches_are_bounded_and_shared(self, tmp_path):
+        """동시 요청 수를 제한하고 같은 기사를 동시에 요청하면 한 번만 받는지 테스트"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def get(url, **kwargs):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(url)
+            return make_response()
+        
+        transport = Mock()
+        transport.get.side_effect = get
+        enricher = ArticleEnricher(DiskLRUCache(str(tmp_path)), transport=transport, max_workers=3)
+        news_list = make_news(9)
+        
+        threads = [threading.Thread(target=enricher.enrich, args=(news_list,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        enricher.close()
+        
+        assert max(peak) <= 3
+        assert transport.get.call_count == 9
+
+
+def test_feed_shows_enriched_fields():
+    """피드 메시지 설명에 언론사/입력 시각/요약을 표시하는지 테스트"""
+    news = Article('경제 뉴스', 1, 1, press='연합뉴스', published='2026-10-17 09:12:33', lead='첫 문단')
+    
+    template_object = MessageRenderer(template='feed').render([news])[0]
+    
+    assert '"description": "연합뉴스 · 10-17 09:12\\n첫 문단"' in template_object
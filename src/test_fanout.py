@@ -0,0 +1,157 @@
+"""
+다중 수신자 발송 테스트 모듈
+"""
+
+import time
+from unittest.mock import Mock
+
+import fanout
+from fanout import FanoutDispatcher, Subscriber, SubscriberRegistry, TokenBucket
+from outbox import Outbox, deliver
+
+
+class TestSubscriberRegistry:
+    """SubscriberRegistry 테스트 클래스"""
+    
+    def test_save_and_load(self, tmp_path):
+        """구독자 저장/불러오기 테스트"""
+        path = str(tmp_path / 'subscribers.json')
+        registry = SubscriberRegistry(path)
+        registry.add(Subscriber('alice', 'client-a', 'refresh-a'))
+        registry.add(Subscriber('bob', 'client-b', 'refresh-b', 'secret-b'))
+        registry.save()
+        
+        loaded = SubscriberRegistry(path)
+        assert [subscriber.id for subscriber in loaded] == ['alice', 'bob']
+        assert loaded.subscribers['bob'].client_secret == 'secret-b'
+        assert loaded.keywords() == {}
+
+
+class TestFanoutDispatcher:
+    """FanoutDispatcher 테스트 클래스"""
+    
+    def test_dispatch_report(self):
+        """구독자별 결과 보고 테스트"""
+        ok_sender = Mock()
+        ok_sender.send_template_object.return_value = True
+        failing_sender = Mock()
+        failing_sender.send_template_object.return_value = False
+        
+        dispatcher = FanoutDispatcher({'alice': ok_sender, 'bob': failing_sender}, rate_per_token=100, burst=2)
+        results = dispatcher.dispatch(['{"object_type": "text"}', '{"object_type": "list"}'])
+        
+        assert [(result.subscriber_id, result.success, result.messages_sent) for result in results] == [
+            ('alice', True, 2),
+            ('bob', False, 0),
+        ]
+        assert ok_sender.send_template_object.call_count == 2
+    
+    def test_dispatch_stream(self, monkeypatch):
+        """메시지가 나올 때마다 전송하고 실패한 구독자는 이후 메시지를 받지 않는지 테스트"""
+        executors = Mock(side_effect=fanout.ThreadPoolExecutor)
+        monkeypatch.setattr(fanout, 'ThreadPoolExecutor', executors)
+        ok_sender = Mock()
+        ok_sender.send_template_object.return_value = True
+        flaky_sender = Mock()
+        flaky_sender.send_template_object.side_effect = [True, False]
+        dispatcher = FanoutDispatcher({'alice': ok_sender, 'bob': flaky_sender}, rate_per_token=100, burst=3)
+        delivered_before = []
+        
+        def messages():
+            for index in range(3):
+                delivered_before.append(ok_sender.send_template_object.call_count)
+                yield f'{{"object_type": "text", "text": "{index}"}}'
+        
+        results = dispatcher.dispatch_stream(messages())
+        
+        assert delivered_before == [0, 1, 2]
+        assert [(result.subscriber_id, result.success, result.messages_sent) for result in results] == [
+            ('alice', True, 3),
+            ('bob', False, 1),
+        ]
+        assert flaky_sender.send_template_object.call_count == 2
+        # 메시지마다 실행기를 새로 만들지 않음
+        assert executors.call_count == 1
+    
+    def test_send_message_encodes_once(self):
+        """같은 인코딩 결과를 모든 구독자에게 재사용하는지 테스트"""
+        senders = {str(i): Mock(**{'send_template_object.return_value': True}) for i in range(5)}
+        dispatcher = FanoutDispatcher(senders, rate_per_token=100)
+        
+        assert dispatcher.send_message("테스트")
+        payloads = [sender.send_template_object.call_args.args[0] for sender in senders.values()]
+        assert all(payload is payloads[0] for payload in payloads)
+    
+    def test_send_news_by_keywords(self, tmp_path):
+        """구독 키워드별로 기사를 나누어 보내고 파일 변경을 반영하는지 테스트"""
+        path = tmp_path / 'subscribers.json'
+        registry = SubscriberRegistry(str(path))
+        registry.add(Subscriber('alice', 'client-a', 'refresh-a', keywords=['반도체']))
+        registry.add(Subscriber('bob', 'client-b', 'refresh-b'))
+        registry.add(Subscriber('carol', 'client-c', 'refresh-c', keywords=['날씨']))
+        registry.add(Subscriber('dave', 'client-d', 'refresh-d', keywords=['Samsung']))
+        registry.save()
+        registry.load()
+        
+        senders = {subscriber.id: Mock(**{'send_template_object.return_value': True}) for subscriber in registry}
+        dispatcher = FanoutDispatcher(senders, rate_per_token=100, burst=10, keywords=registry.keywords())
+        dispatcher.registry = registry
+        renderer = Mock()
+        renderer.iter_render.side_effect = lambda news_list: [
+            '|'.join(news['title'] for news in news_list)
+        ]
+        news_list = [{'title': '반도체 수출 증가'}, {'title': '증시 마감'}]
+        
+        assert dispatcher.send_news(news_list, renderer)
+        assert senders['alice'].send_template_object.call_args.args[0] == '반도체 수출 증가'
+        assert senders['bob'].send_template_object.call_args.args[0] == '반도체 수출 증가|증시 마감'
+        assert not senders['carol'].send_template_object.called
+        assert not senders['dave'].send_template_object.called
+        
+        registry.subscribers['carol'].keywords = ['증시']
+        registry.save()
+        registry.mtime = None
+        
+        assert dispatcher.send_news(news_list, renderer)
+        assert senders['carol'].send_template_object.call_args.args[0] == '증시 마감'
+        assert renderer.iter_render.call_count == 5
+    
+    def test_partial_failure_requeues_failed_subscriber(self, tmp_path):
+        """일부 구독자만 실패하면 그 구독자가 받지 못한 메시지만 대기열에 저장하는지 테스트"""
+        ok_sender = Mock(**{'send_template_object.return_value': True})
+        flaky_sender = Mock()
+        flaky_sender.send_template_object.side_effect = [True, False]
+        outbox = Outbox(str(tmp_path / 'redelivery.db'), retry_delay=0)
+        dispatcher = FanoutDispatcher({'alice': ok_sender, 'bob': flaky_sender}, rate_per_token=100, burst=3,
+                                      redelivery=outbox)
+        
+        assert dispatcher.send_template_objects(['1', '2', '3'])
+        jobs = outbox.claim(10)
+        assert [(job.payload, job.recipients) for job in jobs] == [('2', ['bob']), ('3', ['bob'])]
+        outbox.release(jobs)
+        
+        # 대기열의 작업은 실패했던 구독자에게만 다시 보냄
+        flaky_sender.send_template_object.side_effect = None
+        flaky_sender.send_template_object.return_value = True
+        assert deliver(outbox, dispatcher) == {'delivered': 2, 'failed': 0}
+        assert [call.args[0] for call in flaky_sender.send_template_object.call_args_list] == ['1', '2', '2', '3']
+        assert ok_sender.send_template_object.call_count == 3
+    
+    def test_failure_without_redelivery(self):
+        """모두 실패했거나 저장할 대기열이 없으면 실패로 취급하는지 테스트"""
+        ok_sender = Mock(**{'send_template_object.return_value': True})
+        failing_sender = Mock(**{'send_template_object.return_value': False})
+        
+        assert not FanoutDispatcher({'alice': ok_sender, 'bob': failing_sender},
+                                    rate_per_token=100).send_template_objects(['1'])
+        assert not FanoutDispatcher({'bob': failing_sender}, rate_per_token=100).send_template_objects(['1'])
+
+
+def test_token_bucket_limits_rate():
+    """토큰 버킷 속도 제한 테스트"""
+    bucket = TokenBucket(rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    
+    assert time.monotonic() - started >= 0.09
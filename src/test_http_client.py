@@ -0,0 +1,56 @@
+"""
+공용 HTTP 전송 모듈 테스트 모듈
+"""
+
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import pytest
+from http_client import HttpTransport, DEFAULT_TIMEOUT
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = HTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpTransport:
+    """HttpTransport 테스트 클래스"""
+    
+    def test_default_timeout(self):
+        """기본 타임아웃 적용 테스트"""
+        transport = HttpTransport()
+        assert transport.timeout == DEFAULT_TIMEOUT
+    
+    def test_connection_reuse_stats(self, local_server):
+        """keep-alive 연결 재사용 통계 테스트"""
+        transport = HttpTransport()
+        
+        for _ in range(3):
+            response = transport.get(local_server + '/')
+            assert response.text == 'ok'
+        
+        stats = transport.stats()['127.0.0.1:' + local_server.rsplit(':', 1)[1]]
+        assert stats['requests'] == 3
+        assert stats['connections'] == 1
+        assert stats['reused'] == 2
+        transport.close()
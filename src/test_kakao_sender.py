@@ -0,0 +1,146 @@
+"""
+카카오톡 메시지 전송 테스트 모듈
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import requests
+from kakao_sender import KakaoSender
+from retry import RetryPolicy
+from token_store import TokenStore
+
+
+def make_token_response(access_token='access-1', expires_in=21599, refresh_token=None):
+    """토큰 발급 Mock 응답 생성"""
+    tokens = {'access_token': access_token, 'expires_in': expires_in}
+    if refresh_token:
+        tokens['refresh_token'] = refresh_token
+    
+    response = Mock(status_code=200)
+    response.json.return_value = tokens
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestAccessTokenCache:
+    """Access Token 캐시 테스트 클래스"""
+    
+    def test_token_reused_until_expiry(self, tmp_path):
+        """만료 전에는 kauth를 다시 호출하지 않는지 테스트"""
+        transport = Mock()
+        transport.post.return_value = make_token_response()
+        store = TokenStore(str(tmp_path / 'token.json'))
+        
+        sender = KakaoSender('client', 'refresh', transport=transport, token_store=store)
+        assert sender.ensure_access_token()
+        
+        # 새 프로세스에서도 저장된 토큰 재사용
+        restarted = KakaoSender('client', 'refresh', transport=transport, token_store=store)
+        assert restarted.ensure_access_token()
+        assert restarted.access_token == 'access-1'
+        assert transport.post.call_count == 1
+    
+    def test_refresh_near_expiry(self, tmp_path):
+        """만료 직전이면 갱신하는지 테스트"""
+        transport = Mock()
+        transport.post.side_effect = [
+            make_token_response('access-1', expires_in=60),
+            make_token_response('access-2'),
+        ]
+        
+        sender = KakaoSender('client', 'refresh', transport=transport, expiry_margin=300)
+        assert sender.ensure_access_token()
+        assert sender.ensure_access_token()
+        assert sender.access_token == 'access-2'
+    
+    def test_rotated_refresh_token_persisted(self, tmp_path):
+        """갱신된 Refresh Token이 저장되는지 테스트"""
+        transport = Mock()
+        transport.post.return_value = make_token_response(refresh_token='refresh-2')
+        store = TokenStore(str(tmp_path / 'token.json'))
+        
+        KakaoSender('client', 'refresh-1', transport=transport, token_store=store).ensure_access_token()
+        
+        assert store.load()['refresh_token'] == 'refresh-2'
+        assert KakaoSender('client', 'refresh-1', token_store=store).refresh_token == 'refresh-2'
+        assert KakaoSender('other', 'refresh-1', token_store=store).refresh_token == 'refresh-1'
+    
+    def test_single_flight_refresh(self):
+        """동시 호출 시 갱신 요청을 한 번만 보내는지 테스트"""
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return make_token_response()
+        
+        transport = Mock()
+        transport.post.side_effect = slow_post
+        sender = KakaoSender('client', 'refresh', transport=transport)
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(sender.ensure_access_token()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert results == [True] * 8
+        assert transport.post.call_count == 1
+    
+    def test_stale_token_forces_refresh(self):
+        """401을 받은 토큰은 만료 전이라도 갱신하는지 테스트"""
+        transport = Mock()
+        transport.post.side_effect = [make_token_response('access-1'), make_token_response('access-2')]
+        sender = KakaoSender('client', 'refresh', transport=transport)
+        
+        sender.ensure_access_token()
+        assert sender.ensure_access_token(stale_token='access-1')
+        assert sender.access_token == 'access-2'
+
+
+class TestSendMessage:
+    """send_message 재시도 테스트 클래스"""
+    
+    def make_sender(self, transport):
+        sender = KakaoSender('client', 'refresh', transport=transport,
+                             retry_policy=RetryPolicy(max_attempts=2, sleep=lambda _: None))
+        sender.access_token = 'access-1'
+        sender.access_token_expires_at = time.time() + 3600
+        return sender
+    
+    def test_unauthorized_refreshes_once(self):
+        """401 응답 시 토큰을 한 번만 재발급하고 재시도하는지 테스트"""
+        unauthorized = Mock(status_code=401)
+        unauthorized.raise_for_status.side_effect = requests.HTTPError("401")
+        
+        transport = Mock()
+        transport.post.side_effect = [
+            unauthorized,
+            make_token_response('access-2'),
+            unauthorized,
+        ]
+        sender = self.make_sender(transport)
+        
+        assert sender.send_message("테스트") is False
+        assert transport.post.call_count == 3
+    
+    def test_connection_error_returns_false(self):
+        """응답 없이 예외가 발생해도 False를 반환하는지 테스트"""
+        transport = Mock()
+        transport.post.side_effect = requests.ConnectionError("down")
+        sender = self.make_sender(transport)
+        
+        assert sender.send_message("테스트") is False
+        assert sender.stats()['retry']['retries'] == 1
+    
+    def test_read_timeout_is_not_resent(self):
+        """전송 요청이 카카오에 닿았을 수 있는 읽기 타임아웃은 다시 보내지 않는지 테스트"""
+        transport = Mock()
+        transport.post.side_effect = requests.ReadTimeout("slow")
+        sender = self.make_sender(transport)
+        
+        assert sender.send_message("테스트") is False
+        assert transport.post.call_count == 1
@@ -0,0 +1,89 @@
+"""
+키워드 구독 매칭 테스트 모듈
+"""
+
+import random
+
+from keyword_matcher import KeywordAutomaton, KeywordRouter
+
+
+class TestKeywordAutomaton:
+    """KeywordAutomaton 테스트 클래스"""
+    
+    def test_overlapping_keywords(self):
+        """겹치거나 다른 키워드 안에 들어 있는 키워드를 모두 찾는지 테스트"""
+        automaton = KeywordAutomaton(['삼성', '삼성전자', '전자', 'AI', ' '])
+        
+        matches = sorted(automaton.iter_matches('삼성전자 ai 반도체'))
+        
+        assert matches == [(1, '삼성'), (3, '삼성전자'), (3, '전자'), (6, 'ai')]
+    
+    def test_matches_naive_search(self):
+        """무작위 키워드/제목에서 단순 검색과 결과가 같은지 테스트"""
+        rng = random.Random(5)
+        alphabet = '가나다라마'
+        keywords = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)}
+        automaton = KeywordAutomaton(keywords)
+        
+        for _ in range(200):
+            text = ''.join(rng.choice(alphabet) for _ in range(20))
+            assert automaton.find(text) == {keyword for keyword in keywords if keyword in text}
+    
+    def test_incremental_changes(self):
+        """키워드 추가/제거 후 다음 매칭에서 한 번만 다시 계산하는지 테스트"""
+        automaton = KeywordAutomaton(['he', 'she', 'hers'])
+        assert automaton.find('ushers') == {'he', 'she', 'hers'}
+        assert automaton.builds == 1
+        
+        automaton.remove('he')
+        automaton.add('us')
+        automaton.add('us')
+        assert automaton.find('ushers') == {'us', 'she', 'hers'}
+        assert automaton.find('house') == {'us'}
+        assert automaton.builds == 2
+        
+        # 제거했던 키워드를 다시 추가
+        automaton.add('He')
+        assert automaton.find('ushers') == {'us', 'he', 'she', 'hers'}
+    
+    def test_compacts_removed_keywords(self):
+        """제거된 키워드가 많으면 트라이를 새로 만드는지 테스트"""
+        automaton = KeywordAutomaton(f"키워드{index}" for index in range(100))
+        for index in range(90):
+            automaton.remove(f"키워드{index}")
+        
+        assert automaton.find('키워드5 키워드95') == {'키워드95'}
+        assert len(automaton._goto) < 30
+
+
+class TestKeywordRouter:
+    """KeywordRouter 테스트 클래스"""
+    
+    def test_route(self):
+        """키워드가 걸린 구독자와 키워드가 없는 구독자에게 나누는지 테스트"""
+        router = KeywordRouter()
+        router.set_keywords('alice', ['삼성'])
+        router.set_keywords('bob', ['LG', '삼성전자'])
+        news_list = [{'title': '삼성전자 실적 발표'}, {'title': 'lg에너지솔루션 증설'}, {'title': '오늘 날씨'}]
+        
+        routes = router.route(news_list, ['alice', 'bob', 'carol'])
+        
+        assert routes == {
+            'alice': news_list[:1],
+            'bob': news_list[:2],
+            'carol': news_list,
+        }
+    
+    def test_shared_keyword_lifecycle(self):
+        """여러 구독자가 같은 키워드를 구독/해제할 때 오토마톤 반영 테스트"""
+        router = KeywordRouter()
+        router.sync({'alice': ['경제'], 'bob': ['경제', '증시']})
+        assert router.match('경제 증시 동향') == {'alice', 'bob'}
+        
+        router.remove_subscriber('bob')
+        assert router.automaton.keywords == {'경제'}
+        assert router.match('경제 증시 동향') == {'alice'}
+        
+        router.sync({'bob': ['증시']})
+        assert not router.has_keywords('alice')
+        assert router.match('경제 증시 동향') == {'bob'}
@@ -0,0 +1,83 @@
+"""
+뉴스 목록 페이지 파서 테스트 모듈
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from list_parser import PARSER_BACKENDS, detect_charset, parse_news_list
+
+
+FIXTURE_DIR = Path(__file__).parent.parent / 'benchmarks' / 'fixtures'
+FIXTURES = json.loads((FIXTURE_DIR / 'manifest.json').read_text(encoding='utf-8'))
+
+SAMPLE_HTML = """
+<html>
+<head><meta charset="euc-kr"></head>
+<body>
+    <ul class="nav"><li><a href="/menu">메뉴</a></li></ul>
+    <ul class="type06_headline">
+        <li>
+            <dl>
+                <dt class="photo"><a href="/article/001/0000000001"><img src="https://imgnews.pstatic.net/image/origin/001/2026/10/17/1.jpg?type=nf106_72" alt=""></a></dt>
+                <dt><a href="/article/001/0000000001">
+                    사진 있는 <b>뉴스</b> &amp; 속보
+                </a></dt>
+                <dd><span class="lede">요약</span></dd>
+            </dl>
+        </li>
+        <li><dl><dt><a href="https://n.news.naver.com/article/002/0000000002">절대경로 뉴스</a></dt></dl></li>
+    </ul>
+    <ul class="type06">
+        <li><dl><dt class="photo"><a href="/article/003/0000000003">사진만 있는 뉴스</a></dt></dl></li>
+        <li><span>링크 없음</span></li>
+    </ul>
+</body>
+</html>
+"""
+
+
+class TestParseNewsList:
+    """parse_news_list 테스트 클래스"""
+    
+    @pytest.mark.parametrize('backend', PARSER_BACKENDS)
+    def test_parse_euc_kr(self, backend):
+        """euc-kr 페이지 파싱 테스트"""
+        news_list = parse_news_list(SAMPLE_HTML.encode('euc-kr'), 'text/html', backend=backend)
+        
+        assert news_list == [
+            {'title': '사진 있는뉴스& 속보', 'url': 'https://news.naver.com/article/001/0000000001',
+             'thumbnail': 'https://imgnews.pstatic.net/image/origin/001/2026/10/17/1.jpg?type=nf106_72'},
+            {'title': '절대경로 뉴스', 'url': 'https://n.news.naver.com/article/002/0000000002'},
+            {'title': '사진만 있는 뉴스', 'url': 'https://news.naver.com/article/003/0000000003'},
+        ]
+    
+    def test_backends_match(self):
+        """fast/bs4 백엔드 결과 일치 테스트"""
+        content = SAMPLE_HTML.encode('euc-kr')
+        results = [parse_news_list(content, backend=backend) for backend in PARSER_BACKENDS]
+        
+        assert all(result == results[0] for result in results)
+    
+    def test_unknown_backend(self):
+        """지원하지 않는 백엔드 테스트"""
+        with pytest.raises(ValueError):
+            parse_news_list(b'', backend='lxml')
+    
+    def test_detect_charset(self):
+        """문자셋 결정 우선순위 테스트"""
+        assert detect_charset(b'', 'text/html; charset=UTF-8') == 'utf-8'
+        assert detect_charset(b'<meta charset="EUC-KR">', 'text/html') == 'cp949'
+        assert detect_charset(b'<html></html>') == 'utf-8'
+    
+    @pytest.mark.parametrize('name', sorted(FIXTURES))
+    def test_benchmark_fixtures(self, name):
+        """벤치마크 픽스처(실제 크기 목록 페이지)에서 백엔드별 결과 일치 테스트"""
+        entry = FIXTURES[name]
+        content = (FIXTURE_DIR / entry['file']).read_bytes()
+        results = [parse_news_list(content, entry['content_type'], backend=backend)
+                   for backend in PARSER_BACKENDS]
+        
+        assert len(results[0]) == entry['articles']
+        assert all(result == results[0] for result in results)
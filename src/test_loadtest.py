@@ -0,0 +1,68 @@
+"""
+부하 테스트 대역 서버/드라이버 테스트 모듈
+"""
+
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'loadtest'))
+
+from driver import percentile, run_load  # noqa: E402
+from stubs import Recorder, StubConfig, StubServer, StubState  # noqa: E402
+
+
+class TestStubs:
+    """대역 서버 테스트 클래스"""
+    
+    def test_token_rotation(self):
+        """Refresh Token 회전 후 이전 토큰 거부 테스트"""
+        state = StubState(StubConfig(rotate_every=1))
+        state.register_client('client', 'refresh')
+        
+        with StubServer(state) as server:
+            data = {'grant_type': 'refresh_token', 'client_id': 'client', 'refresh_token': 'refresh'}
+            first = requests.post(server.url + '/oauth/token', data=data)
+            second = requests.post(server.url + '/oauth/token', data=data)
+        
+        assert first.status_code == 200
+        assert first.json()['refresh_token'] != 'refresh'
+        assert second.status_code == 401
+    
+    def test_record_and_replay(self, tmp_path):
+        """목록 페이지 기록/재생 테스트"""
+        recorder = Recorder(str(tmp_path / 'recording.jsonl'))
+        
+        with StubServer(StubState(StubConfig()), mode='record', recorder=recorder) as server:
+            recorded = requests.get(server.url + '/main/list.naver?sid1=001&mode=LSD')
+        
+        with StubServer(StubState(StubConfig()), mode='replay', recorder=recorder) as server:
+            replayed = requests.get(server.url + '/main/list.naver?mode=LSD&sid1=001')
+            missing = requests.get(server.url + '/main/list.naver?sid1=100')
+        
+        assert replayed.content == recorded.content
+        assert replayed.headers['Content-Type'] == 'text/html; charset=utf-8'
+        assert missing.status_code == 404
+
+
+class TestDriver:
+    """부하 테스트 드라이버 테스트 클래스"""
+    
+    def test_run_load_with_faults(self):
+        """401/429/토큰 회전이 있어도 모든 사이클이 전송에 성공하는지 테스트"""
+        config = StubConfig(unauthorized_rate=0.05, rate_limit_rate=0.05, rotate_every=2,
+                            publish_rate=50, seed=7)
+        report = run_load(config, cycles=3, pipelines=2, subscribers=3, interval=0.05)
+        
+        assert report['failed_cycles'] == 0
+        assert report['articles'] > 0
+        assert set(report['stages']) >= {'crawl', 'dedup', 'render', 'token', 'send', 'cycle'}
+        assert report['stub']['POST /v2/api/talk/memo/default/send 401'] > 0
+    
+    def test_percentile(self):
+        """분위수 계산 테스트"""
+        values = [float(value) for value in range(1, 101)]
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([], 0.5) == 0.0
@@ -0,0 +1,90 @@
+"""
+메시지 렌더링 테스트 모듈
+"""
+
+import json
+
+import pytest
+from message_renderer import MessageRenderer
+
+
+def make_news(count, title_length=10):
+    return [
+        {'title': f"{i:02d}" + '가' * title_length, 'url': f"https://n.news.naver.com/article/001/{i:010d}"}
+        for i in range(count)
+    ]
+
+
+class TestMessageRenderer:
+    """MessageRenderer 테스트 클래스"""
+    
+    def test_text_respects_length_limit(self):
+        """text 템플릿 글자 수 제한 및 순서 유지 테스트"""
+        renderer = MessageRenderer('text', max_text_length=200)
+        messages = [json.loads(message) for message in renderer.render(make_news(10))]
+        
+        assert len(messages) > 1
+        assert all(len(message['text']) <= 200 for message in messages)
+        text = ''.join(message['text'] for message in messages)
+        assert [text.index(f"{i}. ") for i in range(1, 11)] == sorted(text.index(f"{i}. ") for i in range(1, 11))
+    
+    def test_text_single_message_when_fits(self):
+        """제한 안에 들어가면 메시지 하나로 보내는지 테스트"""
+        renderer = MessageRenderer('text', max_text_length=10000)
+        messages = renderer.render(make_news(10))
+        
+        assert len(messages) == 1
+        assert json.loads(messages[0])['object_type'] == 'text'
+    
+    def test_outlets_count(self):
+        """묶음 대표 기사의 언론사 수 표시 테스트"""
+        news = {**make_news(1)[0], 'press': '연합뉴스', 'outlets': 3}
+        
+        text = json.loads(MessageRenderer('text', max_text_length=10000).render([news])[0])['text']
+        feed = json.loads(MessageRenderer('feed').render([news])[0])
+        
+        assert "가 (3개 언론사)\n" in text
+        assert feed['content']['description'] == '연합뉴스 (3개 언론사)'
+    
+    def test_text_truncates_oversized_item(self):
+        """기사 하나가 제한을 넘으면 제목을 잘라내고 링크는 유지하는지 테스트"""
+        renderer = MessageRenderer('text', max_text_length=100)
+        messages = [json.loads(message) for message in renderer.render(make_news(1, title_length=300))]
+        
+        assert len(messages) == 1
+        assert len(messages[0]['text']) == 100
+        # 제목만 줄이고 링크 줄은 그대로 유지
+        assert messages[0]['text'].endswith("가…\n   🔗 https://n.news.naver.com/article/001/0000000000")
+    
+    def test_list_packing(self):
+        """list 템플릿 3개씩 묶고 1개 남으면 feed로 보내는지 테스트"""
+        renderer = MessageRenderer('list')
+        messages = [json.loads(message) for message in renderer.render(make_news(7))]
+        
+        assert [message['object_type'] for message in messages] == ['list', 'list', 'feed']
+        assert [len(message['contents']) for message in messages[:2]] == [3, 3]
+        assert messages[2]['content']['title'].startswith('06')
+    
+    def test_feed_includes_thumbnail(self):
+        """feed 템플릿 썸네일/언론사 포함 테스트"""
+        news = {'title': '뉴스', 'url': 'https://n.news.naver.com/article/001/1',
+                'press': '연합뉴스', 'thumbnail': 'https://imgnews.pstatic.net/a.jpg'}
+        message = json.loads(MessageRenderer('feed').render([news])[0])
+        
+        assert message['content']['image_url'] == 'https://imgnews.pstatic.net/a.jpg'
+        assert message['content']['description'] == '연합뉴스'
+    
+    def test_item_render_cache(self):
+        """같은 기사를 다시 렌더링하지 않는지 테스트"""
+        renderer = MessageRenderer('list')
+        news_list = make_news(4)
+        renderer.render(news_list)
+        renderer.render(news_list[1:])
+        
+        assert renderer.cache_stats()['misses'] == 4
+        assert renderer.cache_stats()['hits'] == 3
+    
+    def test_unknown_template(self):
+        """지원하지 않는 템플릿 테스트"""
+        with pytest.raises(ValueError):
+            MessageRenderer('carousel')
@@ -0,0 +1,155 @@
+"""
+계측 모듈 테스트 모듈
+"""
+
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from http_client import HttpTransport
+from metrics import Metrics, MetricsServer, NullMetrics, get_metrics, set_metrics
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        body = b'0123456789'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def metrics():
+    """공용 계측 객체를 테스트용 Metrics로 교체"""
+    instance = Metrics(io.StringIO())
+    set_metrics(instance)
+    yield instance
+    set_metrics(None)
+
+
+class TestMetrics:
+    """Metrics 테스트 클래스"""
+    
+    def test_counters_and_histograms_render(self, metrics):
+        """카운터/히스토그램 Prometheus 텍스트 변환 테스트"""
+        metrics.inc('articles_parsed_total', 20)
+        metrics.inc('articles_parsed_total', 5)
+        metrics.observe('http_request_duration_seconds', 0.02, host='example.com', connection='new')
+        metrics.observe('http_request_duration_seconds', 3.0, host='example.com', connection='new')
+        
+        text = metrics.render_prometheus()
+        labels = 'connection="new",host="example.com"'
+        
+        assert 'newsbot_articles_parsed_total 25' in text
+        assert f'newsbot_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+        assert f'newsbot_http_request_duration_seconds_bucket{{{labels},le="2.5"}} 1' in text
+        assert f'newsbot_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f'newsbot_http_request_duration_seconds_count{{{labels}}} 2' in text
+    
+    def test_label_values_escaped(self, metrics):
+        """라벨 값의 따옴표/역슬래시/줄바꿈만 이스케이프하는지 테스트"""
+        metrics.inc('errors_total', reason='bad "quote"\\path\nnext')
+        
+        text = metrics.render_prometheus()
+        assert 'newsbot_errors_total{reason="bad \\"quote\\"\\\\path\\nnext"} 1' in text
+    
+    def test_span_logs_json_and_error_status(self, metrics):
+        """span 소요 시간 기록과 예외 시 status=error 로그 테스트"""
+        with metrics.span('crawl'):
+            pass
+        with pytest.raises(ValueError):
+            with metrics.span('send'):
+                raise ValueError("실패")
+        
+        events = [json.loads(line) for line in metrics.log_stream.getvalue().splitlines()]
+        
+        assert [(event['span'], event['status']) for event in events] == [('crawl', 'ok'), ('send', 'error')]
+        assert metrics.snapshot()['histograms']['stage_duration_seconds']['stage=send']['count'] == 1
+    
+    def test_null_metrics_is_default(self, monkeypatch):
+        """METRICS_ENABLED가 없으면 빈 구현을 쓰고 span 객체를 재사용하는지 테스트"""
+        monkeypatch.delenv('METRICS_ENABLED', raising=False)
+        set_metrics(None)
+        try:
+            null = get_metrics()
+            assert isinstance(null, NullMetrics)
+            assert null.span('crawl') is null.span('send')
+            with null.span('crawl'):
+                null.inc('articles_parsed_total', 3)
+            assert null.render_prometheus() == ''
+        finally:
+            set_metrics(None)
+    
+    def test_enabled_from_env(self, monkeypatch, tmp_path):
+        """환경 변수로 활성화하고 JSON 로그 파일에 기록하는지 테스트"""
+        log_path = tmp_path / 'metrics.jsonl'
+        monkeypatch.setenv('METRICS_ENABLED', 'true')
+        monkeypatch.setenv('METRICS_LOG', str(log_path))
+        set_metrics(None)
+        try:
+            instance = get_metrics()
+            assert isinstance(instance, Metrics)
+            instance.inc('retries_total', reason=429)
+            instance.log_snapshot()
+            instance.log_stream.close()
+        finally:
+            set_metrics(None)
+        
+        event = json.loads(log_path.read_text(encoding='utf-8'))
+        assert event['event'] == 'metrics'
+        assert event['counters']['retries_total'] == {'reason=429': 1}
+
+
+class TestInstrumentation:
+    """계측 지점 테스트 클래스"""
+    
+    def test_http_transport_records_per_host_latency(self, metrics):
+        """호스트별 지연 시간과 새 연결/재사용 구분 기록 테스트"""
+        server = HTTPServer(('127.0.0.1', 0), OkHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host = f"127.0.0.1:{server.server_port}"
+        
+        transport = HttpTransport()
+        try:
+            for _ in range(3):
+                transport.get(f"http://{host}/")
+        finally:
+            transport.close()
+            server.shutdown()
+            server.server_close()
+        
+        snapshot = metrics.snapshot()
+        latency = snapshot['histograms']['http_request_duration_seconds']
+        
+        assert latency[f'connection=new,host={host}']['count'] == 1
+        assert latency[f'connection=reused,host={host}']['count'] == 2
+        assert snapshot['counters']['http_response_bytes_total'][f'host={host}'] == 30
+        assert snapshot['counters']['http_requests_total'][f'host={host},method=GET,status=200'] == 3
+    
+    def test_metrics_server(self, metrics):
+        """/metrics 엔드포인트 테스트"""
+        metrics.inc('messages_sent_total', result='ok')
+        
+        server = MetricsServer(0, host='127.0.0.1', metrics=metrics).start()
+        try:
+            response = requests.get(f"http://127.0.0.1:{server.port}/metrics")
+            missing = requests.get(f"http://127.0.0.1:{server.port}/")
+        finally:
+            server.stop()
+        
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'newsbot_messages_sent_total{result="ok"} 1' in response.text
+        assert missing.status_code == 404
+
@@ -0,0 +1,136 @@
+"""
+발송 대기열 테스트 모듈
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from kakao_sender import KakaoSender
+from main import run_cycle
+from outbox import Outbox, deliver
+from seen_index import SeenArticleIndex
+
+
+def make_outbox(tmp_path, **kwargs) -> Outbox:
+    kwargs.setdefault('retry_delay', 0)
+    return Outbox(str(tmp_path / 'outbox.db'), **kwargs)
+
+
+class TestOutbox:
+    """Outbox 테스트 클래스"""
+    
+    def test_enqueue_is_idempotent(self, tmp_path):
+        """같은 메시지는 대기 중이거나 보낸 뒤에도 다시 들어가지 않는지 테스트"""
+        outbox = make_outbox(tmp_path)
+        
+        assert outbox.enqueue(['a', 'b', 'a']) == 2
+        assert outbox.enqueue(['b', 'c']) == 1
+        assert outbox.enqueue(['a'], recipients=['alice']) == 1
+        
+        outbox.ack(outbox.claim(10))
+        assert outbox.enqueue(['a', 'b']) == 0
+        assert outbox.stats() == {'pending': 0, 'inflight': 0, 'done': 4, 'dead': 0}
+        
+        outbox.purge(0)
+        assert outbox.enqueue(['a']) == 1
+    
+    def test_visibility_timeout(self, tmp_path):
+        """꺼낸 작업은 제한 시간 동안 숨겨지고 지나면 다시 꺼낼 수 있는지 테스트"""
+        outbox = make_outbox(tmp_path, visibility_timeout=0.05)
+        outbox.enqueue(['a', 'b', 'c'])
+        
+        first = outbox.claim(2)
+        assert [job.payload for job in first] == ['a', 'b']
+        assert [job.payload for job in outbox.claim(10)] == ['c']
+        assert outbox.claim(10) == []
+        
+        time.sleep(0.06)
+        again = outbox.claim(10)
+        assert [(job.payload, job.attempts) for job in again] == [('a', 2), ('b', 2), ('c', 2)]
+        
+        # 제한 시간이 지난 이전 워커의 반환/실패는 무시
+        outbox.release(first)
+        outbox.fail(first[0], "늦은 실패")
+        assert outbox.stats()['inflight'] == 3
+    
+    def test_fail_and_dead_letter(self, tmp_path):
+        """실패하면 재시도하고 최대 횟수를 넘으면 dead로 보관하는지 테스트"""
+        outbox = make_outbox(tmp_path, max_attempts=2)
+        outbox.enqueue(['a'])
+        
+        outbox.fail(outbox.claim(1)[0], "오류")
+        job = outbox.claim(1)[0]
+        assert job.attempts == 2
+        outbox.fail(job, "오류")
+        
+        assert outbox.claim(1) == []
+        assert outbox.stats()['dead'] == 1
+        assert outbox.requeue_dead() == 1
+        assert outbox.claim(1)[0].attempts == 1
+
+
+def test_deliver_stops_on_failure_and_resumes(tmp_path):
+    """전송 실패 시 나머지 작업을 남기고 다음 전송에서 순서대로 이어 보내는지 테스트"""
+    outbox = make_outbox(tmp_path)
+    outbox.enqueue(['1', '2', '3', '4'])
+    sender = Mock()
+    sender.send_template_objects.side_effect = [True, False, True, True, True]
+    
+    assert deliver(outbox, sender, batch_size=3) == {'delivered': 1, 'failed': 1}
+    assert outbox.stats()['pending'] == 3
+    
+    assert deliver(outbox, sender, batch_size=3) == {'delivered': 3, 'failed': 0}
+    sent = [call.args[0][0] for call in sender.send_template_objects.call_args_list]
+    assert sent == ['1', '2', '2', '3', '4']
+
+
+def test_deliver_routed_jobs(tmp_path):
+    """수신자가 지정된 작업은 해당 구독자에게만 보내는지 테스트"""
+    outbox = make_outbox(tmp_path)
+    outbox.enqueue(['msg'], recipients=['alice', 'bob'])
+    sender = Mock()
+    sender.send_template_objects.return_value = True
+    
+    assert deliver(outbox, sender) == {'delivered': 1, 'failed': 0}
+    sender.send_template_objects.assert_called_once_with(['msg'], ['alice', 'bob'])
+
+
+def test_deliver_workers_send_each_job_once(tmp_path):
+    """여러 워커가 작업을 나누어 한 번씩만 보내는지 테스트"""
+    outbox = make_outbox(tmp_path)
+    outbox.enqueue([str(index) for index in range(50)])
+    sent = []
+    lock = threading.Lock()
+    
+    def send(template_objects):
+        with lock:
+            sent.extend(template_objects)
+        return True
+    
+    sender = Mock()
+    sender.send_template_objects.side_effect = send
+    
+    assert deliver(outbox, sender, workers=4, batch_size=5) == {'delivered': 50, 'failed': 0}
+    assert sorted(sent, key=int) == [str(index) for index in range(50)]
+
+
+def test_run_cycle_keeps_crawl_when_send_fails(tmp_path):
+    """전송이 실패해도 크롤링 결과를 대기열에 남기고 다음 사이클에 보내는지 테스트"""
+    news_list = [{'title': f"뉴스 {index}", 'url': f"https://news.naver.com/article/001/{index:010d}"}
+                 for index in range(3)]
+    crawler = Mock(watermarks=None)
+    crawler.get_breaking_news.side_effect = [news_list, news_list]
+    crawler.cache_stats.return_value = {'hits': 0, 'misses': 0}
+    sender = Mock(spec=KakaoSender)
+    sender.send_template_objects.side_effect = [False, True]
+    seen_index = SeenArticleIndex(str(tmp_path / 'seen.db'))
+    outbox = make_outbox(tmp_path)
+    
+    assert run_cycle(crawler, sender, seen_index, outbox=outbox)
+    assert len(seen_index) == 3
+    assert outbox.stats()['pending'] == 1
+    
+    assert run_cycle(crawler, sender, seen_index, outbox=outbox)
+    assert sender.send_template_objects.call_count == 2
+    assert outbox.stats()['done'] == 1
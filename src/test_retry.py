@@ -0,0 +1,128 @@
+"""
+재시도 정책 테스트 모듈
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+from retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+def make_response(status_code, headers=None):
+    response = Mock(status_code=status_code)
+    response.headers = headers or {}
+    return response
+
+
+class TestRetryPolicy:
+    """RetryPolicy 테스트 클래스"""
+    
+    def test_retries_server_errors(self):
+        """5xx 응답 재시도 테스트"""
+        sleeps = []
+        policy = RetryPolicy(max_attempts=3, sleep=sleeps.append)
+        request = Mock(side_effect=[make_response(503), make_response(502), make_response(200)])
+        
+        assert policy.call(request).status_code == 200
+        assert request.call_count == 3
+        assert len(sleeps) == 2
+        assert policy.stats() == {'attempts': 3, 'retries': 2}
+    
+    def test_does_not_retry_client_errors(self):
+        """4xx(429 제외) 응답은 재시도하지 않는지 테스트"""
+        policy = RetryPolicy(sleep=lambda _: None)
+        request = Mock(return_value=make_response(400))
+        
+        assert policy.call(request).status_code == 400
+        assert request.call_count == 1
+    
+    def test_honors_retry_after(self):
+        """429 응답의 Retry-After 준수 테스트"""
+        sleeps = []
+        policy = RetryPolicy(max_attempts=2, max_delay=60, sleep=sleeps.append)
+        request = Mock(side_effect=[make_response(429, {'Retry-After': '7'}), make_response(200)])
+        
+        policy.call(request)
+        assert sleeps == [7.0]
+    
+    def test_backoff_is_capped(self):
+        """백오프 상한 테스트"""
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        assert all(0 <= policy.backoff(10) <= 5 for _ in range(50))
+    
+    def test_reraises_connection_error(self):
+        """연결 오류가 계속되면 마지막 예외 발생 테스트"""
+        policy = RetryPolicy(max_attempts=2, sleep=lambda _: None)
+        request = Mock(side_effect=requests.ConnectionError("down"))
+        
+        with pytest.raises(requests.ConnectionError):
+            policy.call(request)
+        assert request.call_count == 2
+    
+    def test_non_idempotent_retries_only_unsent_requests(self):
+        """멱등이 아닌 요청은 서버가 처리했을 수 있는 실패를 재시도하지 않는지 테스트"""
+        policy = RetryPolicy(max_attempts=3, sleep=lambda _: None)
+        
+        request = Mock(side_effect=requests.ReadTimeout("read timed out"))
+        with pytest.raises(requests.ReadTimeout):
+            policy.call(request, idempotent=False)
+        assert request.call_count == 1
+        
+        for status_code in (500, 502, 503, 504):
+            request = Mock(side_effect=[make_response(status_code), make_response(200)])
+            assert policy.call(request, idempotent=False).status_code == status_code
+            assert request.call_count == 1
+        
+        request = Mock(side_effect=[requests.ConnectTimeout("connect timed out"), requests.ConnectionError("refused"),
+                                    make_response(200)])
+        assert policy.call(request, idempotent=False).status_code == 200
+        
+        request = Mock(side_effect=[make_response(429), make_response(503, {'Retry-After': '1'}), make_response(200)])
+        assert policy.call(request, idempotent=False).status_code == 200
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트 클래스"""
+    
+    def test_opens_and_fails_fast(self):
+        """연속 실패 시 차단 후 요청을 보내지 않는지 테스트"""
+        breaker = CircuitBreaker('kapi', failure_threshold=2, reset_timeout=60)
+        policy = RetryPolicy(max_attempts=2, sleep=lambda _: None)
+        request = Mock(return_value=make_response(500))
+        
+        policy.call(request, breaker)
+        
+        with pytest.raises(CircuitOpenError):
+            policy.call(request, breaker)
+        assert request.call_count == 2
+        assert breaker.stats()['state'] == 'open'
+        assert breaker.stats()['rejected'] == 1
+    
+    def test_half_open_recovers(self):
+        """차단 시간 경과 후 시험 요청 성공 시 복구 테스트"""
+        breaker = CircuitBreaker('kapi', failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        
+        breaker.before_call()
+        assert breaker.state == 'half_open'
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        
+        breaker.record_success()
+        assert breaker.state == 'closed'
+    
+    def test_unexpected_error_ends_half_open_trial(self):
+        """시험 요청이 재시도하지 않는 예외로 끝나도 다음 시험 요청을 허용하는지 테스트"""
+        breaker = CircuitBreaker('kapi', failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        policy = RetryPolicy(max_attempts=3, sleep=lambda _: None)
+        request = Mock(side_effect=[requests.exceptions.ChunkedEncodingError("cut"), make_response(200)])
+        
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            policy.call(request, breaker)
+        assert request.call_count == 1
+        assert breaker.state == 'open'
+        
+        assert policy.call(request, breaker).status_code == 200
+        assert breaker.state == 'closed'
@@ -0,0 +1,83 @@
+"""
+발송 이력 인덱스 테스트 모듈
+"""
+
+import time
+
+from article import parse_article_key
+from seen_index import BloomFilter, SeenArticleIndex
+
+
+def test_parse_article_key():
+    """기사 URL에서 (oid, aid) 추출 테스트"""
+    assert parse_article_key('https://n.news.naver.com/mnews/article/001/0012345678?sid=100') == (1, 12345678)
+    assert parse_article_key('https://news.naver.com/main/read.naver?mode=LSD&oid=023&aid=0000000042') == (23, 42)
+    assert parse_article_key('https://news.naver.com/main/list.naver') is None
+
+
+class TestSeenArticleIndex:
+    """SeenArticleIndex 테스트 클래스"""
+    
+    def test_filter_new(self, tmp_path):
+        """발송한 기사 제외 테스트"""
+        index = SeenArticleIndex(str(tmp_path / 'seen.db'))
+        index.add_many([{'title': '뉴스 1', 'url': 'https://news.naver.com/article/001/0000000001'}])
+        
+        news_list = [
+            {'title': '뉴스 1', 'url': 'https://n.news.naver.com/mnews/article/001/0000000001'},
+            {'title': '뉴스 2', 'url': 'https://news.naver.com/article/001/0000000002'},
+            {'title': '뉴스 2 중복', 'url': 'https://news.naver.com/article/001/0000000002'},
+        ]
+        
+        assert [news['title'] for news in index.filter_new(news_list)] == ['뉴스 2']
+    
+    def test_iter_new_is_lazy(self, tmp_path):
+        """입력을 하나씩 소비하며 새 기사를 반환하는지 테스트"""
+        index = SeenArticleIndex(str(tmp_path / 'seen.db'))
+        index.add_many([{'title': '뉴스 1', 'url': 'https://news.naver.com/article/001/0000000001'}])
+        consumed = []
+        
+        def news_iter():
+            for aid in (1, 2, 3):
+                consumed.append(aid)
+                yield {'title': f'뉴스 {aid}', 'url': f'https://news.naver.com/article/001/{aid:010d}'}
+        
+        stream = index.iter_new(news_iter())
+        assert next(stream)['title'] == '뉴스 2'
+        assert consumed == [1, 2]
+    
+    def test_persistence(self, tmp_path):
+        """재시작 후 이력 유지 테스트"""
+        path = str(tmp_path / 'seen.db')
+        SeenArticleIndex(path).add_many([{'title': '뉴스', 'url': '/article/005/0000000009'}])
+        
+        index = SeenArticleIndex(path)
+        assert (5, 9) in index
+        assert index.contains_url('/article/005/0000000009')
+    
+    def test_compact(self, tmp_path):
+        """보관 기간이 지난 이력 삭제 테스트"""
+        index = SeenArticleIndex(str(tmp_path / 'seen.db'))
+        index.add_many([{'title': '오래된 뉴스', 'url': '/article/001/1'}], seen_at=time.time() - 3600)
+        index.add_many([{'title': '최근 뉴스', 'url': '/article/001/2'}])
+        
+        assert index.compact(ttl_seconds=60) == 1
+        assert (1, 1) not in index
+        assert (1, 2) in index
+    
+    def test_bloom_grows(self, tmp_path):
+        """Bloom 필터 용량 초과 시 재구성 테스트"""
+        index = SeenArticleIndex(str(tmp_path / 'seen.db'), capacity=4)
+        index.add_many([{'title': str(i), 'url': f'/article/001/{i}'} for i in range(10)])
+        
+        assert index.bloom.capacity >= 10
+        assert all((1, i) in index for i in range(10))
+
+
+def test_bloom_filter_no_false_negatives():
+    """Bloom 필터 거짓 음성 없음 테스트"""
+    bloom = BloomFilter(1000)
+    for i in range(1000):
+        bloom.add((1, i))
+    
+    assert all((1, i) in bloom for i in range(1000))
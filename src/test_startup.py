@@ -0,0 +1,45 @@
+"""
+시작 시간 테스트 모듈
+"""
+
+import os
+from pathlib import Path
+
+from startup_profile import DEFERRED_MODULES, cold_start_time, measure_imports, parse_importtime
+
+
+MAIN_SCRIPT = str(Path(__file__).parent / 'main.py')
+
+# 빈 인터프리터 시작 시간을 뺀 main import 시간 상한 (초, 느린 CI에서는 환경 변수로 조정)
+STARTUP_BUDGET = float(os.getenv('STARTUP_BUDGET_SECONDS', 0.5))
+
+
+def test_parse_importtime():
+    """-X importtime 출력 파싱 테스트"""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   urllib3.util\n"
+        "import time:       300 |        420 | requests\n"
+    )
+    
+    timings = parse_importtime(output)
+    
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ('urllib3.util', 120, 120, 1),
+        ('requests', 300, 420, 0),
+    ]
+
+
+def test_deferred_modules_not_loaded():
+    """시작 시 무거운 모듈을 로드하지 않는지 테스트"""
+    loaded = {timing.module for timing in measure_imports(MAIN_SCRIPT)}
+    
+    assert 'main' in loaded
+    assert loaded.isdisjoint(DEFERRED_MODULES)
+
+
+def test_cold_start_budget():
+    """main import 콜드 스타트 시간 상한 테스트"""
+    elapsed, baseline = cold_start_time(MAIN_SCRIPT)
+    
+    assert elapsed - baseline < STARTUP_BUDGET
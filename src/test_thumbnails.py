@@ -0,0 +1,147 @@
+"""
+썸네일 캐시 테스트 모듈
+"""
+
+import struct
+from unittest.mock import Mock
+
+import requests
+
+from article import Article
+from thumbnails import ThumbnailCache, canonical_url, image_size
+
+
+LIST_THUMBNAIL = 'https://imgnews.pstatic.net/image/origin/001/2026/10/17/1.jpg?type=nf106_72'
+LARGE_THUMBNAIL = 'https://imgnews.pstatic.net/image/origin/001/2026/10/17/1.jpg?type=w647'
+
+
+def png(width, height, tag=b''):
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', width, height) + tag
+
+
+def jpeg(width, height):
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + b'\x00' * 9
+    sof = b'\xff\xc0' + struct.pack('>HBHHB', 11, 8, height, width, 1) + b'\x00' * 3
+    return b'\xff\xd8' + app0 + sof + b'\xff\xd9'
+
+
+def make_transport(images):
+    transport = Mock()
+    
+    def get(url, **kwargs):
+        body = images.get(url)
+        if isinstance(body, Exception):
+            raise body
+        if body is None:
+            return Mock(status_code=404)
+        return Mock(status_code=200, content=body, raise_for_status=Mock())
+    
+    transport.get.side_effect = get
+    return transport
+
+
+def test_image_size():
+    """이미지 헤더에서 형식과 크기를 읽는지 테스트"""
+    assert image_size(png(647, 400)) == ('image/png', 647, 400)
+    assert image_size(jpeg(640, 360)) == ('image/jpeg', 640, 360)
+    assert image_size(b'GIF89a' + struct.pack('<HH', 300, 200)) == ('image/gif', 300, 200)
+    assert image_size(b'<html>not found</html>') is None
+
+
+def test_canonical_url():
+    """네이버 이미지 URL만 큰 크기로 바꾸는지 테스트"""
+    assert canonical_url(LIST_THUMBNAIL, 'w647') == LARGE_THUMBNAIL
+    assert canonical_url('https://example.com/a.jpg?type=s', 'w647') == 'https://example.com/a.jpg?type=s'
+    assert canonical_url(LIST_THUMBNAIL, None) == LIST_THUMBNAIL
+
+
+class TestThumbnailCache:
+    """ThumbnailCache 테스트 클래스"""
+    
+    def test_resolve_once_then_memory_and_disk(self, tmp_path):
+        """처음 보는 URL만 받고 이후에는 메모리, 다시 열면 디스크에서 찾는지 테스트"""
+        transport = make_transport({LARGE_THUMBNAIL: png(647, 400)})
+        cache = ThumbnailCache(str(tmp_path), transport=transport)
+        
+        info = cache.resolve(LIST_THUMBNAIL)
+        assert (info.url, info.content_type, info.width, info.height) == (LARGE_THUMBNAIL, 'image/png', 647, 400)
+        assert cache.resolve(LIST_THUMBNAIL) == info
+        assert transport.get.call_count == 1
+        
+        reopened = ThumbnailCache(str(tmp_path), transport=transport)
+        assert reopened.resolve(LIST_THUMBNAIL) == info
+        assert transport.get.call_count == 1
+        assert reopened.stats()['disk'] == 1
+    
+    def test_content_addressed(self, tmp_path):
+        """같은 이미지는 URL이 달라도 메타데이터를 하나만 저장하는지 테스트"""
+        image = jpeg(640, 360)
+        urls = [f"https://example.com/photo{index}.jpg" for index in range(3)]
+        cache = ThumbnailCache(str(tmp_path), transport=make_transport(dict.fromkeys(urls, image)))
+        
+        infos = [cache.resolve(url) for url in urls]
+        
+        assert len({info.digest for info in infos}) == 1
+        assert [info.url for info in infos] == urls
+        assert len(list((tmp_path / 'objects').glob('*.json'))) == 1
+        assert len(list((tmp_path / 'urls').glob('*.json'))) == 3
+    
+    def test_rejects_invalid_and_retries_errors(self, tmp_path):
+        """이미지가 아니거나 작은 썸네일은 기억해 두고, 요청 실패는 다음에 다시 시도하는지 테스트"""
+        images = {
+            'https://example.com/small.png': png(100, 80),
+            'https://example.com/page.html': b'<html></html>',
+            'https://example.com/flaky.png': requests.ConnectionError("연결 끊김"),
+        }
+        transport = make_transport(images)
+        cache = ThumbnailCache(str(tmp_path), transport=transport)
+        
+        assert all(cache.resolve(url) is None for url in list(images) + ['https://example.com/missing.png'])
+        assert cache.resolve('thumb.jpg') is None
+        
+        images['https://example.com/flaky.png'] = png(300, 200)
+        reopened = ThumbnailCache(str(tmp_path), transport=transport)
+        assert all(reopened.resolve(url) is None for url in ['https://example.com/small.png',
+                                                              'https://example.com/page.html'])
+        assert reopened.resolve('https://example.com/flaky.png').width == 300
+        assert transport.get.call_count == 5
+    
+    def test_byte_budget_evicts_least_recently_used(self, tmp_path):
+        """파일 전체 크기가 예산을 넘으면 오래 쓰지 않은 항목부터 지우는지 테스트"""
+        urls = [f"https://example.com/{index}.png" for index in range(20)]
+        images = {url: png(400, 300, tag=url.encode('ascii')) for url in urls}
+        transport = make_transport(images)
+        cache = ThumbnailCache(str(tmp_path), max_bytes=2000, memory_entries=0, transport=transport)
+        
+        for url in urls:
+            cache.resolve(url)
+            cache.resolve(urls[0])
+        
+        stats = cache.stats()
+        assert stats['bytes'] <= 2000
+        assert stats['bytes'] == sum(path.stat().st_size for path in tmp_path.glob('*/*.json'))
+        assert transport.get.call_count == 20
+        
+        cache.resolve(urls[0])
+        cache.resolve(urls[1])
+        assert transport.get.call_count == 21
+    
+    def test_apply(self, tmp_path):
+        """기사 썸네일을 확인한 URL로 바꾸고 쓸 수 없는 썸네일은 빼는지 테스트"""
+        transport = make_transport({LARGE_THUMBNAIL: png(647, 400)})
+        cache = ThumbnailCache(str(tmp_path), transport=transport)
+        news_list = [
+            Article('사진 뉴스', 1, 1, thumbnail=LIST_THUMBNAIL),
+            {'title': '같은 사진', 'url': 'https://news.naver.com/article/001/0000000002', 'thumbnail': LIST_THUMBNAIL},
+            {'title': '깨진 사진', 'url': 'https://news.naver.com/article/001/0000000003',
+             'thumbnail': 'https://example.com/broken.png'},
+            Article('사진 없는 뉴스', 1, 4),
+        ]
+        
+        results = cache.apply(news_list)
+        
+        assert results[0].thumbnail == LARGE_THUMBNAIL
+        assert results[1]['thumbnail'] == LARGE_THUMBNAIL
+        assert 'thumbnail' not in results[2]
+        assert results[3] is news_list[3]
+        assert transport.get.call_count == 2
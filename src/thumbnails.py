@@ -0,0 +1,352 @@
+"""
+썸네일 모듈
+목록 페이지 사진 기사의 썸네일 URL을 한 번만 받아 이미지인지 확인하고 크기를
+잰 뒤, 결과를 디스크 캐시와 메모리에 저장하여 feed/list 템플릿에 씁니다.
+
+디스크 캐시는 이미지 내용의 SHA-256으로 메타데이터를 저장하고(같은 이미지는
+URL이 달라도 하나), URL별로는 그 다이제스트만 가리킵니다. 전체 파일 크기가
+예산을 넘으면 가장 오래 쓰지 않은 파일부터 삭제합니다.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from article import Article
+from http_client import HttpTransport, get_transport
+from metrics import get_metrics
+
+
+# 네이버 뉴스 이미지 서버 (type 파라미터로 크기를 바꿔 받을 수 있음)
+PSTATIC_HOST = 'imgnews.pstatic.net'
+
+
+@dataclass
+class ThumbnailInfo:
+    """검증한 썸네일 정보"""
+    url: str
+    digest: str
+    content_type: str
+    width: int
+    height: int
+    size: int
+
+
+def canonical_url(url: str, size_type: Optional[str] = None) -> str:
+    """
+    썸네일 URL 정규화
+    
+    네이버 이미지 서버 URL은 목록용 작은 크기(type=nf106_72) 대신 size_type
+    크기로 바꿉니다.
+    
+    Args:
+        url: 목록 페이지의 썸네일 URL
+        size_type: 네이버 이미지 type 파라미터 (예: 'w647', None이면 그대로)
+    """
+    parts = urlsplit(url)
+    if not size_type or parts.hostname != PSTATIC_HOST:
+        return url
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name != 'type']
+    query.append(('type', size_type))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def image_size(data: bytes) -> Optional[Tuple[str, int, int]]:
+    """
+    이미지 헤더에서 형식과 크기 읽기 (PNG, GIF, JPEG, WebP)
+    
+    Returns:
+        (MIME 형식, 너비, 높이) 튜플 (알 수 없는 형식이면 None)
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        width, height = struct.unpack('>II', data[16:24])
+        return 'image/png', width, height
+    
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        width, height = struct.unpack('<HH', data[6:10])
+        return 'image/gif', width, height
+    
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return 'image/webp', width & 0x3fff, height & 0x3fff
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return 'image/webp', (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+        if chunk == b'VP8X':
+            return ('image/webp', int.from_bytes(data[24:27], 'little') + 1,
+                    int.from_bytes(data[27:30], 'little') + 1)
+        return None
+    
+    if data[:2] == b'\xff\xd8':
+        # SOF 마커(프레임 헤더)가 나올 때까지 세그먼트를 건너뜀
+        offset = 2
+        while offset + 9 <= len(data):
+            if data[offset] != 0xff:
+                return None
+            marker = data[offset + 1]
+            if marker == 0xff:
+                offset += 1
+                continue
+            if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+                offset += 2
+                continue
+            length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+            if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+                height, width = struct.unpack('>HH', data[offset + 5:offset + 9])
+                return 'image/jpeg', width, height
+            offset += 2 + length
+        return None
+    
+    return None
+
+
+class ThumbnailCache:
+    """바이트 예산을 가진 내용 주소 썸네일 캐시 클래스"""
+    
+    def __init__(self, directory: str, max_bytes: int = 8 * 1024 * 1024, memory_entries: int = 2048,
+                 transport: Optional[HttpTransport] = None, size_type: Optional[str] = 'w647',
+                 min_width: int = 200, max_image_bytes: int = 5 * 1024 * 1024, max_workers: int = 4):
+        """
+        Args:
+            directory: 캐시 디렉토리
+            max_bytes: 디스크 캐시 파일 전체 크기 상한 (바이트)
+            memory_entries: 메모리에 둘 URL 수
+            transport: HTTP 전송 객체 (기본값: 프로세스 공용 transport)
+            size_type: 네이버 이미지 type 파라미터 (None이면 목록 URL 그대로 사용)
+            min_width: 이보다 좁은 이미지는 쓰지 않음 (픽셀)
+            max_image_bytes: 이보다 큰 이미지는 쓰지 않음 (바이트)
+            max_workers: 동시에 확인할 이미지 수
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.transport = transport or get_transport()
+        self.size_type = size_type
+        self.min_width = min_width
+        self.max_image_bytes = max_image_bytes
+        self.max_workers = max_workers
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[str, Optional[ThumbnailInfo]]' = OrderedDict()
+        self._files: 'OrderedDict[Path, int]' = OrderedDict()
+        self.total_bytes = 0
+        self.counts = {'memory': 0, 'disk': 0, 'fetched': 0, 'rejected': 0, 'errors': 0}
+        
+        for name in ('objects', 'urls'):
+            (self.directory / name).mkdir(parents=True, exist_ok=True)
+        
+        # 마지막 사용 시각(mtime) 순서로 LRU 순서와 전체 크기 복원
+        entries = []
+        for path in self.directory.glob('*/*.json'):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._files[path] = size
+            self.total_bytes += size
+    
+    @classmethod
+    def from_env(cls, directory: str) -> 'ThumbnailCache':
+        """THUMBNAIL_* 환경 변수로 생성"""
+        return cls(
+            directory,
+            max_bytes=int(os.getenv('THUMBNAIL_CACHE_MAX_BYTES', 8 * 1024 * 1024)),
+            size_type=os.getenv('THUMBNAIL_SIZE_TYPE', 'w647') or None,
+            min_width=int(os.getenv('THUMBNAIL_MIN_WIDTH', 200))
+        )
+    
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / 'objects' / f"{digest}.json"
+    
+    def _url_path(self, url: str) -> Path:
+        return self.directory / 'urls' / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    
+    def _read(self, path: Path) -> Optional[dict]:
+        # 잠금을 잡은 상태에서 호출
+        if path not in self._files:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.total_bytes -= self._files.pop(path, 0)
+            return None
+        self._files.move_to_end(path)
+        return value
+    
+    def _write(self, path: Path, value: dict):
+        # 잠금을 잡은 상태에서 호출 (원자적 쓰기 후 예산 초과분 삭제)
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        self.total_bytes += len(data) - self._files.pop(path, 0)
+        self._files[path] = len(data)
+        while self.total_bytes > self.max_bytes and len(self._files) > 1:
+            old_path, size = self._files.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
+    
+    def _remember(self, url: str, info: Optional[ThumbnailInfo]):
+        # 잠금을 잡은 상태에서 호출
+        self._memory[url] = info
+        self._memory.move_to_end(url)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _count(self, name: str):
+        get_metrics().inc('thumbnail_lookup_total', result=name)
+        with self._lock:
+            self.counts[name] += 1
+    
+    def _lookup_cached(self, url: str) -> Tuple[bool, Optional[ThumbnailInfo]]:
+        """메모리 → 디스크 순으로 조회 ((찾았는지, 정보) 튜플)"""
+        with self._lock:
+            if url in self._memory:
+                self._memory.move_to_end(url)
+                found = (True, self._memory[url], 'memory')
+            else:
+                found = (False, None, None)
+                alias = self._read(self._url_path(url))
+                if alias is not None and alias.get('url') == url:
+                    if alias['digest'] is None:
+                        found = (True, None, 'disk')
+                    else:
+                        entry = self._read(self._object_path(alias['digest']))
+                        # 같은 이미지를 다른 URL로 처음 저장한 경우가 있으므로 URL은 요청한 값으로
+                        if entry is not None:
+                            found = (True, ThumbnailInfo(**{**entry, 'url': url}), 'disk')
+                if found[0]:
+                    self._remember(url, found[1])
+        
+        if found[0]:
+            self._count(found[2])
+        return found[0], found[1]
+    
+    def _validate(self, url: str) -> Optional[ThumbnailInfo]:
+        """
+        이미지를 받아 형식/크기 확인
+        
+        Returns:
+            썸네일 정보 (쓸 수 없는 이미지면 None)
+        
+        Raises:
+            requests.RequestException: 요청 실패 시 (캐시하지 않고 다음에 다시 시도)
+        """
+        with get_metrics().span('thumbnail_fetch'):
+            response = self.transport.get(url, headers=self.headers)
+        if response.status_code in (403, 404, 410):
+            return None
+        response.raise_for_status()
+        
+        content = response.content
+        if len(content) > self.max_image_bytes:
+            return None
+        found = image_size(content)
+        if found is None or found[1] < self.min_width or found[2] < 1:
+            return None
+        content_type, width, height = found
+        return ThumbnailInfo(url, hashlib.sha256(content).hexdigest(), content_type, width, height, len(content))
+    
+    def resolve(self, url: str) -> Optional[ThumbnailInfo]:
+        """
+        썸네일 URL 확인 (처음 보는 URL만 이미지를 받음)
+        
+        Args:
+            url: 목록 페이지의 썸네일 URL
+        
+        Returns:
+            썸네일 정보 (이미지가 아니거나 너무 작거나 받지 못하면 None)
+        """
+        if not url.startswith(('http://', 'https://')):
+            return None
+        url = canonical_url(url, self.size_type)
+        
+        found, info = self._lookup_cached(url)
+        if found:
+            return info
+        
+        try:
+            info = self._validate(url)
+        except requests.RequestException as e:
+            print(f"⚠️ 썸네일 요청 실패 ({url}): {e}")
+            self._count('errors')
+            return None
+        
+        self._count('fetched' if info is not None else 'rejected')
+        with self._lock:
+            if info is not None:
+                entry = asdict(info)
+                del entry['url']
+                self._write(self._object_path(info.digest), entry)
+            self._write(self._url_path(url), {'url': url, 'digest': info.digest if info else None})
+            self._remember(url, info)
+        return info
+    
+    def apply(self, news_list: List[Mapping]) -> List[Mapping]:
+        """
+        기사 썸네일을 확인한 URL로 바꾸고, 쓸 수 없는 썸네일은 빼기
+        
+        Args:
+            news_list: 기사 리스트 (dict 또는 Article)
+        
+        Returns:
+            입력 순서를 유지한 기사 리스트
+        """
+        urls = list(dict.fromkeys(news['thumbnail'] for news in news_list if news.get('thumbnail')))
+        if not urls:
+            return list(news_list)
+        
+        with get_metrics().span('thumbnails'):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                resolved: Dict[str, Optional[ThumbnailInfo]] = dict(zip(urls, pool.map(self.resolve, urls)))
+        
+        results = []
+        for news in news_list:
+            if not news.get('thumbnail'):
+                results.append(news)
+                continue
+            info = resolved[news['thumbnail']]
+            thumbnail = info.url if info is not None else None
+            if isinstance(news, Article):
+                results.append(news.replace(thumbnail=thumbnail))
+            elif thumbnail is not None:
+                results.append({**news, 'thumbnail': thumbnail})
+            else:
+                results.append({name: value for name, value in news.items() if name != 'thumbnail'})
+        return results
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        조회 통계와 디스크 사용량
+        
+        Returns:
+            {'memory', 'disk', 'fetched', 'rejected', 'errors', 'files', 'bytes'}
+        """
+        with self._lock:
+            return {**self.counts, 'files': len(self._files), 'bytes': self.total_bytes}
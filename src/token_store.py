@@ -0,0 +1,86 @@
+"""
+카카오 토큰 저장 모듈
+Access Token, 만료 시각, 갱신된 Refresh Token을 로컬 파일에 보관합니다.
+
+파일 쓰기는 임시 파일 + rename으로 원자적으로 처리하고, 여러 프로세스가
+동시에 갱신하지 않도록 잠금 파일(fcntl)을 사용합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class TokenStore:
+    """파일 기반 토큰 저장소 클래스"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 토큰 JSON 파일 경로
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + '.lock')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.RLock()
+    
+    @contextmanager
+    def locked(self):
+        """
+        프로세스/스레드 간 배타적 잠금
+        
+        잠금을 잡은 동안 load → 토큰 갱신 → save 순서로 사용합니다.
+        """
+        with self._thread_lock:
+            with open(self.lock_path, 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield self
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def load(self) -> Dict[str, Any]:
+        """
+        저장된 토큰 정보 읽기
+        
+        Returns:
+            토큰 정보 딕셔너리 (파일이 없거나 손상되었으면 빈 딕셔너리)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        return data if isinstance(data, dict) else {}
+    
+    def save(self, data: Dict[str, Any]):
+        """
+        토큰 정보 원자적 저장 (소유자만 읽을 수 있는 권한)
+        
+        Args:
+            data: 토큰 정보 딕셔너리
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
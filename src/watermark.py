@@ -0,0 +1,67 @@
+"""
+섹션별 수집 기준점(high-water mark) 저장 모듈
+섹션마다 마지막 실행에서 가장 최신이었던 기사를 기록하여, 다음 실행은
+그 기사까지만 목록 페이지를 넘기도록 합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class HighWaterMarkStore:
+    """JSON 파일 기반 섹션별 기준점 저장소 클래스"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 기준점 JSON 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._marks: Dict[str, dict] = {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._marks = json.load(f)
+        except (OSError, ValueError):
+            self._marks = {}
+    
+    @staticmethod
+    def section_key(sid1: str, sid2: Optional[str] = None) -> str:
+        """섹션 식별 문자열 ('sid1' 또는 'sid1/sid2')"""
+        return f"{sid1}/{sid2}" if sid2 else sid1
+    
+    def get(self, section: str) -> Optional[dict]:
+        """
+        섹션 기준점 조회
+        
+        Returns:
+            {'oid': 언론사 ID, 'aid': 기사 ID, 'date': 'YYYYMMDD'} (없으면 None)
+        """
+        with self._lock:
+            mark = self._marks.get(section)
+            return dict(mark) if mark else None
+    
+    def set(self, section: str, oid: int, aid: int, date: str):
+        """섹션 기준점 갱신 (save 호출 시 파일에 반영)"""
+        with self._lock:
+            self._marks[section] = {'oid': oid, 'aid': aid, 'date': date}
+    
+    def save(self):
+        """기준점 원자적 저장"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._marks, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise